@@ -8,7 +8,6 @@ to users via Telegram.
 This script is designed to run via cron or GitHub Actions on weekdays.
 """
 
-import asyncio
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -22,6 +21,7 @@ from stock_analyzer.deliverer import InsightDeliverer
 from stock_analyzer.fetcher import StockFetcher
 from stock_analyzer.llm_client import LLMClientFactory
 from stock_analyzer.logging import setup_logging, get_logger
+from stock_analyzer.runner import run_async
 from stock_analyzer.storage import Storage
 
 logger = get_logger(__name__)
@@ -97,11 +97,16 @@ async def main():
 
         # Run batch analysis (parallel=2 for reasonable throughput without rate limiting)
         logger.info(f"Analyzing {len(unique_symbols)} stocks...")
-        analysis_result = await analyzer.analyze_batch(
-            symbols=unique_symbols,
-            parallel=2,
-            continue_on_error=True
-        )
+        try:
+            analysis_result = await analyzer.analyze_batch(
+                symbols=unique_symbols,
+                parallel=2,
+                continue_on_error=True
+            )
+        finally:
+            # Release pooled HTTP connections; neither is used after analysis
+            await fetcher.close()
+            await LLMClientFactory.close_all()
 
         logger.info(
             f"Analysis complete: {analysis_result.success_count} success, "
@@ -122,13 +127,17 @@ async def main():
             delivery_success = 0
             delivery_failed = 0
 
+            # Fetch the latest insight of every successful stock in one query
+            latest_insights = storage.get_latest_insights([
+                result.stock_symbol
+                for result in analysis_result.results
+                if result.status == "success"
+            ])
+
             for result in analysis_result.results:
                 if result.status == "success":
-                    # Get the insight for this stock
-                    insights = storage.get_insights(result.stock_symbol, limit=1)
-                    if insights:
-                        insight = insights[0]
-
+                    insight = latest_insights.get(result.stock_symbol)
+                    if insight:
                         # Deliver to personal channel (not to subscribers)
                         delivery_result = await deliverer.deliver_to_channel(
                             insight=insight,
@@ -188,5 +197,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    exit_code = run_async(main())
     sys.exit(exit_code)
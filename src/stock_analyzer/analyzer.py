@@ -6,11 +6,14 @@ LLM-based analysis, and storage of insights.
 """
 
 import asyncio
-import re
+import functools
+import numbers
 import time
 from dataclasses import dataclass
 from datetime import date as date_type, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
 
 from stock_analyzer.exceptions import AnalysisError
 from stock_analyzer.fetcher import StockFetcher
@@ -62,6 +65,76 @@ Format your response with clear section headers using **bold** markdown.
 """
 
 
+def _match_header(line: str) -> Optional[Tuple[str, int]]:
+    """
+    Match a bold header at the start of a line, either '**Name:**' or '**Name**:'.
+
+    Uses plain string scans: the header name cannot contain '*', so the closing
+    '**' is the first '*' after the opening one.
+
+    Returns:
+        (header name, index just past the header), or None if the line does not start with one
+    """
+    start = len(line) - len(line.lstrip(" \t"))
+    if not line.startswith("**", start):
+        return None
+    close = line.find("*", start + 2)
+    inner = line[start + 2:close]
+    if close < 0 or not inner or "\n" in inner or not line.startswith("**", close):
+        return None
+    end = close + 3 if line.startswith(":", close + 2) else close + 2
+
+    # Name is the inner text without surrounding blanks and a trailing colon
+    name = inner.lstrip(" \t")
+    if not name:
+        return inner[-1], end
+    if name.endswith(":") and len(name) > 1:
+        name = name[:-1]
+    return name.rstrip(" \t"), end
+
+
+def _bullet_text(line: str) -> Optional[str]:
+    """
+    Return the text of a stripped bullet line, or None if it is not a bullet.
+
+    Matches "- text", "* text", "• text" and numbered "1. text" using plain
+    string checks rather than a regex.
+    """
+    if line[0] in "-*•":
+        text = line[1:]
+    else:
+        digits = 0
+        while digits < len(line) and line[digits].isdecimal():
+            digits += 1
+        if not digits or not line.startswith(".", digits):
+            return None
+        text = line[digits + 1:]
+    return text.strip() or None
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_markdown_sections(text: str) -> Dict[str, str]:
+    """
+    Split an LLM response into section bodies keyed by lower-cased header name.
+
+    Walks the lines once, so all sections of a response are found in a single
+    pass; the result is cached because the analyzer looks up several sections
+    of the same response. Only the first occurrence of a header is kept.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    sections: Dict[str, List[str]] = {}
+    current = None
+    for line in text.splitlines():
+        header = _match_header(line)
+        if header and not line[header[1]:].strip():
+            name = header[0].lower()
+            current = None if name in sections else sections.setdefault(name, [])
+        elif current is not None:
+            current.append(line)
+
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
 @dataclass
 class BatchAnalysisResult:
     """Result of batch analysis operation."""
@@ -279,38 +352,53 @@ class Analyzer:
                     if not continue_on_error:
                         break
         else:
-            # Parallel execution with semaphore
-            semaphore = asyncio.Semaphore(parallel)
-
-            async def analyze_with_semaphore(symbol: str):
-                """Analyze stock with semaphore for parallel execution limit."""
-                async with semaphore:
-                    try:
-                        await self.analyze_stock(symbol)
-                        return IndividualResult(
-                            stock_symbol=symbol,
-                            status="success"
-                        )
-                    except Exception as e:
-                        return IndividualResult(
-                            stock_symbol=symbol,
-                            status="error",
-                            error_message=str(e)
-                        )
-
-            # Run all analyses
+            async def analyze_one(symbol: str) -> IndividualResult:
+                """Analyze one stock, turning a failure into an error result."""
+                try:
+                    await self.analyze_stock(symbol)
+                    return IndividualResult(
+                        stock_symbol=symbol,
+                        status="success"
+                    )
+                except Exception as e:
+                    return IndividualResult(
+                        stock_symbol=symbol,
+                        status="error",
+                        error_message=str(e)
+                    )
+
             if continue_on_error:
+                # Parallel execution with semaphore
+                semaphore = asyncio.Semaphore(parallel)
+
+                async def analyze_with_semaphore(symbol: str) -> IndividualResult:
+                    """Analyze stock with semaphore for parallel execution limit."""
+                    async with semaphore:
+                        return await analyze_one(symbol)
+
                 results = await asyncio.gather(
                     *[analyze_with_semaphore(s) for s in symbols],
                     return_exceptions=False
                 )
             else:
-                # Stop on first error
-                for symbol in symbols:
-                    result = await analyze_with_semaphore(symbol)
-                    results.append(result)
-                    if result.status == "error":
-                        break
+                # Stop on first error: `parallel` workers take symbols in input order and
+                # stop picking up new ones once any analysis fails; in-flight ones finish
+                slots: List[Optional[IndividualResult]] = [None] * len(symbols)
+                pending = iter(enumerate(symbols))
+                failed = False
+
+                async def worker():
+                    """Take symbols off the shared iterator until none are left or one fails."""
+                    nonlocal failed
+                    for index, symbol in pending:
+                        slots[index] = result = await analyze_one(symbol)
+                        if result.status == "error":
+                            failed = True
+                        if failed:
+                            return
+
+                await asyncio.gather(*(worker() for _ in range(min(parallel, len(symbols)))))
+                results = [result for result in slots if result is not None]
 
         duration = time.time() - start_time
         success_count = sum(1 for r in results if r.status == "success")
@@ -335,16 +423,19 @@ class Analyzer:
         # Format price history
         if stock_data.historical_prices is not None and len(stock_data.historical_prices) > 0:
             recent_prices = stock_data.historical_prices.tail(5)
+            columns = recent_prices.columns
+            # Walk columns directly; iterrows builds a Series per row and upcasts dtypes
+            dates = recent_prices['Date'] if 'Date' in columns else recent_prices.index
+            volumes = (
+                recent_prices['Volume'] if 'Volume' in columns
+                else [None] * len(recent_prices)
+            )
             price_history_lines = []
-            for idx, row in recent_prices.iterrows():
-                date_str = row.get('Date', idx)
-                price_str = f"{row['Close']:.2f}"
-                volume = row.get('Volume')
-                if volume is not None and isinstance(volume, (int, float)):
-                    volume_str = f"{int(volume):,}"
-                    line = f"  {date_str}: ${price_str} (Volume: {volume_str})"
-                else:
-                    line = f"  {date_str}: ${price_str}"
+            for date_str, close, volume in zip(dates, recent_prices['Close'], volumes):
+                line = f"  {date_str}: ${close:.2f}"
+                # numbers.Real also matches numpy scalars; NaN volumes are skipped
+                if isinstance(volume, numbers.Real) and not pd.isna(volume):
+                    line += f" (Volume: {int(volume):,})"
                 price_history_lines.append(line)
             price_history = "\n".join(price_history_lines)
         else:
@@ -380,13 +471,10 @@ class Analyzer:
 
         # Fallback: keep full text (without leading markdown header) instead of truncating.
         if not summary:
-            summary = re.sub(
-                r'^\s*\*\*[^*\n]+?\*\*:?[ \t]*\n?',
-                "",
-                text.strip(),
-                count=1,
-                flags=re.IGNORECASE
-            ).strip()
+            summary = text.strip()
+            header = _match_header(summary)
+            if header:
+                summary = summary[header[1]:].strip()
 
         return summary, trend_analysis
 
@@ -402,26 +490,15 @@ class Analyzer:
             line = line.strip()
             if not line:
                 continue
-            # Match bullets: "- text", "* text", "• text"
-            bullet_match = re.match(r'^[-*•]\s*(.+)$', line)
-            if bullet_match:
-                bullets.append(bullet_match.group(1).strip())
-            # Match numbered bullets: "1. text"
-            elif re.match(r'^\d+\.\s*(.+)$', line):
-                bullet_match = re.match(r'^\d+\.\s*(.+)$', line)
-                bullets.append(bullet_match.group(1).strip())
+            bullet = _bullet_text(line)
+            if bullet:
+                bullets.append(bullet)
 
         return bullets
 
     def _extract_section_text(self, text: str, section_name: str) -> str:
         """Extract markdown section body supporting '**Header:**' and '**Header**:' formats."""
-        escaped_name = re.escape(section_name)
-        pattern = (
-            rf'(?ims)^[ \t]*(?:\*\*{escaped_name}:?\*\*|\*\*{escaped_name}\*\*:?)'
-            rf'[ \t]*\n(.+?)(?=^[ \t]*\*\*[^*\n]+?\*\*:?[ \t]*\n|\Z)'
-        )
-        match = re.search(pattern, text)
-        return match.group(1).strip() if match else ""
+        return _parse_markdown_sections(text).get(section_name.lower(), "")
 
     def _is_stale_cached_insight(self, insight: Insight) -> bool:
         """
@@ -433,13 +510,11 @@ class Analyzer:
         if not summary:
             return True
 
-        if re.match(r'^\*\*\s*summary\s*\*\*:?', summary, flags=re.IGNORECASE):
-            return True
-
         if len(summary) == 200 and not summary.endswith((".", "!", "?")):
             return True
 
-        return False
+        header = _match_header(summary)
+        return bool(header) and header[0].lower() == "summary"
 
     def _determine_confidence(self, stock_data: StockData, analysis_text: str) -> str:
         """
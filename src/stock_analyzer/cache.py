@@ -0,0 +1,94 @@
+"""
+In-process cache for fetched stock data.
+
+Entries expire after a TTL and the least recently used entry is evicted
+once the cache is full. Hit and miss counters are kept for monitoring.
+"""
+
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Optional, Tuple
+
+from stock_analyzer.models import StockData
+
+# Default time-to-live for cached stock data (24 hours)
+DEFAULT_TTL_SECONDS = 86400
+
+
+class StockCache:
+    """
+    LRU cache of StockData keyed by symbol and date range.
+
+    Cached StockData objects are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize stock cache.
+
+        Args:
+            maxsize: Maximum number of cached entries
+            ttl: Seconds an entry stays valid
+            clock: Monotonic time source in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, StockData]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(symbol: str, start_date: date, end_date: date) -> str:
+        """Build the cache key for a symbol and date range."""
+        return f"{symbol.upper()}:{start_date.isoformat()}:{end_date.isoformat()}"
+
+    def get(self, key: str) -> Optional[StockData]:
+        """
+        Get a cached entry.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached StockData, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None or self._clock() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, stock_data: StockData) -> None:
+        """
+        Cache an entry, evicting the least recently used one if full.
+
+        Args:
+            key: Cache key from make_key
+            stock_data: Data to cache
+        """
+        self._entries[key] = (self._clock() + self.ttl, stock_data)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
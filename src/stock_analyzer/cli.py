@@ -8,7 +8,7 @@ the daily analysis job.
 import json
 import sys
 from datetime import date as date_type
-from typing import List, Optional
+from typing import Awaitable, List, Optional
 
 from stock_analyzer.analyzer import Analyzer
 from stock_analyzer.config import Config
@@ -21,6 +21,7 @@ from stock_analyzer.exceptions import (
 from stock_analyzer.fetcher import StockFetcher
 from stock_analyzer.llm_client import LLMClientFactory
 from stock_analyzer.logging import setup_logging, get_logger
+from stock_analyzer.runner import run_async
 from stock_analyzer.storage import Storage
 
 logger = get_logger(__name__)
@@ -54,6 +55,9 @@ class CLI:
         self.storage = Storage(self.db_path)
         self.storage.init_database()
 
+        # Fetcher created here (not for an injected analyzer), closed by close()
+        self._fetcher: Optional[StockFetcher] = None
+
         if analyzer:
             self.analyzer = analyzer
         else:
@@ -63,15 +67,21 @@ class CLI:
                 api_key=self.config.llm_api_key,
                 model=self.config.llm_model,
             )
-            fetcher = StockFetcher(
+            self._fetcher = StockFetcher(
                 primary_provider="yfinance",
                 backup_provider="alpha_vantage",
                 api_key=self.config.stock_api_key,
             )
             self.analyzer = Analyzer(
-                llm_client=llm_client, fetcher=fetcher, storage=self.storage
+                llm_client=llm_client, fetcher=self._fetcher, storage=self.storage
             )
 
+    async def close(self) -> None:
+        """Release pooled HTTP connections held by the fetcher and cached LLM clients."""
+        if self._fetcher is not None:
+            await self._fetcher.close()
+        await LLMClientFactory.close_all()
+
     async def analyze(
         self,
         symbol: str,
@@ -633,33 +643,30 @@ class CLI:
             conn = self.storage._get_connection()
             cursor = conn.cursor()
 
-            # Total analyses
-            cursor.execute("SELECT COUNT(*) FROM stock_analyses")
-            total_analyses = cursor.fetchone()[0]
-
-            # Successful analyses
-            cursor.execute("SELECT COUNT(*) FROM stock_analyses WHERE analysis_status = 'success'")
-            successful_analyses = cursor.fetchone()[0]
-
-            # Total insights
-            cursor.execute("SELECT COUNT(*) FROM insights")
-            total_insights = cursor.fetchone()[0]
-
-            # Analyses in last 7 days
+            # Total, successful and last-7-days analyses in a single table scan
             seven_days_ago = (datetime.now() - timedelta(days=7)).date().isoformat()
             cursor.execute(
-                "SELECT COUNT(*) FROM stock_analyses WHERE analysis_date >= ?",
+                """
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN analysis_status = 'success' THEN 1 END),
+                       COUNT(CASE WHEN analysis_date >= ? THEN 1 END)
+                FROM stock_analyses
+                """,
                 (seven_days_ago,)
             )
-            recent_analyses = cursor.fetchone()[0]
+            total_analyses, successful_analyses, recent_analyses = cursor.fetchone()
 
-            # Total deliveries
-            cursor.execute("SELECT COUNT(*) FROM delivery_logs")
-            total_deliveries = cursor.fetchone()[0]
+            # Total insights
+            cursor.execute("SELECT COUNT(*) FROM insights")
+            total_insights = cursor.fetchone()[0]
 
-            # Successful deliveries
-            cursor.execute("SELECT COUNT(*) FROM delivery_logs WHERE delivery_status = 'success'")
-            successful_deliveries = cursor.fetchone()[0]
+            # Total and successful deliveries
+            cursor.execute("""
+                SELECT COUNT(*),
+                       COUNT(CASE WHEN delivery_status = 'success' THEN 1 END)
+                FROM delivery_logs
+            """)
+            total_deliveries, successful_deliveries = cursor.fetchone()
 
             # Recent jobs (last 10)
             cursor.execute("""
@@ -797,7 +804,6 @@ class CLI:
             Exit code (0=success, 1=error)
         """
         try:
-            import asyncio
             from stock_analyzer.deliverer import InsightDeliverer
 
             if not self.config.telegram_token:
@@ -930,7 +936,7 @@ class CLI:
 
                 return success_count, failure_count
 
-            success_count, failure_count = asyncio.run(deliver_all())
+            success_count, failure_count = run_async(deliver_all())
 
             if json_output:
                 print(json.dumps({
@@ -958,6 +964,14 @@ class CLI:
             return 1
 
 
+async def _run_command(cli: CLI, command: Awaitable[int]) -> int:
+    """Run an async CLI command, closing the CLI's connections when it finishes."""
+    try:
+        return await command
+    finally:
+        await cli.close()
+
+
 def main():
     """
     Main entry point for stock-analyzer CLI.
@@ -1067,18 +1081,16 @@ For more information, see: https://github.com/AlphaAgent
             return cli.init_db(json_output=args.json)
 
         elif args.command == "analyze":
-            import asyncio
-            return asyncio.run(
-                cli.analyze(args.symbol, force=args.force, json_output=args.json)
-            )
+            return run_async(_run_command(
+                cli, cli.analyze(args.symbol, force=args.force, json_output=args.json)
+            ))
 
         elif args.command == "analyze-batch":
-            import asyncio
-            return asyncio.run(cli.analyze_batch(
+            return run_async(_run_command(cli, cli.analyze_batch(
                 args.symbols,
                 parallel=args.parallel,
                 json_output=args.json
-            ))
+            )))
 
         elif args.command == "subscribe":
             return cli.subscribe(args.user_id, args.symbol, json_output=args.json)
@@ -1090,8 +1102,7 @@ For more information, see: https://github.com/AlphaAgent
             return cli.list_subscriptions(user_id=args.user_id, json_output=args.json)
 
         elif args.command == "validate":
-            import asyncio
-            return asyncio.run(cli.validate(args.symbol, json_output=args.json))
+            return run_async(_run_command(cli, cli.validate(args.symbol, json_output=args.json)))
 
         elif args.command == "history":
             from datetime import date as date_type
@@ -1107,11 +1118,10 @@ For more information, see: https://github.com/AlphaAgent
             )
 
         elif args.command == "run-daily-job":
-            import asyncio
-            return asyncio.run(cli.run_daily_job(
+            return run_async(_run_command(cli, cli.run_daily_job(
                 dry_run=args.dry_run,
                 json_output=args.json
-            ))
+            )))
 
         elif args.command == "stats":
             return cli.stats(json_output=args.json)
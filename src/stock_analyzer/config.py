@@ -4,6 +4,7 @@ Configuration management for stock analyzer.
 Loads configuration from environment variables, files, or programmatic settings.
 """
 
+import functools
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -11,8 +12,94 @@ from typing import Dict, Optional
 
 from dotenv import load_dotenv
 
+# Model used for each LLM provider when none is configured
+DEFAULT_LLM_MODELS = {
+    "anthropic": "claude-sonnet-4-5-20250929",
+    "openai": "gpt-4o",
+    "gemini": "gemini-2.5-pro",
+}
+
+# Every environment variable read by Config.from_env; their values key the parse cache
+_ENV_KEYS = (
+    "STOCK_ANALYZER_LLM_PROVIDER",
+    "ANTHROPIC_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "STOCK_ANALYZER_LLM_API_KEY",
+    "STOCK_ANALYZER_LLM_MODEL",
+    "STOCK_ANALYZER_STOCK_API_KEY",
+    "STOCK_ANALYZER_TELEGRAM_TOKEN",
+    "STOCK_ANALYZER_TELEGRAM_CHANNEL",
+    "STOCK_ANALYZER_STOCK_LIST",
+    "STOCK_ANALYZER_DB_PATH",
+    "STOCK_ANALYZER_USER_LIMIT",
+    "STOCK_ANALYZER_SYSTEM_LIMIT",
+    "STOCK_ANALYZER_ANALYSIS_TIMEOUT",
+    "STOCK_ANALYZER_LOG_LEVEL",
+    "STOCK_ANALYZER_MOCK_MODE",
+    "STOCK_ANALYZER_RETRY_MAX",
+    "STOCK_ANALYZER_DEBUG",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(env: tuple) -> Dict:
+    """
+    Parse Config keyword arguments from a snapshot of _ENV_KEYS values.
 
-@dataclass
+    Cached on the snapshot, so parsing reruns only when the environment changes.
+    Callers must not mutate the returned dict.
+    """
+    values = dict(zip(_ENV_KEYS, env))
+
+    def get(key: str, default: Optional[str] = None) -> Optional[str]:
+        value = values[key]
+        return default if value is None else value
+
+    # Determine LLM provider
+    provider = get("STOCK_ANALYZER_LLM_PROVIDER", "anthropic").lower()
+
+    # Get provider-specific API key
+    api_key = None
+    if provider == "anthropic":
+        api_key = get("ANTHROPIC_API_KEY")
+    elif provider == "openai":
+        api_key = get("OPENAI_API_KEY")
+    elif provider == "gemini":
+        api_key = get("GEMINI_API_KEY")
+
+    # Fallback to generic key
+    if not api_key:
+        api_key = get("STOCK_ANALYZER_LLM_API_KEY")
+
+    return dict(
+        # LLM configuration
+        llm_provider=provider,
+        llm_model=get("STOCK_ANALYZER_LLM_MODEL"),
+        llm_api_key=api_key,
+        # Stock data configuration
+        stock_api_key=get("STOCK_ANALYZER_STOCK_API_KEY"),
+        # Telegram configuration
+        telegram_token=get("STOCK_ANALYZER_TELEGRAM_TOKEN"),
+        telegram_channel=get("STOCK_ANALYZER_TELEGRAM_CHANNEL"),
+        # Personal stock list configuration
+        stock_list=get("STOCK_ANALYZER_STOCK_LIST"),
+        # Storage configuration
+        db_path=get("STOCK_ANALYZER_DB_PATH", "./data/stock_analyzer.db"),
+        # Limits (deprecated for personal use)
+        user_limit=int(get("STOCK_ANALYZER_USER_LIMIT", "10")),
+        system_limit=int(get("STOCK_ANALYZER_SYSTEM_LIMIT", "100")),
+        analysis_timeout=int(get("STOCK_ANALYZER_ANALYSIS_TIMEOUT", "60")),
+        # Logging
+        log_level=get("STOCK_ANALYZER_LOG_LEVEL", "INFO").upper(),
+        # Advanced
+        mock_mode=get("STOCK_ANALYZER_MOCK_MODE", "false").lower() == "true",
+        retry_max=int(get("STOCK_ANALYZER_RETRY_MAX", "3")),
+        debug=get("STOCK_ANALYZER_DEBUG", "false").lower() == "true",
+    )
+
+
+@dataclass(slots=True)
 class Config:
     """
     Configuration for stock analyzer system.
@@ -120,47 +207,8 @@ class Config:
         # Load .env file if it exists
         load_dotenv()
 
-        # Determine LLM provider
-        provider = os.getenv("STOCK_ANALYZER_LLM_PROVIDER", "anthropic").lower()
-
-        # Get provider-specific API key
-        api_key = None
-        if provider == "anthropic":
-            api_key = os.getenv("ANTHROPIC_API_KEY")
-        elif provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-        elif provider == "gemini":
-            api_key = os.getenv("GEMINI_API_KEY")
-
-        # Fallback to generic key
-        if not api_key:
-            api_key = os.getenv("STOCK_ANALYZER_LLM_API_KEY")
-
-        return cls(
-            # LLM configuration
-            llm_provider=provider,
-            llm_model=os.getenv("STOCK_ANALYZER_LLM_MODEL"),
-            llm_api_key=api_key,
-            # Stock data configuration
-            stock_api_key=os.getenv("STOCK_ANALYZER_STOCK_API_KEY"),
-            # Telegram configuration
-            telegram_token=os.getenv("STOCK_ANALYZER_TELEGRAM_TOKEN"),
-            telegram_channel=os.getenv("STOCK_ANALYZER_TELEGRAM_CHANNEL"),
-            # Personal stock list configuration
-            stock_list=os.getenv("STOCK_ANALYZER_STOCK_LIST"),
-            # Storage configuration
-            db_path=os.getenv("STOCK_ANALYZER_DB_PATH", "./data/stock_analyzer.db"),
-            # Limits (deprecated for personal use)
-            user_limit=int(os.getenv("STOCK_ANALYZER_USER_LIMIT", "10")),
-            system_limit=int(os.getenv("STOCK_ANALYZER_SYSTEM_LIMIT", "100")),
-            analysis_timeout=int(os.getenv("STOCK_ANALYZER_ANALYSIS_TIMEOUT", "60")),
-            # Logging
-            log_level=os.getenv("STOCK_ANALYZER_LOG_LEVEL", "INFO").upper(),
-            # Advanced
-            mock_mode=os.getenv("STOCK_ANALYZER_MOCK_MODE", "false").lower() == "true",
-            retry_max=int(os.getenv("STOCK_ANALYZER_RETRY_MAX", "3")),
-            debug=os.getenv("STOCK_ANALYZER_DEBUG", "false").lower() == "true",
-        )
+        env = tuple(os.environ.get(key) for key in _ENV_KEYS)
+        return cls(**_parse_env(env))
 
     @classmethod
     def from_file(cls, config_path: str) -> "Config":
@@ -231,7 +279,7 @@ class Config:
         Raises:
             ValueError: If configuration is invalid
         """
-        if self.llm_provider not in ["anthropic", "openai", "gemini"]:
+        if self.llm_provider not in self._LLM_CONFIG_BUILDERS:
             raise ValueError(
                 f"Invalid LLM provider: {self.llm_provider}. "
                 f"Must be 'anthropic', 'openai', or 'gemini'."
@@ -255,32 +303,44 @@ class Config:
         if self.analysis_timeout < 10:
             raise ValueError("Analysis timeout must be at least 10 seconds")
 
+    def _anthropic_llm_config(self) -> Dict:
+        return {
+            "api_key": self.llm_api_key,
+            "model": self.llm_model or DEFAULT_LLM_MODELS["anthropic"],
+            "enable_caching": self.anthropic_enable_caching,
+            "max_tokens": self.anthropic_max_tokens,
+        }
+
+    def _openai_llm_config(self) -> Dict:
+        return {
+            "api_key": self.llm_api_key,
+            "model": self.llm_model or DEFAULT_LLM_MODELS["openai"],
+            "temperature": self.openai_temperature,
+            "max_tokens": self.openai_max_tokens,
+        }
+
+    def _gemini_llm_config(self) -> Dict:
+        return {
+            "api_key": self.llm_api_key,
+            "model": self.llm_model or DEFAULT_LLM_MODELS["gemini"],
+            "temperature": self.gemini_temperature,
+            "max_output_tokens": self.gemini_max_output_tokens,
+        }
+
+    # Provider name -> builder for its LLM config (not a dataclass field: no annotation)
+    _LLM_CONFIG_BUILDERS = {
+        "anthropic": _anthropic_llm_config,
+        "openai": _openai_llm_config,
+        "gemini": _gemini_llm_config,
+    }
+
     def get_llm_config(self) -> Dict:
         """Get LLM provider-specific configuration."""
-        if self.llm_provider == "anthropic":
-            return {
-                "api_key": self.llm_api_key,
-                "model": self.llm_model or "claude-sonnet-4-5-20250929",
-                "enable_caching": self.anthropic_enable_caching,
-                "max_tokens": self.anthropic_max_tokens,
-            }
-        elif self.llm_provider == "openai":
-            return {
-                "api_key": self.llm_api_key,
-                "model": self.llm_model or "gpt-4o",
-                "temperature": self.openai_temperature,
-                "max_tokens": self.openai_max_tokens,
-            }
-        elif self.llm_provider == "gemini":
-            return {
-                "api_key": self.llm_api_key,
-                "model": self.llm_model or "gemini-2.5-pro",
-                "temperature": self.gemini_temperature,
-                "max_output_tokens": self.gemini_max_output_tokens,
-            }
-        else:
-            raise ValueError(f"Unknown LLM provider: {self.llm_provider}")
-
+        try:
+            builder = self._LLM_CONFIG_BUILDERS[self.llm_provider]
+        except KeyError:
+            raise ValueError(f"Unknown LLM provider: {self.llm_provider}") from None
+        return builder(self)
 
 import sys
 
@@ -5,18 +5,45 @@ Supports multiple delivery channels, with Telegram as the primary implementation
 """
 
 import asyncio
+import functools
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
-
-from telegram import Bot
-from telegram.error import TelegramError
+from datetime import date, datetime
+from typing import List, Optional, Tuple, Union
 
 from stock_analyzer.exceptions import DeliveryError
 from stock_analyzer.models import DeliveryLog, Insight
 from stock_analyzer.storage import Storage
 
+# telegram.Bot, imported when the first TelegramChannel is created so that
+# runs without Telegram delivery never load the telegram package
+Bot = None
+
+
+def _get_bot_cls():
+    """Return telegram.Bot, importing it on first use."""
+    global Bot
+    if Bot is None:
+        from telegram import Bot as telegram_bot
+        Bot = telegram_bot
+    return Bot
+
+
+# Live Bot instances keyed by (Bot class, token); channels for the same token share one
+# Bot and its HTTP connection pool. Entries drop once no channel references the Bot.
+_BOT_CACHE: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+
+def _get_bot(token: str):
+    """Return the live Bot for a token, creating it if no channel holds one."""
+    bot_cls = _get_bot_cls()
+    key = (bot_cls, token)
+    bot = _BOT_CACHE.get(key)
+    if bot is None:
+        bot = _BOT_CACHE[key] = bot_cls(token=token)
+    return bot
+
 
 @dataclass
 class DeliveryResult:
@@ -28,6 +55,91 @@ class DeliveryResult:
     error_message: Optional[str] = None
 
 
+@dataclass
+class BatchDeliveryResult:
+    """Result of a batch delivery operation."""
+    total: int
+    success_count: int
+    failure_count: int
+    results: List[DeliveryResult]
+
+
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
+# Confidence indicator per confidence level
+_CONFIDENCE_EMOJI = {
+    "high": "🟢",
+    "medium": "🟡",
+    "low": "🔴"
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_chat_id(user_id: str) -> Union[int, str]:
+    """
+    Convert a channel identifier to the chat_id Telegram expects.
+
+    Numeric IDs (including negative channel IDs) become ints; usernames like
+    @channel are returned as-is. Cached, since the same few channels are sent to repeatedly.
+    """
+    if user_id.isdigit() or (user_id.startswith('-') and user_id[1:].isdigit()):
+        return int(user_id)
+    return user_id
+
+
+@functools.lru_cache(maxsize=256)
+def _format_telegram_message(
+    stock_symbol: str,
+    analysis_date: date,
+    confidence_level: str,
+    summary: str,
+    trend_analysis: Optional[str],
+    risk_factors: Tuple[str, ...],
+    opportunities: Tuple[str, ...],
+) -> str:
+    """
+    Build the Markdown Telegram message for an insight's fields.
+
+    Cached on the field values, so an insight delivered to several users is formatted once.
+    """
+    # Header, date, confidence and summary heading
+    head = (
+        f"📊 *{stock_symbol}* Stock Analysis\n"
+        f"📅 {analysis_date.strftime('%B %d, %Y')}\n"
+        f"{_CONFIDENCE_EMOJI.get(confidence_level, '⚪')} "
+        f"Confidence: {confidence_level.upper()}\n\n"
+        "*Summary:*\n"
+    )
+
+    # Summary; when it alone overflows the limit nothing after it survives truncation
+    summary_budget = TELEGRAM_MAX_MESSAGE_LENGTH - 3 - len(head)
+    if len(summary) > summary_budget:
+        return head + summary[:summary_budget] + "..."
+
+    parts = [head, summary]
+
+    # Trend analysis (if available)
+    if trend_analysis:
+        parts += ["\n\n*Trend Analysis:*\n", trend_analysis]
+
+    # Risk factors and opportunities as bullet lists
+    if risk_factors:
+        parts += ["\n\n*⚠️ Risk Factors:*\n• ", "\n• ".join(risk_factors)]
+    if opportunities:
+        parts += ["\n\n*💡 Opportunities:*\n• ", "\n• ".join(opportunities)]
+
+    # Footer
+    parts.append("\n\n_Analysis generated by AlphaAgent_")
+    message = "".join(parts)
+
+    # Telegram has a 4096 character limit
+    if len(message) > TELEGRAM_MAX_MESSAGE_LENGTH:
+        message = message[:TELEGRAM_MAX_MESSAGE_LENGTH - 3] + "..."
+
+    return message
+
+
 class DeliveryChannel(ABC):
     """Abstract base class for delivery channels."""
 
@@ -73,7 +185,7 @@ class TelegramChannel(DeliveryChannel):
             token: Telegram bot token
             parse_mode: Message parse mode (Markdown or HTML)
         """
-        self.bot = Bot(token=token)
+        self.bot = _get_bot(token)
         self.parse_mode = parse_mode
 
     async def send(self, user_id: str, message: str) -> bool:
@@ -94,12 +206,11 @@ class TelegramChannel(DeliveryChannel):
         Raises:
             DeliveryError: If sending fails (invalid ID, permissions, network error)
         """
-        try:
-            # Convert user_id to int if it's numeric, otherwise use as-is
-            chat_id = int(user_id) if user_id.isdigit() or (user_id.startswith('-') and user_id[1:].isdigit()) else user_id
+        from telegram.error import TelegramError
 
+        try:
             await self.bot.send_message(
-                chat_id=chat_id,
+                chat_id=_resolve_chat_id(user_id),
                 text=message,
                 parse_mode=self.parse_mode
             )
@@ -128,51 +239,15 @@ class TelegramChannel(DeliveryChannel):
         Returns:
             Markdown-formatted message
         """
-        # Build message parts
-        header = f"📊 *{insight.stock_symbol}* Stock Analysis"
-        date_str = f"📅 {insight.analysis_date.strftime('%B %d, %Y')}"
-
-        # Confidence indicator
-        confidence_emoji = {
-            "high": "🟢",
-            "medium": "🟡",
-            "low": "🔴"
-        }
-        confidence = f"{confidence_emoji.get(insight.confidence_level, '⚪')} Confidence: {insight.confidence_level.upper()}"
-
-        # Summary
-        summary = f"*Summary:*\n{insight.summary}"
-
-        # Trend analysis (if available)
-        trend = ""
-        if insight.trend_analysis:
-            trend = f"\n\n*Trend Analysis:*\n{insight.trend_analysis}"
-
-        # Risk factors
-        risks = ""
-        if insight.risk_factors:
-            risks = "\n\n*⚠️ Risk Factors:*"
-            for risk in insight.risk_factors:
-                risks += f"\n• {risk}"
-
-        # Opportunities
-        opportunities = ""
-        if insight.opportunities:
-            opportunities = "\n\n*💡 Opportunities:*"
-            for opp in insight.opportunities:
-                opportunities += f"\n• {opp}"
-
-        # Footer
-        footer = f"\n\n_Analysis generated by AlphaAgent_"
-
-        # Combine all parts
-        message = f"{header}\n{date_str}\n{confidence}\n\n{summary}{trend}{risks}{opportunities}{footer}"
-
-        # Telegram has a 4096 character limit
-        if len(message) > 4096:
-            message = message[:4093] + "..."
-
-        return message
+        return _format_telegram_message(
+            insight.stock_symbol,
+            insight.analysis_date,
+            insight.confidence_level,
+            insight.summary,
+            insight.trend_analysis,
+            tuple(insight.risk_factors or ()),
+            tuple(insight.opportunities or ()),
+        )
 
 
 class InsightDeliverer:
@@ -235,12 +310,120 @@ class InsightDeliverer:
             )
 
         delivery_channel = self.channels[channel]
+        message = delivery_channel.format_insight(insight)
+        return await self._send_formatted(insight, message, user_id, channel)
+
+    async def deliver_batch(
+        self,
+        insights: List[Insight],
+        user_ids: List[str],
+        channel: str = "telegram",
+        parallel: int = 1
+    ) -> BatchDeliveryResult:
+        """
+        Deliver every insight to every user, running up to `parallel` sends at once.
+
+        Each insight is formatted once and the message reused for all users. Delivery
+        logs are written in a single transaction once every send has finished.
+
+        Args:
+            insights: Insights to deliver
+            user_ids: Channel identifiers (usernames or numeric IDs)
+            channel: Delivery channel name (default: telegram)
+            parallel: Maximum number of concurrent sends
+
+        Returns:
+            BatchDeliveryResult with one DeliveryResult per (insight, user) pair
 
+        Raises:
+            DeliveryError: If channel not found
+        """
+        if channel not in self.channels:
+            raise DeliveryError(
+                user_id=",".join(user_ids),
+                reason=f"Channel '{channel}' not configured",
+                channel=channel
+            )
+
+        delivery_channel = self.channels[channel]
+        messages = [(insight, delivery_channel.format_insight(insight)) for insight in insights]
+        deliveries = [
+            (insight, message, user_id)
+            for insight, message in messages
+            for user_id in user_ids
+        ]
+        results: List[Optional[DeliveryResult]] = [None] * len(deliveries)
+        pending = iter(enumerate(deliveries))
+
+        async def send_one(insight: Insight, message: str, user_id: str) -> DeliveryResult:
+            """Send one message, turning unexpected errors into a failed result."""
+            try:
+                return await self._send_formatted(insight, message, user_id, channel, sink=logs)
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+                self._log_delivery(
+                    insight_id=insight.id,
+                    channel_id=user_id,
+                    channel=channel,
+                    status="failed",
+                    error_message=error_msg,
+                    sink=logs
+                )
+                return DeliveryResult(
+                    insight_id=insight.id,
+                    channel_id=user_id,
+                    channel=channel,
+                    status="failed",
+                    error_message=error_msg
+                )
+
+        async def worker():
+            """Take deliveries off the shared iterator until none are left."""
+            for index, (insight, message, user_id) in pending:
+                results[index] = await send_one(insight, message, user_id)
+
+        logs: List[DeliveryLog] = []
         try:
-            # Format message
-            message = delivery_channel.format_insight(insight)
+            # A fixed pool of `parallel` workers bounds concurrency without a task per delivery
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(max(parallel, 1), len(deliveries))):
+                    group.create_task(worker())
+        finally:
+            if logs:
+                self.storage.save_delivery_logs(logs)
+
+        success_count = sum(1 for r in results if r.status == "success")
+        return BatchDeliveryResult(
+            total=len(results),
+            success_count=success_count,
+            failure_count=len(results) - success_count,
+            results=results
+        )
 
-            # Send message
+    async def _send_formatted(
+        self,
+        insight: Insight,
+        message: str,
+        user_id: str,
+        channel: str,
+        sink: Optional[List[DeliveryLog]] = None
+    ) -> DeliveryResult:
+        """
+        Send an already formatted insight message and log the outcome.
+
+        Args:
+            insight: Insight the message was formatted from
+            message: Formatted message
+            user_id: Channel identifier (username or numeric ID)
+            channel: Configured delivery channel name
+            sink: List to queue the delivery log on instead of saving it
+
+        Returns:
+            DeliveryResult with status
+        """
+        delivery_channel = self.channels[channel]
+
+        try:
             await delivery_channel.send(user_id, message)
 
             # Log successful delivery (user_id treated as channel_id for personal use)
@@ -248,7 +431,8 @@ class InsightDeliverer:
                 insight_id=insight.id,
                 channel_id=user_id,
                 channel=channel,
-                status="success"
+                status="success",
+                sink=sink
             )
 
             return DeliveryResult(
@@ -265,7 +449,8 @@ class InsightDeliverer:
                 channel_id=user_id,
                 channel=channel,
                 status="failed",
-                error_message=str(e)
+                error_message=str(e),
+                sink=sink
             )
 
             return DeliveryResult(
@@ -282,10 +467,11 @@ class InsightDeliverer:
         channel_id: str,
         channel: str,
         status: str,
-        error_message: Optional[str] = None
+        error_message: Optional[str] = None,
+        sink: Optional[List[DeliveryLog]] = None
     ):
         """
-        Log delivery to storage (personal use).
+        Log delivery to storage (personal use), or queue it on `sink` if given.
 
         Args:
             insight_id: Insight ID that was delivered
@@ -293,6 +479,7 @@ class InsightDeliverer:
             channel: Delivery channel used
             status: Delivery status ("success" or "failed")
             error_message: Error message if failed
+            sink: List to append the log to, for the caller to save in one batch
         """
         log = DeliveryLog(
             insight_id=insight_id,
@@ -302,7 +489,10 @@ class InsightDeliverer:
             error_message=error_message,
             delivered_at=datetime.utcnow()
         )
-        self.storage.save_delivery_log(log)
+        if sink is not None:
+            sink.append(log)
+        else:
+            self.storage.save_delivery_log(log)
 
     async def deliver_to_channel(
         self,
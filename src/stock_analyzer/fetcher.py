@@ -5,24 +5,163 @@ Primary provider: yfinance (free, reliable)
 Backup provider: Alpha Vantage (requires API key, 25 calls/day free)
 """
 
+import asyncio
+import functools
+import string
 import time
+from collections import deque
 from datetime import date, datetime, timedelta
-from typing import Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import aiohttp
+import numpy as np
 import pandas as pd
 import yfinance as yf
-import requests
 
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # older yfinance releases
+    YFRateLimitError = None
+
+from stock_analyzer.cache import StockCache
 from stock_analyzer.exceptions import (
     DataFetchError,
     InvalidSymbolError,
     RateLimitError,
 )
-from stock_analyzer.logging import get_logger, log_api_call, log_api_response, log_api_error
+from stock_analyzer.logging import get_logger, log_api_call, log_api_error, log_api_response
 from stock_analyzer.models import StockData
+from stock_analyzer.retry import calculate_backoff
 
 logger = get_logger(__name__)
 
+# Maximum number of symbols per yfinance batch download
+YFINANCE_BATCH_SIZE = 20
+
+
+ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+ALPHA_VANTAGE_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Provider request quotas as (max_calls, period_seconds)
+PROVIDER_RATE_LIMITS = {
+    "yfinance": (2000, 3600),
+    "alpha_vantage": (25, 86400),  # Free tier
+}
+
+# Characters that can appear in a Yahoo symbol (e.g. BRK-B, 7203.T, EURUSD=X, ^GSPC)
+_SYMBOL_CHARS = frozenset(string.ascii_uppercase + string.digits + ".-=^")
+MAX_SYMBOL_LENGTH = 15
+
+# Price columns are float64 by default. With compact_prices=True they are
+# stored as float32, which keeps only ~7 significant digits (cents below ~100k)
+PRICE_COLUMNS = ("Open", "High", "Low", "Close")
+COMPACT_PRICE_DTYPE = "float32"
+
+# Record layout for Alpha Vantage daily rows
+_AV_ROW_DTYPE = np.dtype([(c, "float64") for c in PRICE_COLUMNS] + [("Volume", "int64")])
+
+# Fundamentals fields and the yfinance info keys they are read from
+_YF_FUNDAMENTAL_KEYS = (
+    ("market_cap", "marketCap"),
+    ("pe_ratio", "trailingPE"),
+    ("forward_pe", "forwardPE"),
+    ("dividend_yield", "dividendYield"),
+    ("beta", "beta"),
+    ("52week_high", "fiftyTwoWeekHigh"),
+    ("52week_low", "fiftyTwoWeekLow"),
+    ("sector", "sector"),
+    ("industry", "industry"),
+)
+
+_RATE_LIMIT_ERRORS = (RateLimitError,) + ((YFRateLimitError,) if YFRateLimitError else ())
+
+
+async def _run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking provider call in the default executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Check whether an error signals provider throttling."""
+    if isinstance(error, _RATE_LIMIT_ERRORS):
+        return True
+    return isinstance(error, aiohttp.ClientResponseError) and error.status == 429
+
+
+def _is_plausible_symbol(symbol: str) -> bool:
+    """Check that a symbol has the shape of a ticker before asking a provider."""
+    return (
+        isinstance(symbol, str)
+        and 0 < len(symbol) <= MAX_SYMBOL_LENGTH
+        and _SYMBOL_CHARS.issuperset(symbol.upper())
+    )
+
+
+def _compact_history(history: pd.DataFrame) -> pd.DataFrame:
+    """Downcast the price columns of an OHLCV frame to COMPACT_PRICE_DTYPE."""
+    return history.astype(
+        {c: COMPACT_PRICE_DTYPE for c in PRICE_COLUMNS if c in history.columns}
+    )
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter allowing at most max_calls per period seconds.
+
+    Callers wait for a free slot, unless the wait would exceed max_wait, in
+    which case RateLimitError is raised instead of holding the caller.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        max_calls: int,
+        period: float,
+        max_wait: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            provider: Provider name reported in RateLimitError
+            max_calls: Maximum calls allowed within one period
+            period: Window length in seconds
+            max_wait: Longest time to wait for a slot before giving up
+            clock: Monotonic time source in seconds
+        """
+        self.provider = provider
+        self.max_calls = max_calls
+        self.period = period
+        self.max_wait = max_wait
+        self._clock = clock
+        self._calls: deque = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot and record a call.
+
+        Raises:
+            RateLimitError: Next slot frees up later than max_wait from now
+        """
+        async with self._lock:
+            while True:
+                now = self._clock()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+
+                if len(self._calls) < self.max_calls:
+                    self._calls.append(now)
+                    return
+
+                wait = self.period - (now - self._calls[0])
+                if wait > self.max_wait:
+                    raise RateLimitError(self.provider, retry_after=int(wait) + 1)
+                await asyncio.sleep(wait)
+
 
 class StockFetcher:
     """
@@ -30,6 +169,12 @@ class StockFetcher:
 
     Fetches stock data from yfinance (primary) with automatic fallback
     to Alpha Vantage if primary fails.
+
+    HTTP connections are pooled in one session per fetcher; use it as an
+    async context manager (or call close()) to release them:
+
+        async with StockFetcher(api_key=key) as fetcher:
+            stock_data = await fetcher.fetch_stock_data("AAPL")
     """
 
     def __init__(
@@ -37,6 +182,11 @@ class StockFetcher:
         primary_provider: str = "yfinance",
         backup_provider: Optional[str] = "alpha_vantage",
         api_key: Optional[str] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        cache: Optional[StockCache] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        compact_prices: bool = False,
     ):
         """
         Initialize stock fetcher.
@@ -45,10 +195,49 @@ class StockFetcher:
             primary_provider: Primary data provider ("yfinance" or "alpha_vantage")
             backup_provider: Backup provider for fallback (None to disable)
             api_key: API key for Alpha Vantage (required if using it)
+            max_retries: Retries after a throttled provider response
+            backoff_base: Base delay in seconds for exponential backoff
+            cache: Optional cache for fetched data (None to always fetch)
+            session: HTTP session to use; by default the fetcher creates and
+                owns one on first use
+            compact_prices: Store historical price columns as float32 to halve
+                their memory, at the cost of precision on high-priced symbols
         """
         self.primary_provider = primary_provider
         self.backup_provider = backup_provider
         self.api_key = api_key
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.cache = cache
+        self.compact_prices = compact_prices
+        self._session = session
+        self._owns_session = session is None
+        self._limiters = {
+            provider: RateLimiter(provider, max_calls, period)
+            for provider, (max_calls, period) in PROVIDER_RATE_LIMITS.items()
+        }
+
+    async def __aenter__(self) -> "StockFetcher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP session if this fetcher created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=128, limit_per_host=64, ttl_dns_cache=300),
+                timeout=ALPHA_VANTAGE_TIMEOUT,
+            )
+            self._owns_session = True
+        return self._session
 
     async def fetch_stock_data(
         self,
@@ -60,6 +249,7 @@ class StockFetcher:
         Fetch stock data for a symbol.
 
         Tries primary provider first, falls back to backup if primary fails.
+        Results are served from and stored in the cache when one is configured.
 
         Args:
             symbol: Stock ticker symbol (e.g., "AAPL")
@@ -89,6 +279,22 @@ class StockFetcher:
         if start_date is None:
             start_date = end_date - timedelta(days=30)
 
+        if self.cache is None:
+            return await self._fetch_uncached(symbol, start_date, end_date)
+
+        cache_key = StockCache.make_key(symbol, start_date, end_date)
+        stock_data = self.cache.get(cache_key)
+        if stock_data is None:
+            stock_data = await self._fetch_uncached(symbol, start_date, end_date)
+            self.cache.set(cache_key, stock_data)
+        else:
+            logger.debug(f"Cache hit for {symbol}")
+        return stock_data
+
+    async def _fetch_uncached(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> StockData:
+        """Fetch from the primary provider, falling back to the backup."""
         # Try primary provider
         logger.debug(f"Fetching data for {symbol} from {self.primary_provider}")
         try:
@@ -126,6 +332,151 @@ class StockFetcher:
             # No backup provider available
             raise DataFetchError(symbol, str(e), self.primary_provider)
 
+    async def fetch_many(
+        self,
+        symbols: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_concurrency: int = 16,
+    ) -> Dict[str, StockData]:
+        """
+        Fetch stock data for several symbols, downloading yfinance history in batches.
+
+        Price history for up to YFINANCE_BATCH_SIZE symbols is fetched with one
+        yfinance download call instead of one history request per symbol. yfinance
+        has no batch endpoint for ticker info, so those lookups run concurrently,
+        at most max_concurrency at once. Symbols whose batched fetch fails are
+        retried through fetch_stock_data, so the backup provider still applies
+        to them.
+
+        Args:
+            symbols: Stock ticker symbols
+            start_date: Start date for historical data (default: 30 days ago)
+            end_date: End date for historical data (default: today)
+            max_concurrency: Maximum number of concurrent info lookups
+
+        Returns:
+            Dict mapping upper-cased symbol to StockData; symbols that could not
+            be fetched from any provider are omitted
+
+        Raises:
+            ValueError: Invalid date range
+        """
+        # Validate date range
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("Start date must be before or equal to end date")
+
+        # Set default dates
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=30)
+
+        results: Dict[str, StockData] = {}
+        retry = [s for s in symbols if not s or not isinstance(s, str)]
+        batchable = [s for s in symbols if s and isinstance(s, str)]
+        if self.cache is not None:
+            for symbol in batchable:
+                cached = self.cache.get(StockCache.make_key(symbol, start_date, end_date))
+                if cached is not None:
+                    results[symbol.upper()] = cached
+            batchable = [s for s in batchable if s.upper() not in results]
+        if self.primary_provider != "yfinance":
+            retry, batchable = retry + batchable, []
+
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def build_one(symbol: str, histories: pd.DataFrame) -> StockData:
+            # Symbols yfinance could not download have no column group
+            history = histories[symbol]
+            async with semaphore:
+                info = await self._call_provider("yfinance", getattr, yf.Ticker(symbol), "info")
+            if not info or len(info) < 5:
+                raise InvalidSymbolError(symbol, "Symbol not found or has no data")
+            return self._build_yfinance_stock_data(symbol, info, history.dropna(how="all"))
+
+        for i in range(0, len(batchable), YFINANCE_BATCH_SIZE):
+            chunk = batchable[i:i + YFINANCE_BATCH_SIZE]
+            start_time = time.time()
+            log_api_call(logger, "yfinance", "download", symbols=",".join(chunk))
+
+            try:
+                histories = await self._call_provider(
+                    "yfinance",
+                    yf.download,
+                    chunk,
+                    start=start_date.isoformat(),
+                    end=(end_date + timedelta(days=1)).isoformat(),  # Include end date
+                    group_by="ticker",
+                    progress=False,
+                )
+            except Exception as e:
+                log_api_error(logger, "yfinance", e)
+                retry.extend(chunk)
+                continue
+
+            log_api_response(logger, "yfinance", "success", time.time() - start_time)
+
+            built = await asyncio.gather(
+                *(build_one(symbol, histories) for symbol in chunk),
+                return_exceptions=True,
+            )
+            for symbol, stock_data in zip(chunk, built):
+                if isinstance(stock_data, Exception):
+                    logger.debug(
+                        f"Batched fetch failed for {symbol}, retrying individually: {stock_data}"
+                    )
+                    retry.append(symbol)
+                    continue
+                results[stock_data.symbol] = stock_data
+                if self.cache is not None:
+                    self.cache.set(StockCache.make_key(symbol, start_date, end_date), stock_data)
+
+        fetched = await self.fetch_stock_data_many(
+            retry, start_date=start_date, end_date=end_date
+        )
+        for symbol, stock_data in zip(retry, fetched):
+            if isinstance(stock_data, Exception):
+                logger.warning(f"Failed to fetch {symbol}: {stock_data}")
+            else:
+                results[stock_data.symbol] = stock_data
+
+        return results
+
+    async def fetch_stock_data_many(
+        self,
+        symbols: List[str],
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_concurrency: int = 16,
+    ) -> List[Union[StockData, Exception]]:
+        """
+        Fetch stock data for several symbols concurrently.
+
+        Each symbol goes through fetch_stock_data; at most max_concurrency
+        fetches are in flight at once so providers are not flooded.
+
+        Args:
+            symbols: Stock ticker symbols
+            start_date: Start date for historical data (default: 30 days ago)
+            end_date: End date for historical data (default: today)
+            max_concurrency: Maximum number of concurrent fetches
+
+        Returns:
+            One entry per symbol, in order: StockData on success or the
+            exception raised for that symbol
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+        async def fetch_one(symbol: str) -> StockData:
+            async with semaphore:
+                return await self.fetch_stock_data(symbol, start_date, end_date)
+
+        return await asyncio.gather(
+            *(fetch_one(symbol) for symbol in symbols), return_exceptions=True
+        )
+
     async def validate_symbol(self, symbol: str) -> bool:
         """
         Validate if a stock symbol exists and has recent trading data.
@@ -136,16 +487,20 @@ class StockFetcher:
         Returns:
             True if symbol is valid and has recent data, False otherwise
         """
+        # Reject malformed symbols without a network round trip
+        if not _is_plausible_symbol(symbol):
+            return False
+
         try:
             ticker = yf.Ticker(symbol)
-            info = ticker.info
+            info = await self._call_provider("yfinance", getattr, ticker, "info")
 
             # Check if symbol has basic info
             if not info or len(info) < 5:
                 return False
 
             # Check if symbol has recent trading data
-            history = ticker.history(period="5d")
+            history = await self._call_provider("yfinance", ticker.history, period="5d")
             if history.empty:
                 return False
 
@@ -154,6 +509,44 @@ class StockFetcher:
         except Exception:
             return False
 
+    async def _call_provider(
+        self, provider: str, func: Callable[..., Any], *args, **kwargs
+    ) -> Any:
+        """
+        Run a provider request under its rate limiter.
+
+        Throttled responses are retried with exponential backoff and jitter,
+        up to max_retries times. Throttling that will not clear within the
+        limiter's max_wait (such as an exhausted daily quota) is raised
+        immediately, since retrying would only spend more of the quota.
+
+        Args:
+            provider: Provider name keying the rate limiter
+            func: Coroutine function or blocking callable performing the request
+
+        Returns:
+            Result of func
+
+        Raises:
+            RateLimitError: Quota exhausted or still throttled after retries
+        """
+        limiter = self._limiters[provider]
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    return await func(*args, **kwargs)
+                return await _run_blocking(func, *args, **kwargs)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == self.max_retries:
+                    raise
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None and retry_after > limiter.max_wait:
+                    raise
+                delay = calculate_backoff(attempt, base_delay=self.backoff_base)
+                logger.warning(f"{provider} throttled, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
     async def _fetch_from_yfinance(
         self, symbol: str, start_date: date, end_date: date
     ) -> StockData:
@@ -179,65 +572,27 @@ class StockFetcher:
             ticker = yf.Ticker(symbol)
 
             # Get current info
-            info = ticker.info
+            info = await self._call_provider("yfinance", getattr, ticker, "info")
 
             # Validate that we got real data (not just empty dict)
             if not info or len(info) < 5:
                 raise InvalidSymbolError(symbol, "Symbol not found or has no data")
 
             # Get historical data
-            history = ticker.history(
+            history = await self._call_provider(
+                "yfinance",
+                ticker.history,
                 start=start_date.isoformat(),
                 end=(end_date + timedelta(days=1)).isoformat(),  # Include end date
             )
 
-            if history.empty:
-                raise InvalidSymbolError(
-                    symbol, "No historical data available (possibly delisted)"
-                )
-
-            # Extract current price data
-            current_price = info.get("regularMarketPrice") or info.get("currentPrice")
-            if current_price is None and not history.empty:
-                # Use last close price if current price not available
-                current_price = float(history['Close'].iloc[-1])
-
-            price_change_percent = info.get("regularMarketChangePercent", 0.0)
-            volume = info.get("regularMarketVolume") or info.get("volume", 0)
-
-            # Extract fundamentals
-            fundamentals = {
-                "market_cap": info.get("marketCap"),
-                "pe_ratio": info.get("trailingPE"),
-                "forward_pe": info.get("forwardPE"),
-                "dividend_yield": info.get("dividendYield"),
-                "beta": info.get("beta"),
-                "52week_high": info.get("fiftyTwoWeekHigh"),
-                "52week_low": info.get("fiftyTwoWeekLow"),
-                "sector": info.get("sector"),
-                "industry": info.get("industry"),
-            }
-
-            # Remove None values
-            fundamentals = {k: v for k, v in fundamentals.items() if v is not None}
+            stock_data = self._build_yfinance_stock_data(symbol, info, history)
 
             duration = time.time() - start_time
             log_api_response(logger, "yfinance", "success", duration)
             logger.debug(f"Fetched {len(history)} data points for {symbol} from yfinance")
 
-            return StockData(
-                symbol=symbol.upper(),
-                current_price=float(current_price),
-                price_change_percent=float(price_change_percent),
-                volume=int(volume),
-                historical_prices=history,
-                fundamentals=fundamentals,
-                metadata={
-                    "source": "yfinance",
-                    "fetch_time": datetime.utcnow().isoformat(),
-                    "data_points": len(history),
-                },
-            )
+            return stock_data
 
         except InvalidSymbolError as e:
             log_api_error(logger, "yfinance", e)
@@ -246,6 +601,68 @@ class StockFetcher:
             log_api_error(logger, "yfinance", e)
             raise DataFetchError(symbol, f"yfinance error: {str(e)}", "yfinance")
 
+    async def _query_alpha_vantage(self, params: dict) -> dict:
+        """
+        Run an Alpha Vantage query and return the decoded JSON.
+
+        Raises:
+            RateLimitError: Response carries Alpha Vantage's throttling "Note"
+        """
+        async with self._get_session().get(ALPHA_VANTAGE_URL, params=params) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+
+        if "Note" in data:
+            # Rate limit message
+            raise RateLimitError("alpha_vantage", retry_after=86400)  # 24 hours
+
+        return data
+
+    def _build_yfinance_stock_data(
+        self, symbol: str, info: dict, history: pd.DataFrame
+    ) -> StockData:
+        """
+        Build StockData from a yfinance info dict and price history.
+
+        Raises:
+            InvalidSymbolError: History is empty (possibly delisted)
+        """
+        if history.empty:
+            raise InvalidSymbolError(
+                symbol, "No historical data available (possibly delisted)"
+            )
+
+        # Extract current price data
+        current_price = info.get("regularMarketPrice") or info.get("currentPrice")
+        if current_price is None:
+            # Use last close price if current price not available
+            current_price = float(history['Close'].iloc[-1])
+
+        price_change_percent = info.get("regularMarketChangePercent", 0.0)
+        volume = info.get("regularMarketVolume") or info.get("volume", 0)
+
+        # Extract fundamentals, skipping missing values
+        get = info.get
+        fundamentals = {
+            field: value
+            for field, key in _YF_FUNDAMENTAL_KEYS
+            if (value := get(key)) is not None
+        }
+
+        return StockData(
+            symbol=symbol.upper(),
+            current_price=float(current_price),
+            price_change_percent=float(price_change_percent),
+            volume=int(volume),
+            historical_prices=_compact_history(history) if self.compact_prices else history,
+            fundamentals=fundamentals,
+            metadata={
+                "source": "yfinance",
+                "fetch_time": datetime.utcnow().isoformat(),
+                "data_points": len(history),
+            },
+        )
+
     async def _fetch_from_alpha_vantage(
         self, symbol: str, start_date: date, end_date: date
     ) -> StockData:
@@ -279,7 +696,6 @@ class StockFetcher:
 
         try:
             # Fetch daily time series
-            url = "https://www.alphavantage.co/query"
             params = {
                 "function": "TIME_SERIES_DAILY",
                 "symbol": symbol,
@@ -287,18 +703,12 @@ class StockFetcher:
                 "outputsize": "full",  # Get full history
             }
 
-            response = requests.get(url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._call_provider("alpha_vantage", self._query_alpha_vantage, params)
 
             # Check for API errors
             if "Error Message" in data:
                 raise InvalidSymbolError(symbol, data["Error Message"])
 
-            if "Note" in data:
-                # Rate limit message
-                raise RateLimitError("alpha_vantage", retry_after=86400)  # 24 hours
-
             if "Time Series (Daily)" not in data:
                 raise DataFetchError(
                     symbol,
@@ -308,45 +718,55 @@ class StockFetcher:
 
             time_series = data["Time Series (Daily)"]
 
-            # Filter by date range and build DataFrame
-            historical_data = []
-            for date_str, values in time_series.items():
-                trade_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-                if start_date <= trade_date <= end_date:
-                    historical_data.append({
-                        "Date": trade_date,
-                        "Open": float(values["1. open"]),
-                        "High": float(values["2. high"]),
-                        "Low": float(values["3. low"]),
-                        "Close": float(values["4. close"]),
-                        "Volume": int(values["5. volume"]),
-                    })
-
-            if not historical_data:
+            # Filter by date range; ISO dates compare and sort as strings
+            start_str, end_str = start_date.isoformat(), end_date.isoformat()
+            rows = sorted(
+                (
+                    (date_str, values)
+                    for date_str, values in time_series.items()
+                    if start_str <= date_str <= end_str
+                ),
+                key=itemgetter(0),
+            )
+
+            if not rows:
                 raise InvalidSymbolError(
                     symbol, "No data available for date range"
                 )
 
-            # Convert to DataFrame
-            df = pd.DataFrame(historical_data)
-            df.set_index("Date", inplace=True)
-            df.sort_index(inplace=True)
-
-            # Get most recent data point
-            latest = historical_data[-1] if historical_data else None
-            if not latest:
-                raise InvalidSymbolError(symbol, "No recent data available")
+            # Parse straight into a record array and wrap it as a DataFrame
+            records = np.fromiter(
+                (
+                    (
+                        float(values["1. open"]),
+                        float(values["2. high"]),
+                        float(values["3. low"]),
+                        float(values["4. close"]),
+                        int(values["5. volume"]),
+                    )
+                    for _, values in rows
+                ),
+                dtype=_AV_ROW_DTYPE,
+                count=len(rows),
+            )
+            df = pd.DataFrame(
+                records,
+                index=pd.Index([date.fromisoformat(d) for d, _ in rows], name="Date"),
+            )
+            if self.compact_prices:
+                df = _compact_history(df)
 
-            current_price = latest["Close"]
+            # Get most recent data point at full precision
+            latest = rows[-1][1]
+            current_price = float(latest["4. close"])
 
             # Calculate price change (if we have previous day)
             price_change_percent = 0.0
-            if len(historical_data) >= 2:
-                prev_close = historical_data[-2]["Close"]
+            if len(rows) >= 2:
+                prev_close = float(rows[-2][1]["4. close"])
                 price_change_percent = ((current_price - prev_close) / prev_close) * 100
 
-            volume = latest["Volume"]
+            volume = int(latest["5. volume"])
 
             duration = time.time() - start_time
             log_api_response(logger, "alpha_vantage", "success", duration)
@@ -369,7 +789,7 @@ class StockFetcher:
         except (InvalidSymbolError, RateLimitError) as e:
             log_api_error(logger, "alpha_vantage", e)
             raise
-        except requests.RequestException as e:
+        except aiohttp.ClientError as e:
             log_api_error(logger, "alpha_vantage", e)
             raise DataFetchError(symbol, f"Network error: {str(e)}", "alpha_vantage")
         except Exception as e:
@@ -9,9 +9,14 @@ Provides a unified interface for:
 All clients implement the LLMClient abstract base class.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Tuple, Union
 
+from stock_analyzer.config import DEFAULT_LLM_MODELS
 from stock_analyzer.exceptions import AnalysisError
 from stock_analyzer.logging import get_logger
 from stock_analyzer.models import AnalysisResponse, StockData
@@ -19,6 +24,57 @@ from stock_analyzer.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# One batch job: (prompt, stock data, optional system prompt)
+BatchJob = Tuple[str, StockData, Optional[str]]
+
+# Seconds between status checks while a provider batch is processing
+BATCH_POLL_INTERVAL = 5.0
+
+# Concurrent analyze() calls when a provider has no batch API
+BATCH_FALLBACK_CONCURRENCY = 4
+
+# OpenAI batch statuses after which no more results will be produced
+OPENAI_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_openai_encoding(model: str):
+    """
+    Load the tiktoken encoding for an OpenAI model.
+
+    Raises on failure; lru_cache does not cache exceptions, so only successfully
+    loaded encodings are kept.
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name: use the encoding of current GPT-4o-family models
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _openai_encoding(model: str):
+    """
+    Get the tiktoken encoding for an OpenAI model, shared by all clients.
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken or its BPE data is unavailable
+    """
+    try:
+        return _load_openai_encoding(model)
+    except ImportError:
+        return None
+    except Exception as e:
+        # BPE data is downloaded on first use and may be unreachable; retried next call
+        logger.warning(f"tiktoken encoding unavailable for {model}: {type(e).__name__}: {e}")
+        return None
+
+
+def _batch_custom_id(index: int) -> str:
+    """Build a batch request ID; symbols like BRK.B are not valid IDs."""
+    return f"job-{index}"
+
 
 class LLMClient(ABC):
     """
@@ -27,6 +83,8 @@ class LLMClient(ABC):
     All provider implementations must implement:
     - analyze(): Generate stock analysis
     - count_tokens(): Count tokens in text
+
+    Providers may override analyze_stream() to yield text as it is generated.
     """
 
     @abstractmethod
@@ -65,6 +123,62 @@ class LLMClient(ABC):
         """
         pass
 
+    async def analyze_stream(
+        self,
+        prompt: str,
+        stock_data: StockData,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate stock analysis, yielding text chunks as they arrive.
+
+        The default implementation yields the full analyze() text at once.
+        Streams are not retried, since a retry would repeat text already yielded.
+
+        Args:
+            prompt: User prompt for analysis
+            stock_data: Stock market data to analyze
+            system_prompt: Optional system prompt for context
+
+        Yields:
+            Chunks of generated text
+
+        Raises:
+            AnalysisError: If analysis fails
+        """
+        response = await self.analyze(prompt, stock_data, system_prompt)
+        yield response.text
+
+    async def analyze_batch(
+        self, jobs: List[BatchJob]
+    ) -> List[Union[AnalysisResponse, Exception]]:
+        """
+        Analyze several stocks in one batch.
+
+        The default implementation runs analyze() for each job with bounded
+        concurrency. Providers with a batch API override this to submit
+        every job in a single request.
+
+        Args:
+            jobs: (prompt, stock_data, system_prompt) tuples
+
+        Returns:
+            One entry per job, in order: AnalysisResponse on success or the
+            exception raised for that job
+        """
+        semaphore = asyncio.Semaphore(BATCH_FALLBACK_CONCURRENCY)
+
+        async def analyze_one(job: BatchJob) -> AnalysisResponse:
+            async with semaphore:
+                return await self.analyze(*job)
+
+        return await asyncio.gather(
+            *(analyze_one(job) for job in jobs), return_exceptions=True
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client, if the provider SDK has one."""
+
 
 class ClaudeLLMClient(LLMClient):
     """
@@ -96,6 +210,10 @@ class ClaudeLLMClient(LLMClient):
         self.enable_caching = enable_caching
         self.max_tokens = max_tokens
 
+    async def aclose(self) -> None:
+        """Close the SDK's pooled HTTP connections."""
+        await self.client.close()
+
     @retry_with_backoff(
         max_attempts=3,
         base_delay=2.0,
@@ -115,42 +233,119 @@ class ClaudeLLMClient(LLMClient):
         """
         logger.debug(f"Requesting Claude analysis for {stock_data.symbol}")
         try:
-            messages = [{"role": "user", "content": prompt}]
-
-            # Build system messages with optional caching
-            system = []
-            if system_prompt:
-                system_msg = {
-                    "type": "text",
-                    "text": system_prompt,
-                }
-                # Add cache control for cost optimization
-                if self.enable_caching:
-                    system_msg["cache_control"] = {"type": "ephemeral"}
-                system.append(system_msg)
-
             response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=self.max_tokens,
-                system=system if system else None,
-                messages=messages,
+                system=self._system_blocks(system_prompt),
+                messages=[{"role": "user", "content": prompt}],
             )
+            return self._to_response(response, stock_data.symbol)
 
-            logger.debug(
-                f"Claude analysis complete for {stock_data.symbol}: "
-                f"{response.usage.input_tokens} input + {response.usage.output_tokens} output tokens"
+        except Exception as e:
+            logger.error(f"Claude API error for {stock_data.symbol}: {type(e).__name__}: {e}")
+            raise AnalysisError(
+                stock_data.symbol,
+                f"Claude API error: {str(e)}",
+                self.model,
             )
 
-            return AnalysisResponse(
-                text=response.content[0].text,
-                tokens_used=response.usage.input_tokens + response.usage.output_tokens,
+    async def analyze_batch(
+        self, jobs: List[BatchJob]
+    ) -> List[Union[AnalysisResponse, Exception]]:
+        """
+        Analyze several stocks through the Message Batches API.
+
+        Batches are billed at a discount but may take up to 24 hours; this
+        polls until the batch has ended. A submission failure is reported
+        as an AnalysisError for every job.
+        """
+        requests = []
+        for index, (prompt, _, system_prompt) in enumerate(jobs):
+            params = {
+                "model": self.model,
+                "max_tokens": self.max_tokens,
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            system = self._system_blocks(system_prompt)
+            if system:
+                params["system"] = system
+            requests.append({"custom_id": _batch_custom_id(index), "params": params})
+
+        try:
+            batch = await self.client.messages.batches.create(requests=requests)
+            logger.debug(f"Submitted Claude batch {batch.id} with {len(jobs)} requests")
+            while batch.processing_status != "ended":
+                await asyncio.sleep(BATCH_POLL_INTERVAL)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+
+            results = {}
+            async for entry in await self.client.messages.batches.results(batch.id):
+                results[entry.custom_id] = entry.result
+
+        except Exception as e:
+            logger.error(f"Claude batch API error: {type(e).__name__}: {e}")
+            return [
+                AnalysisError(stock_data.symbol, f"Claude batch API error: {str(e)}", self.model)
+                for _, stock_data, _ in jobs
+            ]
+
+        responses = []
+        for index, (_, stock_data, _) in enumerate(jobs):
+            result = results.get(_batch_custom_id(index))
+            if result is not None and result.type == "succeeded":
+                responses.append(self._to_response(result.message, stock_data.symbol))
+            else:
+                status = result.type if result is not None else "missing"
+                responses.append(
+                    AnalysisError(stock_data.symbol, f"Claude batch request {status}", self.model)
+                )
+        return responses
+
+    def _to_response(self, message: Any, symbol: str) -> AnalysisResponse:
+        """Convert an Anthropic message into an AnalysisResponse."""
+        usage = message.usage
+        # Prompt-cache counters are reported separately from input_tokens
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+
+        logger.debug(
+            f"Claude analysis complete for {symbol}: "
+            f"{usage.input_tokens} input + {usage.output_tokens} output tokens "
+            f"({cache_read} cache read, {cache_write} cache write)"
+        )
+
+        return AnalysisResponse(
+            text=message.content[0].text,
+            tokens_used=usage.input_tokens + usage.output_tokens,
+            model=self.model,
+            metadata={
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cache_read_input_tokens": cache_read,
+                "cache_creation_input_tokens": cache_write,
+                "cached": cache_read > 0,
+            },
+        )
+
+    async def analyze_stream(
+        self,
+        prompt: str,
+        stock_data: StockData,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a Claude analysis, yielding text deltas as they arrive.
+        """
+        logger.debug(f"Streaming Claude analysis for {stock_data.symbol}")
+        try:
+            async with self.client.messages.stream(
                 model=self.model,
-                metadata={
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens,
-                    "cached": hasattr(response.usage, "cache_read_input_tokens"),
-                },
-            )
+                max_tokens=self.max_tokens,
+                system=self._system_blocks(system_prompt),
+                messages=[{"role": "user", "content": prompt}],
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
 
         except Exception as e:
             logger.error(f"Claude API error for {stock_data.symbol}: {type(e).__name__}: {e}")
@@ -160,6 +355,20 @@ class ClaudeLLMClient(LLMClient):
                 self.model,
             )
 
+    def _system_blocks(self, system_prompt: Optional[str]) -> Optional[List[Dict[str, Any]]]:
+        """Build system blocks, marking the system prompt for caching if enabled."""
+        if not system_prompt:
+            return None
+
+        system_msg = {
+            "type": "text",
+            "text": system_prompt,
+        }
+        # Add cache control for cost optimization
+        if self.enable_caching:
+            system_msg["cache_control"] = {"type": "ephemeral"}
+        return [system_msg]
+
     async def count_tokens(self, text: str) -> int:
         """
         Count tokens using Claude's tokenizer.
@@ -201,6 +410,10 @@ class OpenAILLMClient(LLMClient):
         self.temperature = temperature
         self.max_tokens = max_tokens
 
+    async def aclose(self) -> None:
+        """Close the SDK's pooled HTTP connections."""
+        await self.client.close()
+
     @retry_with_backoff(
         max_attempts=3,
         base_delay=2.0,
@@ -218,35 +431,136 @@ class OpenAILLMClient(LLMClient):
         """
         logger.debug(f"Requesting OpenAI analysis for {stock_data.symbol}")
         try:
-            messages = []
-
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            messages.append({"role": "user", "content": prompt})
-
             response = await self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self._messages(prompt, system_prompt),
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
             )
+            return self._to_response(response, stock_data.symbol)
 
-            logger.debug(
-                f"OpenAI analysis complete for {stock_data.symbol}: "
-                f"{response.usage.total_tokens} tokens"
+        except Exception as e:
+            logger.error(f"OpenAI API error for {stock_data.symbol}: {type(e).__name__}: {e}")
+            raise AnalysisError(
+                stock_data.symbol,
+                f"OpenAI API error: {str(e)}",
+                self.model,
             )
 
-            return AnalysisResponse(
-                text=response.choices[0].message.content,
-                tokens_used=response.usage.total_tokens,
-                model=self.model,
-                metadata={
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "finish_reason": response.choices[0].finish_reason,
+    async def analyze_batch(
+        self, jobs: List[BatchJob]
+    ) -> List[Union[AnalysisResponse, Exception]]:
+        """
+        Analyze several stocks through the Batch API.
+
+        Jobs are uploaded as one JSONL file of chat completion requests.
+        Batches are billed at a discount but may take up to 24 hours; this
+        polls until the batch reaches a final status. A submission failure
+        is reported as an AnalysisError for every job.
+        """
+        from openai.types.chat import ChatCompletion
+
+        lines = [
+            json.dumps({
+                "custom_id": _batch_custom_id(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._messages(prompt, system_prompt),
+                    "temperature": self.temperature,
+                    "max_tokens": self.max_tokens,
                 },
+            })
+            for index, (prompt, _, system_prompt) in enumerate(jobs)
+        ]
+
+        try:
+            input_file = await self.client.files.create(
+                file=("analysis_batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
             )
+            logger.debug(f"Submitted OpenAI batch {batch.id} with {len(jobs)} requests")
+            while batch.status not in OPENAI_BATCH_FINAL_STATUSES:
+                await asyncio.sleep(BATCH_POLL_INTERVAL)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            # Successful requests land in the output file, failed ones in the error file
+            results = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if file_id:
+                    content = await self.client.files.content(file_id)
+                    for line in content.text.splitlines():
+                        if line.strip():
+                            entry = json.loads(line)
+                            results[entry["custom_id"]] = entry
+
+        except Exception as e:
+            logger.error(f"OpenAI batch API error: {type(e).__name__}: {e}")
+            return [
+                AnalysisError(stock_data.symbol, f"OpenAI batch API error: {str(e)}", self.model)
+                for _, stock_data, _ in jobs
+            ]
+
+        responses = []
+        for index, (_, stock_data, _) in enumerate(jobs):
+            entry = results.get(_batch_custom_id(index)) or {}
+            response = entry.get("response") or {}
+            if response.get("status_code") == 200:
+                completion = ChatCompletion.model_validate(response["body"])
+                responses.append(self._to_response(completion, stock_data.symbol))
+            else:
+                reason = entry.get("error") or response.get("body") or f"batch {batch.status}"
+                responses.append(AnalysisError(
+                    stock_data.symbol, f"OpenAI batch request failed: {reason}", self.model
+                ))
+        return responses
+
+    def _to_response(self, completion: Any, symbol: str) -> AnalysisResponse:
+        """Convert an OpenAI chat completion into an AnalysisResponse."""
+        logger.debug(
+            f"OpenAI analysis complete for {symbol}: "
+            f"{completion.usage.total_tokens} tokens"
+        )
+
+        return AnalysisResponse(
+            text=completion.choices[0].message.content,
+            tokens_used=completion.usage.total_tokens,
+            model=self.model,
+            metadata={
+                "prompt_tokens": completion.usage.prompt_tokens,
+                "completion_tokens": completion.usage.completion_tokens,
+                "finish_reason": completion.choices[0].finish_reason,
+            },
+        )
+
+    async def analyze_stream(
+        self,
+        prompt: str,
+        stock_data: StockData,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream an OpenAI analysis, yielding content deltas as they arrive.
+        """
+        logger.debug(f"Streaming OpenAI analysis for {stock_data.symbol}")
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._messages(prompt, system_prompt),
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stream=True,
+            )
+            async for chunk in stream:
+                # Trailing chunks may carry no choices or an empty delta
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
         except Exception as e:
             logger.error(f"OpenAI API error for {stock_data.symbol}: {type(e).__name__}: {e}")
@@ -256,14 +570,29 @@ class OpenAILLMClient(LLMClient):
                 self.model,
             )
 
+    @staticmethod
+    def _messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """Build chat messages with an optional leading system message."""
+        messages = []
+
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     async def count_tokens(self, text: str) -> int:
         """
-        Count tokens using approximation.
+        Count tokens with the model's tiktoken encoding.
 
-        OpenAI doesn't provide async token counting, so using approximation.
+        Falls back to approximation if tiktoken is unavailable.
         """
-        # Rough approximation: 4 characters ≈ 1 token
-        return len(text) // 4
+        encoding = _openai_encoding(self.model)
+        if encoding is None:
+            # Rough approximation: 4 characters ≈ 1 token
+            return len(text) // 4
+        # Special-token strings such as "<|endoftext|>" in the text are counted as plain text
+        return len(encoding.encode_ordinary(text))
 
 
 class GeminiLLMClient(LLMClient):
@@ -316,17 +645,9 @@ class GeminiLLMClient(LLMClient):
         """
         logger.debug(f"Requesting Gemini analysis for {stock_data.symbol}")
         try:
-            # Combine system and user prompts
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-
             response = await self.model.generate_content_async(
-                full_prompt,
-                generation_config={
-                    "temperature": self.temperature,
-                    "max_output_tokens": self.max_output_tokens,
-                },
+                self._full_prompt(prompt, system_prompt),
+                generation_config=self._generation_config(),
             )
 
             logger.debug(
@@ -352,6 +673,48 @@ class GeminiLLMClient(LLMClient):
                 self.model.model_name,
             )
 
+    async def analyze_stream(
+        self,
+        prompt: str,
+        stock_data: StockData,
+        system_prompt: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a Gemini analysis, yielding text chunks as they arrive.
+        """
+        logger.debug(f"Streaming Gemini analysis for {stock_data.symbol}")
+        try:
+            response = await self.model.generate_content_async(
+                self._full_prompt(prompt, system_prompt),
+                generation_config=self._generation_config(),
+                stream=True,
+            )
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+
+        except Exception as e:
+            logger.error(f"Gemini API error for {stock_data.symbol}: {type(e).__name__}: {e}")
+            raise AnalysisError(
+                stock_data.symbol,
+                f"Gemini API error: {str(e)}",
+                self.model.model_name,
+            )
+
+    @staticmethod
+    def _full_prompt(prompt: str, system_prompt: Optional[str]) -> str:
+        """Combine system and user prompts into a single prompt."""
+        if system_prompt:
+            return f"{system_prompt}\n\n{prompt}"
+        return prompt
+
+    def _generation_config(self) -> Dict[str, Any]:
+        """Build the generation config shared by streaming and non-streaming calls."""
+        return {
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_output_tokens,
+        }
+
     async def count_tokens(self, text: str) -> int:
         """
         Count tokens using approximation.
@@ -371,11 +734,25 @@ class LLMClientFactory:
     """
 
     # Default models for each provider
-    DEFAULT_MODELS = {
-        "anthropic": "claude-sonnet-4-5-20250929",
-        "openai": "gpt-4o",
-        "gemini": "gemini-2.5-pro",
-    }
+    DEFAULT_MODELS = DEFAULT_LLM_MODELS
+
+    # Clients shared per process so their HTTP connection pools are reused,
+    # keyed by provider, API key digest, model and options
+    _clients: Dict[Tuple[Hashable, ...], LLMClient] = {}
+
+    @staticmethod
+    def _cache_key(
+        provider: str, api_key: str, model: Optional[str], kwargs: Dict[str, Any]
+    ) -> Optional[Tuple[Hashable, ...]]:
+        """Build the client cache key, or None if the options are unhashable."""
+        options = tuple(sorted(kwargs.items()))
+        try:
+            hash(options)
+        except TypeError:
+            return None
+        # Only a digest of the API key is kept in memory alongside the client
+        key_digest = hashlib.sha256(api_key.encode()).hexdigest()
+        return (provider, key_digest, model, options)
 
     @staticmethod
     def create(
@@ -387,6 +764,9 @@ class LLMClientFactory:
         """
         Create LLM client for specified provider.
 
+        Clients are cached per process: repeated calls with the same
+        provider, API key, model and options return the same instance.
+
         Args:
             provider: "anthropic", "openai", or "gemini" (case-insensitive)
             api_key: API key for the provider
@@ -429,25 +809,32 @@ class LLMClientFactory:
             model = LLMClientFactory.DEFAULT_MODELS.get(provider)
 
         if provider == "anthropic":
-            return ClaudeLLMClient(
-                api_key=api_key,
-                model=model,
-                **kwargs,
-            )
+            client_class = ClaudeLLMClient
         elif provider == "openai":
-            return OpenAILLMClient(
-                api_key=api_key,
-                model=model,
-                **kwargs,
-            )
+            client_class = OpenAILLMClient
         elif provider == "gemini":
-            return GeminiLLMClient(
-                api_key=api_key,
-                model=model,
-                **kwargs,
-            )
+            client_class = GeminiLLMClient
         else:
             raise ValueError(
                 f"Unknown provider: {provider}. "
                 f"Supported providers: anthropic, openai, gemini"
             )
+
+        cache_key = LLMClientFactory._cache_key(provider, api_key, model, kwargs)
+        client = LLMClientFactory._clients.get(cache_key) if cache_key else None
+        if client is None:
+            client = client_class(api_key=api_key, model=model, **kwargs)
+            if cache_key:
+                LLMClientFactory._clients[cache_key] = client
+        return client
+
+    @staticmethod
+    async def close_all() -> None:
+        """Close and forget every cached client."""
+        clients = list(LLMClientFactory._clients.values())
+        LLMClientFactory._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close {type(client).__name__}: {e}")
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Literal, Optional
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True)
 class StockData:
     """
     Stock market data from APIs (yfinance, Alpha Vantage).
@@ -153,7 +153,7 @@ class AnalysisJob:
     duration_seconds: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResponse:
     """
     Response from LLM API analysis call.
@@ -0,0 +1,33 @@
+"""
+Event loop runner for command-line entry points.
+
+Uses uvloop when it is installed (pip install "stock-analyzer[uvloop]"),
+otherwise the default asyncio event loop.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_async(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a fresh event loop.
+
+    Drop-in replacement for asyncio.run() that prefers uvloop's faster
+    libuv-based loop for the HTTP-heavy fetch and analysis paths.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
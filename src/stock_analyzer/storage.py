@@ -18,6 +18,107 @@ from stock_analyzer.models import (
     StockAnalysis,
 )
 
+_INSERT_INSIGHT_SQL = """
+    INSERT INTO insights
+    (stock_symbol, analysis_date, summary, trend_analysis,
+     risk_factors, opportunities, confidence_level, metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_DELIVERY_LOG_SQL = """
+    INSERT INTO delivery_logs
+    (insight_id, channel_id, delivery_method, delivery_status, error_message, delivered_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Schema migration and creation, run by init_database as one script/transaction
+_SCHEMA_SQL = """
+    BEGIN;
+
+    -- MIGRATION STEP 1: Drop multi-user tables
+    DROP TABLE IF EXISTS subscriptions;
+    DROP TABLE IF EXISTS users;
+
+    -- MIGRATION STEP 2: Create simplified tables
+
+    -- Stock analyses table (unchanged)
+    CREATE TABLE IF NOT EXISTS stock_analyses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stock_symbol TEXT NOT NULL,
+        analysis_date TEXT NOT NULL,
+        price_snapshot REAL NOT NULL,
+        price_change_percent REAL,
+        volume INTEGER,
+        analysis_status TEXT NOT NULL,
+        error_message TEXT,
+        created_at TEXT NOT NULL,
+        duration_seconds REAL,
+        UNIQUE(stock_symbol, analysis_date)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_analyses_symbol_date
+    ON stock_analyses(stock_symbol, analysis_date DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_analyses_date
+    ON stock_analyses(analysis_date DESC);
+
+    -- Insights table (MODIFIED: removed analysis_id FK)
+    CREATE TABLE IF NOT EXISTS insights (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        stock_symbol TEXT NOT NULL,
+        analysis_date TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        trend_analysis TEXT NOT NULL,
+        risk_factors TEXT NOT NULL,
+        opportunities TEXT NOT NULL,
+        confidence_level TEXT NOT NULL,
+        metadata TEXT,
+        created_at TEXT NOT NULL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_insights_symbol_date
+    ON insights(stock_symbol, analysis_date DESC);
+
+    -- Delivery logs table (MODIFIED: channel_id instead of user_id)
+    CREATE TABLE IF NOT EXISTS delivery_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        insight_id INTEGER NOT NULL,
+        channel_id TEXT NOT NULL,
+        delivery_status TEXT NOT NULL,
+        delivery_method TEXT NOT NULL,
+        delivered_at TEXT,
+        error_message TEXT,
+        telegram_message_id TEXT,
+        FOREIGN KEY (insight_id) REFERENCES insights(id) ON DELETE CASCADE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_delivery_insight
+    ON delivery_logs(insight_id);
+
+    -- Analysis jobs table (unchanged)
+    CREATE TABLE IF NOT EXISTS analysis_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        execution_time TEXT NOT NULL,
+        completion_time TEXT,
+        job_status TEXT NOT NULL,
+        stocks_scheduled INTEGER NOT NULL,
+        stocks_processed INTEGER NOT NULL DEFAULT 0,
+        success_count INTEGER NOT NULL DEFAULT 0,
+        failure_count INTEGER NOT NULL DEFAULT 0,
+        insights_delivered INTEGER NOT NULL DEFAULT 0,
+        errors TEXT,
+        duration_seconds REAL
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_jobs_execution_time
+    ON analysis_jobs(execution_time DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_jobs_status
+    ON analysis_jobs(job_status);
+
+    COMMIT;
+"""
+
 
 class Storage:
     """
@@ -32,13 +133,17 @@ class Storage:
         Initialize storage with database path.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file, or a SQLite "file:" URI such as
+                "file:name?mode=memory&cache=shared" for a shared in-memory database
         """
         self.db_path = db_path
+        self._is_uri = db_path.startswith("file:")
         self._ensure_db_directory()
 
     def _ensure_db_directory(self):
         """Ensure database directory exists."""
+        if self._is_uri or self.db_path == ":memory:":
+            return
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
 
@@ -53,7 +158,7 @@ class Storage:
             StorageError: If connection fails
         """
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, uri=self._is_uri)
             conn.row_factory = sqlite3.Row  # Enable column access by name
             # Enable foreign key constraints
             conn.execute("PRAGMA foreign_keys = ON")
@@ -78,111 +183,9 @@ class Storage:
         - All indexes for performance
         """
         conn = self._get_connection()
-        cursor = conn.cursor()
 
         try:
-            # MIGRATION STEP 1: Drop multi-user tables
-            cursor.execute("DROP TABLE IF EXISTS subscriptions")
-            cursor.execute("DROP TABLE IF EXISTS users")
-
-            # MIGRATION STEP 2: Create simplified tables
-
-            # Stock analyses table (unchanged)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS stock_analyses (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    stock_symbol TEXT NOT NULL,
-                    analysis_date TEXT NOT NULL,
-                    price_snapshot REAL NOT NULL,
-                    price_change_percent REAL,
-                    volume INTEGER,
-                    analysis_status TEXT NOT NULL,
-                    error_message TEXT,
-                    created_at TEXT NOT NULL,
-                    duration_seconds REAL,
-                    UNIQUE(stock_symbol, analysis_date)
-                )
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_analyses_symbol_date
-                ON stock_analyses(stock_symbol, analysis_date DESC)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_analyses_date
-                ON stock_analyses(analysis_date DESC)
-            """)
-
-            # Insights table (MODIFIED: removed analysis_id FK)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS insights (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    stock_symbol TEXT NOT NULL,
-                    analysis_date TEXT NOT NULL,
-                    summary TEXT NOT NULL,
-                    trend_analysis TEXT NOT NULL,
-                    risk_factors TEXT NOT NULL,
-                    opportunities TEXT NOT NULL,
-                    confidence_level TEXT NOT NULL,
-                    metadata TEXT,
-                    created_at TEXT NOT NULL
-                )
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_insights_symbol_date
-                ON insights(stock_symbol, analysis_date DESC)
-            """)
-
-            # Delivery logs table (MODIFIED: channel_id instead of user_id)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS delivery_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    insight_id INTEGER NOT NULL,
-                    channel_id TEXT NOT NULL,
-                    delivery_status TEXT NOT NULL,
-                    delivery_method TEXT NOT NULL,
-                    delivered_at TEXT,
-                    error_message TEXT,
-                    telegram_message_id TEXT,
-                    FOREIGN KEY (insight_id) REFERENCES insights(id) ON DELETE CASCADE
-                )
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_delivery_insight
-                ON delivery_logs(insight_id)
-            """)
-
-            # Analysis jobs table (unchanged)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS analysis_jobs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    execution_time TEXT NOT NULL,
-                    completion_time TEXT,
-                    job_status TEXT NOT NULL,
-                    stocks_scheduled INTEGER NOT NULL,
-                    stocks_processed INTEGER NOT NULL DEFAULT 0,
-                    success_count INTEGER NOT NULL DEFAULT 0,
-                    failure_count INTEGER NOT NULL DEFAULT 0,
-                    insights_delivered INTEGER NOT NULL DEFAULT 0,
-                    errors TEXT,
-                    duration_seconds REAL
-                )
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_execution_time
-                ON analysis_jobs(execution_time DESC)
-            """)
-
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_jobs_status
-                ON analysis_jobs(job_status)
-            """)
-
-            conn.commit()
+            conn.executescript(_SCHEMA_SQL)
 
         except sqlite3.Error as e:
             conn.rollback()
@@ -315,29 +318,7 @@ class Storage:
         cursor = conn.cursor()
 
         try:
-            metadata_json = json.dumps(insight.metadata) if insight.metadata else None
-            risk_factors_json = json.dumps(insight.risk_factors)
-            opportunities_json = json.dumps(insight.opportunities)
-
-            cursor.execute(
-                """
-                INSERT INTO insights
-                (stock_symbol, analysis_date, summary, trend_analysis,
-                 risk_factors, opportunities, confidence_level, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    insight.stock_symbol,
-                    insight.analysis_date.isoformat(),
-                    insight.summary,
-                    insight.trend_analysis,
-                    risk_factors_json,
-                    opportunities_json,
-                    insight.confidence_level,
-                    metadata_json,
-                    insight.created_at.isoformat(),
-                ),
-            )
+            cursor.execute(_INSERT_INSIGHT_SQL, self._insight_params(insight))
 
             insight_id = cursor.lastrowid
             insight.id = insight_id
@@ -350,6 +331,53 @@ class Storage:
         finally:
             conn.close()
 
+    def save_insights(self, insights: List[Insight]) -> List[int]:
+        """
+        Save multiple insights in a single transaction.
+
+        Either all insights are saved or, on error, none are.
+
+        Args:
+            insights: Insight objects to save
+
+        Returns:
+            Insight IDs, in the same order as the input
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            insight_ids = []
+            for insight in insights:
+                cursor.execute(_INSERT_INSIGHT_SQL, self._insight_params(insight))
+                insight_ids.append(cursor.lastrowid)
+
+            conn.commit()
+            for insight, insight_id in zip(insights, insight_ids):
+                insight.id = insight_id
+            return insight_ids
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise StorageError("save_insights", str(e))
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _insight_params(insight: Insight) -> tuple:
+        """Build the INSERT parameters for an insight row."""
+        return (
+            insight.stock_symbol,
+            insight.analysis_date.isoformat(),
+            insight.summary,
+            insight.trend_analysis,
+            json.dumps(insight.risk_factors),
+            json.dumps(insight.opportunities),
+            insight.confidence_level,
+            json.dumps(insight.metadata) if insight.metadata else None,
+            insight.created_at.isoformat(),
+        )
+
     def get_insights(
         self,
         stock_symbol: str,
@@ -393,28 +421,61 @@ class Storage:
             cursor.execute(query, params)
             rows = cursor.fetchall()
 
-            insights = []
-            for row in rows:
-                insights.append(
-                    Insight(
-                        id=row["id"],
-                        stock_symbol=row["stock_symbol"],
-                        analysis_date=date.fromisoformat(row["analysis_date"]),
-                        summary=row["summary"],
-                        trend_analysis=row["trend_analysis"],
-                        risk_factors=json.loads(row["risk_factors"]),
-                        opportunities=json.loads(row["opportunities"]),
-                        confidence_level=row["confidence_level"],
-                        metadata=json.loads(row["metadata"]) if row["metadata"] else {},
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                    )
-                )
+            return [self._row_to_insight(row) for row in rows]
+
+        finally:
+            conn.close()
 
-            return insights
+    def get_latest_insights(self, stock_symbols: List[str]) -> Dict[str, Insight]:
+        """
+        Get the most recent insight for each of several stocks in one query.
+
+        Args:
+            stock_symbols: Stock ticker symbols
+
+        Returns:
+            Dict mapping stock symbol to its latest Insight; symbols without insights are absent
+        """
+        if not stock_symbols:
+            return {}
+
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        try:
+            placeholders = ", ".join("?" * len(stock_symbols))
+            cursor.execute(
+                f"""
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY stock_symbol ORDER BY analysis_date DESC, id DESC
+                    ) AS rank
+                    FROM insights WHERE stock_symbol IN ({placeholders})
+                ) WHERE rank = 1
+                """,
+                list(stock_symbols),
+            )
+            return {row["stock_symbol"]: self._row_to_insight(row) for row in cursor.fetchall()}
 
         finally:
             conn.close()
 
+    @staticmethod
+    def _row_to_insight(row: sqlite3.Row) -> Insight:
+        """Build an Insight from an insights table row."""
+        return Insight(
+            id=row["id"],
+            stock_symbol=row["stock_symbol"],
+            analysis_date=date.fromisoformat(row["analysis_date"]),
+            summary=row["summary"],
+            trend_analysis=row["trend_analysis"],
+            risk_factors=json.loads(row["risk_factors"]),
+            opportunities=json.loads(row["opportunities"]),
+            confidence_level=row["confidence_level"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+            created_at=datetime.fromisoformat(row["created_at"]),
+        )
+
     # ==================== Job Operations ====================
 
     def create_job(self, stocks_scheduled: int) -> AnalysisJob:
@@ -521,21 +582,7 @@ class Storage:
         cursor = conn.cursor()
 
         try:
-            cursor.execute(
-                """
-                INSERT INTO delivery_logs
-                (insight_id, channel_id, delivery_method, delivery_status, error_message, delivered_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    log.insight_id,
-                    log.channel_id,
-                    log.delivery_method,
-                    log.delivery_status,
-                    log.error_message,
-                    log.delivered_at.isoformat() if log.delivered_at else None,
-                ),
-            )
+            cursor.execute(_INSERT_DELIVERY_LOG_SQL, self._delivery_log_params(log))
 
             log_id = cursor.lastrowid
             conn.commit()
@@ -546,3 +593,38 @@ class Storage:
             raise StorageError("save_delivery_log", str(e))
         finally:
             conn.close()
+
+    def save_delivery_logs(self, logs: List[DeliveryLog]) -> None:
+        """
+        Save multiple delivery logs in a single transaction.
+
+        Either all logs are saved or, on error, none are.
+
+        Args:
+            logs: DeliveryLog objects to save
+        """
+        conn = self._get_connection()
+
+        try:
+            conn.executemany(
+                _INSERT_DELIVERY_LOG_SQL, [self._delivery_log_params(log) for log in logs]
+            )
+            conn.commit()
+
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise StorageError("save_delivery_logs", str(e))
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _delivery_log_params(log: DeliveryLog) -> tuple:
+        """Build the INSERT parameters for a delivery log row."""
+        return (
+            log.insight_id,
+            log.channel_id,
+            log.delivery_method,
+            log.delivery_status,
+            log.error_message,
+            log.delivered_at.isoformat() if log.delivered_at else None,
+        )
@@ -0,0 +1,68 @@
+"""
+Shared test configuration.
+
+Core stock_analyzer modules are imported here at collection time so their
+import cost is paid once, before the first test runs, rather than inside
+whichever test body happens to import them first.
+"""
+
+import pytest
+import yfinance
+
+import stock_analyzer.analyzer
+import stock_analyzer.exceptions
+import stock_analyzer.fetcher
+import stock_analyzer.llm_client
+import stock_analyzer.models
+import stock_analyzer.storage  # noqa: F401
+from stock_analyzer.llm_client import LLMClientFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_llm_client_cache():
+    """Start and end every test with an empty LLMClientFactory client cache."""
+    LLMClientFactory._clients.clear()
+    yield
+    LLMClientFactory._clients.clear()
+
+
+@pytest.fixture(scope="session")
+def TelegramBotCls():
+    """
+    TelegramBot class, resolved once per session.
+
+    The import is deferred to fixture setup so that a missing or broken bot
+    module only affects the tests that request it, not collection of the
+    whole suite.
+    """
+    from stock_analyzer.bot import TelegramBot
+
+    return TelegramBot
+
+
+class TickerFactory:
+    """Controllable stand-in for yfinance.Ticker that records requested symbols."""
+
+    def __init__(self):
+        self.ticker = None
+        self.error = None
+        self.calls = []
+
+    def __call__(self, symbol):
+        self.calls.append(symbol)
+        if self.error is not None:
+            raise self.error
+        return self.ticker
+
+
+@pytest.fixture
+def yf_ticker(monkeypatch):
+    """
+    Replace yfinance.Ticker with a TickerFactory for the test.
+
+    Set .ticker to the object Ticker(...) should return, or .error to an
+    exception it should raise.
+    """
+    factory = TickerFactory()
+    monkeypatch.setattr(yfinance, "Ticker", factory)
+    return factory
@@ -4,6 +4,7 @@ Contract tests for Analyzer component.
 Tests the public API contract of the Analyzer class.
 """
 
+import asyncio
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
@@ -173,6 +174,41 @@ class TestAnalyzerContract:
 
         assert result.total == 4
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_parallel_runs_concurrently(self, analyzer):
+        """Test that parallel > 1 overlaps analyses even without continue_on_error."""
+        in_flight = [0]
+        peak = [0]
+
+        async def slow_analyze(symbol, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+
+        analyzer.analyze_stock = slow_analyze
+
+        result = await analyzer.analyze_batch(["AAPL", "TSLA", "MSFT", "GOOGL"], parallel=2)
+
+        assert result.success_count == 4
+        assert peak[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_parallel_stops_on_first_error(self, analyzer):
+        """Test that parallel batches without continue_on_error stop after a failure."""
+        async def failing_analyze(symbol, **kwargs):
+            if symbol == "INVALID":
+                raise AnalysisError(symbol, "boom", "test")
+            await asyncio.sleep(0.05)
+
+        analyzer.analyze_stock = failing_analyze
+
+        result = await analyzer.analyze_batch(["INVALID", "AAPL", "TSLA", "MSFT"], parallel=2)
+
+        assert result.total == 4
+        assert result.failure_count == 1
+        assert result.success_count + result.failure_count < result.total
+
     @pytest.mark.asyncio
     async def test_analyze_batch_continue_on_error(self, analyzer, mock_fetcher):
         """Test that batch continues on error when flag is set."""
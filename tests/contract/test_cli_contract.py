@@ -362,6 +362,7 @@ class TestHistoryCommand:
     def test_history_without_user_filtering(self, cli, capsys):
         """Test history command queries all insights without user_id filtering."""
         from datetime import date, datetime
+
         from stock_analyzer.models import Insight
 
         # Store multiple insights for same stock
@@ -422,6 +423,7 @@ class TestHistoryCommand:
     def test_history_with_date_range_filtering(self, cli, capsys):
         """Test history command with date range filtering."""
         from datetime import date, datetime
+
         from stock_analyzer.models import Insight
 
         # Store insights across multiple days
@@ -461,6 +463,7 @@ class TestHistoryCommand:
     def test_history_json_output(self, cli, capsys):
         """Test history command with JSON output."""
         from datetime import date, datetime
+
         from stock_analyzer.models import Insight
 
         insight = Insight(
@@ -496,6 +499,7 @@ class TestHistoryCommand:
     def test_history_pagination(self, cli, capsys):
         """Test history command pagination (limit/offset)."""
         from datetime import date, datetime, timedelta
+
         from stock_analyzer.models import Insight
 
         # Store 10 insights
@@ -559,3 +563,103 @@ class TestHistoryCommand:
         assert data['status'] == 'success'
         assert data['total'] == 0
         assert data['insights'] == []
+
+
+class TestStatsCommand:
+    """Test the stats command contract (personal use)."""
+
+    def test_stats_json_counts(self, cli, capsys):
+        """Test stats command reports analysis and delivery counts."""
+        from datetime import date, timedelta
+
+        from stock_analyzer.models import DeliveryLog, StockAnalysis
+
+        today = date.today()
+        for symbol, analysis_date, status in [
+            ("AAPL", today, "success"),
+            ("TSLA", today, "failed"),
+            ("MSFT", today - timedelta(days=30), "success"),
+        ]:
+            cli.storage.save_analysis(StockAnalysis(
+                stock_symbol=symbol,
+                analysis_date=analysis_date,
+                price_snapshot=100.0,
+                analysis_status=status,
+            ))
+
+        insight_id = cli.storage.save_insight(Insight(
+            stock_symbol="AAPL",
+            analysis_date=today,
+            summary="Summary",
+            trend_analysis="Trend",
+            risk_factors=[],
+            opportunities=[],
+            confidence_level="high",
+        ))
+        for status in ["success", "success", "failed"]:
+            cli.storage.save_delivery_log(DeliveryLog(
+                insight_id=insight_id,
+                channel_id="@mystocks",
+                delivery_status=status,
+            ))
+
+        exit_code = cli.stats(json_output=True)
+
+        assert exit_code == 0
+
+        data = json.loads(capsys.readouterr().out)
+        assert data['analyses']['total'] == 3
+        assert data['analyses']['successful'] == 2
+        assert data['analyses']['recent_7_days'] == 2
+        assert data['insights']['total'] == 1
+        assert data['deliveries']['total'] == 3
+        assert data['deliveries']['successful'] == 2
+
+
+class TestCLIShutdown:
+    """Test the CLI releases the connections of the components it creates."""
+
+    @pytest.mark.asyncio
+    async def test_close_releases_fetcher_session(self, tmp_path):
+        """Test close() shuts the HTTP session of the fetcher the CLI built."""
+        from stock_analyzer.config import Config
+        from stock_analyzer.llm_client import LLMClientFactory
+
+        with patch.object(LLMClientFactory, 'create', return_value=MagicMock()):
+            cli = CLI(config=Config(llm_api_key="test-key"), db_path=str(tmp_path / "test.db"))
+        session = cli._fetcher._get_session()
+
+        await cli.close()
+
+        assert session.closed
+
+    def test_main_closes_cli_after_async_command(self, monkeypatch):
+        """Test main() closes the CLI once an async command finishes."""
+        from unittest.mock import AsyncMock
+
+        from stock_analyzer import cli as cli_module
+
+        mock_cli = MagicMock()
+        mock_cli.validate = AsyncMock(return_value=0)
+        mock_cli.close = AsyncMock()
+        monkeypatch.setattr(cli_module, "CLI", MagicMock(return_value=mock_cli))
+        monkeypatch.setattr("sys.argv", ["stock-analyzer", "validate", "AAPL"])
+
+        assert cli_module.main() == 0
+        mock_cli.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_cached_llm_clients(self, cli):
+        """Test close() closes and forgets the LLM clients cached by the factory."""
+        from unittest.mock import AsyncMock
+
+        from stock_analyzer.llm_client import LLMClientFactory
+
+        client = MagicMock()
+        client.aclose = AsyncMock()
+        LLMClientFactory._clients[("anthropic", "test-key", None)] = client
+
+        await cli.close()
+
+        client.aclose.assert_awaited_once()
+        assert LLMClientFactory._clients == {}
@@ -6,22 +6,18 @@ Tests are marked with [US3] for pytest filtering.
 """
 
 import pytest
+from dataclasses import fields
 from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
 from stock_analyzer.models import Insight
-from stock_analyzer.storage import Storage
 
 # Mark all tests in this module with US3
 pytestmark = pytest.mark.US3
 
 
-@pytest.fixture
-def mock_storage_with_insights():
-    """Mock storage with sample historical insights."""
-    storage = MagicMock(spec=Storage)
-
-    # Create sample insights for testing
+def _build_insights():
+    """Create ten daily AAPL insights, newest first."""
     today = date.today()
     insights = []
 
@@ -29,7 +25,6 @@ def mock_storage_with_insights():
         insight_date = today - timedelta(days=i)
         insights.append(Insight(
             id=i + 1,
-            analysis_id=i + 1,
             stock_symbol="AAPL",
             analysis_date=insight_date,
             summary=f"Summary for day {i}",
@@ -41,8 +36,21 @@ def mock_storage_with_insights():
             created_at=datetime.now()
         ))
 
-    storage.get_insights = MagicMock(return_value=insights[:5])  # Default return 5
-    return storage, insights
+    return insights
+
+
+# Built once per module; tests only read these, so they are shared as-is.
+# Kept as lists (not tuples) because get_insights is contracted to return a list.
+_INSIGHTS = _build_insights()
+_INSIGHTS_FIRST5 = _INSIGHTS[:5]
+
+
+@pytest.fixture
+def mock_storage_with_insights():
+    """Mock storage with sample historical insights."""
+    storage = MagicMock()
+    storage.get_insights = MagicMock(return_value=_INSIGHTS_FIRST5)  # Default return 5
+    return storage, _INSIGHTS
 
 
 class TestBasicInsightRetrieval:
@@ -67,8 +75,8 @@ class TestBasicInsightRetrieval:
         WHEN get_insights is called
         THEN results should be ordered by date descending (newest first)
         """
-        storage, all_insights = mock_storage_with_insights
-        storage.get_insights.return_value = all_insights[:5]
+        storage, _ = mock_storage_with_insights
+        storage.get_insights.return_value = _INSIGHTS_FIRST5
 
         result = storage.get_insights("AAPL")
 
@@ -251,13 +259,17 @@ class TestInsightDataIntegrity:
         insight = result[0]
 
         # Verify all required fields exist
-        assert hasattr(insight, 'stock_symbol')
-        assert hasattr(insight, 'analysis_date')
-        assert hasattr(insight, 'summary')
-        assert hasattr(insight, 'trend_analysis')
-        assert hasattr(insight, 'risk_factors')
-        assert hasattr(insight, 'opportunities')
-        assert hasattr(insight, 'confidence_level')
+        required = {
+            'stock_symbol',
+            'analysis_date',
+            'summary',
+            'trend_analysis',
+            'risk_factors',
+            'opportunities',
+            'confidence_level',
+        }
+        missing = required - {f.name for f in fields(insight)}
+        assert not missing, f"Insight missing fields: {sorted(missing)}"
 
     def test_insight_risk_factors_is_list(self, mock_storage_with_insights):
         """
@@ -325,16 +337,14 @@ class TestCLIHistoryCommand:
 class TestBotHistoryCommand:
     """Contract tests for Telegram bot /history command."""
 
-    def test_bot_has_history_handler(self):
+    def test_bot_has_history_handler(self, TelegramBotCls):
         """
         GIVEN Telegram bot
         WHEN checking available commands
         THEN it should have history_command handler
         """
-        from stock_analyzer.bot import TelegramBot
-
         # Bot should have history_command method
-        assert hasattr(TelegramBot, 'history_command')
+        assert hasattr(TelegramBotCls, 'history_command')
 
     def test_history_command_accepts_symbol(self):
         """
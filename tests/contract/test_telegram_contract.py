@@ -12,17 +12,26 @@ from unittest.mock import AsyncMock, MagicMock, patch
 # Mark all tests in this module with US2 and asyncio
 pytestmark = [pytest.mark.US2, pytest.mark.asyncio]
 
+# Shared AsyncMock templates, reset before every test instead of rebuilt
+_REPLY_TEMPLATE = AsyncMock()
+_VALIDATE_TRUE = AsyncMock(return_value=True)
+_VALIDATE_FALSE = AsyncMock(return_value=False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_async_templates():
+    """Clear call history on the shared AsyncMock templates."""
+    for template in (_REPLY_TEMPLATE, _VALIDATE_TRUE, _VALIDATE_FALSE):
+        template.reset_mock()
+
 
 @pytest.fixture
 def mock_storage():
     """Mock storage for testing."""
     storage = MagicMock()
-    storage.add_user = MagicMock()
-    storage.get_user = MagicMock(return_value=None)
-    storage.add_subscription = MagicMock()
-    storage.remove_subscription = MagicMock()
-    storage.get_subscriptions = MagicMock(return_value=[])
-    storage.get_subscription_count = MagicMock(return_value=0)
+    storage.get_user.return_value = None
+    storage.get_subscriptions.return_value = []
+    storage.get_subscription_count.return_value = 0
     return storage
 
 
@@ -34,7 +43,7 @@ def mock_update():
     update.effective_user.username = "testuser"
     update.effective_chat.id = 12345
     update.message.text = ""
-    update.message.reply_text = AsyncMock()
+    update.message.reply_text = _REPLY_TEMPLATE
     return update
 
 
@@ -46,18 +55,32 @@ def mock_context():
     return context
 
 
+@pytest.fixture
+def patched_fetcher():
+    """Patch the bot's StockFetcher; symbols validate successfully by default."""
+    with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
+        mock_fetcher = MockFetcher.return_value
+        mock_fetcher.validate_symbol = _VALIDATE_TRUE
+        yield mock_fetcher
+
+
+@pytest.fixture
+def bot(TelegramBotCls, mock_storage, patched_fetcher):
+    """TelegramBot bound to the mock storage and patched fetcher."""
+    return TelegramBotCls(storage=mock_storage, token="test-token")
+
+
 class TestStartCommand:
     """Contract tests for /start command."""
 
-    async def test_start_command_creates_new_user(self, mock_storage, mock_update, mock_context):
+    async def test_start_command_creates_new_user(
+        self, bot, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN a new user sends /start
         WHEN the start command handler is called
         THEN it should create a user and send welcome message
         """
-        from stock_analyzer.bot import TelegramBot
-
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.start_command(mock_update, mock_context)
 
         # Should create user
@@ -68,13 +91,14 @@ class TestStartCommand:
         message = mock_update.message.reply_text.call_args[0][0]
         assert "welcome" in message.lower() or "hello" in message.lower()
 
-    async def test_start_command_for_existing_user(self, mock_storage, mock_update, mock_context):
+    async def test_start_command_for_existing_user(
+        self, bot, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN an existing user sends /start
         WHEN the start command handler is called
         THEN it should update last_active and send welcome message
         """
-        from stock_analyzer.bot import TelegramBot
         from stock_analyzer.models import User
 
         # User already exists
@@ -85,7 +109,6 @@ class TestStartCommand:
         )
         mock_storage.get_user = MagicMock(return_value=existing_user)
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.start_command(mock_update, mock_context)
 
         # Should not create new user
@@ -98,15 +121,14 @@ class TestStartCommand:
 class TestHelpCommand:
     """Contract tests for /help command."""
 
-    async def test_help_command_lists_all_commands(self, mock_storage, mock_update, mock_context):
+    async def test_help_command_lists_all_commands(
+        self, bot, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN a user sends /help
         WHEN the help command handler is called
         THEN it should list all available commands
         """
-        from stock_analyzer.bot import TelegramBot
-
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.help_command(mock_update, mock_context)
 
         mock_update.message.reply_text.assert_called_once()
@@ -121,146 +143,84 @@ class TestHelpCommand:
 class TestSubscribeCommand:
     """Contract tests for /subscribe command."""
 
-    async def test_subscribe_valid_symbol(self, mock_storage, mock_update, mock_context):
-        """
-        GIVEN a user sends /subscribe AAPL
-        WHEN the subscribe command handler is called with valid symbol
-        THEN it should add subscription and confirm
+    @pytest.mark.parametrize(
+        "args, sub_count, valid, existing, expect_added, expect_keywords",
+        [
+            # Valid symbol under the limit is added and confirmed
+            (["AAPL"], 5, True, False, True, ("subscribed", "success")),
+            # Missing symbol sends usage error
+            ([], 0, True, False, False, ("usage", "symbol")),
+            # Invalid symbol sends error
+            (["INVALID"], 0, False, False, False, ("invalid", "not found")),
+            # User at the 10 subscription limit is rejected
+            (["TSLA"], 10, True, False, False, ("limit", "maximum")),
+            # Duplicate subscription gets a reply (either error or confirmation)
+            (["AAPL"], 5, True, True, None, ()),
+        ],
+        ids=["valid", "missing", "invalid", "at_limit", "duplicate"],
+    )
+    async def test_subscribe(
+        self,
+        bot,
+        patched_fetcher,
+        mock_storage,
+        mock_update,
+        mock_context,
+        args,
+        sub_count,
+        valid,
+        existing,
+        expect_added,
+        expect_keywords,
+    ):
         """
-        from stock_analyzer.bot import TelegramBot
-
-        mock_context.args = ["AAPL"]
-        mock_storage.get_subscription_count.return_value = 5  # Under limit
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            # Mock successful symbol validation
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
-
-            bot = TelegramBot(storage=mock_storage, token="test-token")
-            await bot.subscribe_command(mock_update, mock_context)
-
-        # Should add subscription
-        mock_storage.add_subscription.assert_called_once()
-
-        # Should confirm
-        mock_update.message.reply_text.assert_called_once()
-        message = mock_update.message.reply_text.call_args[0][0]
-        assert "AAPL" in message
-        assert "subscribed" in message.lower() or "success" in message.lower()
-
-    async def test_subscribe_missing_symbol(self, mock_storage, mock_update, mock_context):
-        """
-        GIVEN a user sends /subscribe without symbol
+        GIVEN a user sends /subscribe with the given arguments
         WHEN the subscribe command handler is called
-        THEN it should send usage error
-        """
-        from stock_analyzer.bot import TelegramBot
-
-        mock_context.args = []  # No symbol provided
-
-        bot = TelegramBot(storage=mock_storage, token="test-token")
-        await bot.subscribe_command(mock_update, mock_context)
-
-        # Should NOT add subscription
-        mock_storage.add_subscription.assert_not_called()
-
-        # Should send error
-        mock_update.message.reply_text.assert_called_once()
-        message = mock_update.message.reply_text.call_args[0][0]
-        assert "usage" in message.lower() or "symbol" in message.lower()
-
-    async def test_subscribe_invalid_symbol(self, mock_storage, mock_update, mock_context):
+        THEN it should add the subscription only when allowed and reply once
         """
-        GIVEN a user sends /subscribe INVALID
-        WHEN the subscribe command handler is called with invalid symbol
-        THEN it should send error message
-        """
-        from stock_analyzer.bot import TelegramBot
-
-        mock_context.args = ["INVALID"]
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            # Mock failed symbol validation
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=False)
-
-            bot = TelegramBot(storage=mock_storage, token="test-token")
-            await bot.subscribe_command(mock_update, mock_context)
-
-        # Should NOT add subscription
-        mock_storage.add_subscription.assert_not_called()
-
-        # Should send error
-        mock_update.message.reply_text.assert_called_once()
-        message = mock_update.message.reply_text.call_args[0][0]
-        assert "invalid" in message.lower() or "not found" in message.lower()
-
-    async def test_subscribe_at_user_limit(self, mock_storage, mock_update, mock_context):
-        """
-        GIVEN a user has 10 subscriptions (at limit)
-        WHEN they try to subscribe to another stock
-        THEN it should reject with limit error
-        """
-        from stock_analyzer.bot import TelegramBot
+        from stock_analyzer.models import Subscription
 
-        mock_context.args = ["TSLA"]
-        mock_storage.get_subscription_count.return_value = 10  # At limit
+        mock_context.args = args
+        mock_storage.get_subscription_count.return_value = sub_count
+        if not valid:
+            patched_fetcher.validate_symbol = _VALIDATE_FALSE
+        if existing:
+            mock_storage.get_subscriptions.return_value = [
+                Subscription(user_id="12345", stock_symbol=args[0])
+            ]
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.subscribe_command(mock_update, mock_context)
 
-        # Should NOT add subscription
-        mock_storage.add_subscription.assert_not_called()
+        if expect_added is True:
+            mock_storage.add_subscription.assert_called_once()
+        elif expect_added is False:
+            mock_storage.add_subscription.assert_not_called()
 
-        # Should send error
         mock_update.message.reply_text.assert_called_once()
         message = mock_update.message.reply_text.call_args[0][0]
-        assert "limit" in message.lower() or "maximum" in message.lower()
-
-    async def test_subscribe_duplicate_symbol(self, mock_storage, mock_update, mock_context):
-        """
-        GIVEN a user is already subscribed to AAPL
-        WHEN they try to subscribe to AAPL again
-        THEN it should send appropriate message
-        """
-        from stock_analyzer.bot import TelegramBot
-        from stock_analyzer.models import Subscription
-
-        mock_context.args = ["AAPL"]
-        mock_storage.get_subscription_count.return_value = 5
-
-        # User already has AAPL subscription
-        existing_sub = Subscription(user_id="12345", stock_symbol="AAPL")
-        mock_storage.get_subscriptions.return_value = [existing_sub]
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            MockFetcher.return_value.validate_symbol = AsyncMock(return_value=True)
-
-            bot = TelegramBot(storage=mock_storage, token="test-token")
-            await bot.subscribe_command(mock_update, mock_context)
-
-        # Should send message (either error or confirmation)
-        mock_update.message.reply_text.assert_called_once()
+        if expect_added:
+            assert args[0] in message
+        if expect_keywords:
+            assert any(keyword in message.lower() for keyword in expect_keywords)
 
 
 class TestUnsubscribeCommand:
     """Contract tests for /unsubscribe command."""
 
-    async def test_unsubscribe_existing_subscription(self, mock_storage, mock_update, mock_context):
+    async def test_unsubscribe_existing_subscription(
+        self, bot, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN a user is subscribed to AAPL
         WHEN they send /unsubscribe AAPL
         THEN it should remove subscription and confirm
         """
-        from stock_analyzer.bot import TelegramBot
         from stock_analyzer.models import Subscription
 
         mock_context.args = ["AAPL"]
         existing_sub = Subscription(user_id="12345", stock_symbol="AAPL")
         mock_storage.get_subscriptions.return_value = [existing_sub]
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.unsubscribe_command(mock_update, mock_context)
 
         # Should remove subscription
@@ -272,17 +232,14 @@ class TestUnsubscribeCommand:
         assert "AAPL" in message
         assert "unsubscribed" in message.lower() or "removed" in message.lower()
 
-    async def test_unsubscribe_missing_symbol(self, mock_storage, mock_update, mock_context):
+    async def test_unsubscribe_missing_symbol(self, bot, mock_storage, mock_update, mock_context):
         """
         GIVEN a user sends /unsubscribe without symbol
         WHEN the unsubscribe command handler is called
         THEN it should send usage error
         """
-        from stock_analyzer.bot import TelegramBot
-
         mock_context.args = []  # No symbol provided
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.unsubscribe_command(mock_update, mock_context)
 
         # Should NOT remove subscription
@@ -293,18 +250,17 @@ class TestUnsubscribeCommand:
         message = mock_update.message.reply_text.call_args[0][0]
         assert "usage" in message.lower() or "symbol" in message.lower()
 
-    async def test_unsubscribe_nonexistent_subscription(self, mock_storage, mock_update, mock_context):
+    async def test_unsubscribe_nonexistent_subscription(
+        self, bot, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN a user is NOT subscribed to TSLA
         WHEN they send /unsubscribe TSLA
         THEN it should send error message
         """
-        from stock_analyzer.bot import TelegramBot
-
         mock_context.args = ["TSLA"]
         mock_storage.get_subscriptions.return_value = []  # No subscription
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.unsubscribe_command(mock_update, mock_context)
 
         # Should NOT remove subscription
@@ -319,13 +275,12 @@ class TestUnsubscribeCommand:
 class TestListCommand:
     """Contract tests for /list command."""
 
-    async def test_list_with_subscriptions(self, mock_storage, mock_update, mock_context):
+    async def test_list_with_subscriptions(self, bot, mock_storage, mock_update, mock_context):
         """
         GIVEN a user has 3 subscriptions
         WHEN they send /list
         THEN it should list all their subscriptions
         """
-        from stock_analyzer.bot import TelegramBot
         from stock_analyzer.models import Subscription
 
         subscriptions = [
@@ -335,7 +290,6 @@ class TestListCommand:
         ]
         mock_storage.get_subscriptions.return_value = subscriptions
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.list_command(mock_update, mock_context)
 
         mock_update.message.reply_text.assert_called_once()
@@ -347,17 +301,14 @@ class TestListCommand:
         assert "GOOGL" in message
         assert "3" in message  # Count
 
-    async def test_list_with_no_subscriptions(self, mock_storage, mock_update, mock_context):
+    async def test_list_with_no_subscriptions(self, bot, mock_storage, mock_update, mock_context):
         """
         GIVEN a user has no subscriptions
         WHEN they send /list
         THEN it should inform them they have no subscriptions
         """
-        from stock_analyzer.bot import TelegramBot
-
         mock_storage.get_subscriptions.return_value = []
 
-        bot = TelegramBot(storage=mock_storage, token="test-token")
         await bot.list_command(mock_update, mock_context)
 
         mock_update.message.reply_text.assert_called_once()
@@ -370,46 +321,35 @@ class TestListCommand:
 class TestErrorHandling:
     """Contract tests for error handling."""
 
-    async def test_database_error_handling(self, mock_storage, mock_update, mock_context):
+    async def test_database_error_handling(self, bot, mock_storage, mock_update, mock_context):
         """
         GIVEN database operation fails
         WHEN any command is executed
         THEN it should send user-friendly error message
         """
-        from stock_analyzer.bot import TelegramBot
-
         mock_context.args = ["AAPL"]
         mock_storage.add_subscription.side_effect = Exception("Database error")
 
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
-
-            bot = TelegramBot(storage=mock_storage, token="test-token")
-            await bot.subscribe_command(mock_update, mock_context)
+        await bot.subscribe_command(mock_update, mock_context)
 
         # Should send error message to user
         mock_update.message.reply_text.assert_called()
         message = mock_update.message.reply_text.call_args[0][0]
         assert "error" in message.lower() or "failed" in message.lower()
 
-    async def test_network_error_handling(self, mock_storage, mock_update, mock_context):
+    async def test_network_error_handling(
+        self, bot, patched_fetcher, mock_storage, mock_update, mock_context
+    ):
         """
         GIVEN symbol validation fails due to network error
         WHEN /subscribe is called
         THEN it should handle gracefully with error message
         """
-        from stock_analyzer.bot import TelegramBot
-
         mock_context.args = ["AAPL"]
 
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            MockFetcher.return_value.validate_symbol = AsyncMock(
-                side_effect=Exception("Network error")
-            )
+        patched_fetcher.validate_symbol = AsyncMock(side_effect=Exception("Network error"))
 
-            bot = TelegramBot(storage=mock_storage, token="test-token")
-            await bot.subscribe_command(mock_update, mock_context)
+        await bot.subscribe_command(mock_update, mock_context)
 
         # Should send error message
         mock_update.message.reply_text.assert_called()
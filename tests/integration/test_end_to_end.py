@@ -4,37 +4,70 @@ End-to-end integration test for complete analysis workflow.
 Tests the full pipeline: fetch data → analyze → store → deliver
 """
 
-from datetime import date
+import itertools
+import sqlite3
+from dataclasses import replace
+from datetime import date, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pandas as pd
 import pytest
 
 from stock_analyzer.analyzer import Analyzer
+from stock_analyzer.config import Config
 from stock_analyzer.deliverer import InsightDeliverer
+from stock_analyzer.exceptions import DataFetchError
 from stock_analyzer.fetcher import StockFetcher
 from stock_analyzer.llm_client import ClaudeLLMClient
 from stock_analyzer.models import AnalysisResponse, StockData, User
 from stock_analyzer.storage import Storage
 
+# Returned when a test only checks IDs and relationships, never analysis text
+_TRIVIAL_RESPONSE = AnalysisResponse(
+    text="Analysis",
+    tokens_used=150,
+    model="test",
+    metadata={"source": "test"}
+)
+
+_db_counter = itertools.count()
+
+
+@pytest.fixture(scope="session")
+def _schema_template():
+    """In-memory database with the schema initialised once per session."""
+    db_uri = "file:test_e2e_template?mode=memory&cache=shared"
+    # A shared in-memory database lives only while a connection is open
+    keeper = sqlite3.connect(db_uri, uri=True)
+    Storage(db_uri).init_database()
+    yield keeper
+    keeper.close()
+
 
 @pytest.fixture
-def test_storage(tmp_path):
-    """Create a test database."""
-    db_path = tmp_path / "test_e2e.db"
-    storage = Storage(str(db_path))
-    storage.init_database()
-    return storage
+def test_storage(_schema_template):
+    """Fresh in-memory test database cloned from the schema template."""
+    db_uri = f"file:test_e2e_{next(_db_counter)}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
+    _schema_template.backup(keeper)
+    yield Storage(db_uri)
+    keeper.close()
 
 
 @pytest.fixture
 def mock_llm_client():
     """Mock LLM client."""
     client = MagicMock(spec=ClaudeLLMClient)
+    # Responses are only read by the analyzer, so identical inputs share one instance
+    _cache = {}
 
     async def mock_analyze(prompt, stock_data, system_prompt=None):
+        key = (stock_data.symbol, round(stock_data.price_change_percent, 2), stock_data.volume)
+        if key in _cache:
+            return _cache[key]
+
         volume_str = f"{stock_data.volume:,}" if isinstance(stock_data.volume, (int, float)) else str(stock_data.volume)
-        return AnalysisResponse(
+        _cache[key] = AnalysisResponse(
             text=f"""**Summary:**
 {stock_data.symbol} shows {'positive' if stock_data.price_change_percent > 0 else 'negative'} momentum.
 
@@ -54,51 +87,89 @@ The stock moved {stock_data.price_change_percent:.1f}% with volume at {volume_st
             model="claude-sonnet-4-5",
             metadata={"source": "test"}
         )
+        return _cache[key]
+
+    client.analyze = mock_analyze
+    return client
+
+
+@pytest.fixture
+def minimal_llm_client():
+    """Mock LLM client returning one shared response, for content-agnostic tests."""
+    client = MagicMock(spec=ClaudeLLMClient)
+
+    async def mock_analyze(prompt, stock_data, system_prompt=None):
+        return _TRIVIAL_RESPONSE
 
     client.analyze = mock_analyze
     return client
 
 
+# Fixed per-symbol prices; hash() of a str varies with PYTHONHASHSEED
+_PRICES = {"AAPL": 185.75, "TSLA": 250.0, "MSFT": 380.0, "GOOGL": 140.0}
+
+
 @pytest.fixture
 def mock_fetcher():
     """Mock stock fetcher."""
     fetcher = MagicMock(spec=StockFetcher)
+    # StockData is read-only downstream; build each symbol's data once
+    _cache = {}
+    # Shared price history; each symbol gets a shallow copy with its own Close column
+    template_df = pd.DataFrame({
+        'Close': [0.0, 0.0, 0.0],
+        'Volume': [48000000, 50000000, 52000000],
+    })
 
     async def mock_fetch(symbol, start_date=None, end_date=None):
+        if symbol in _cache:
+            return _cache[symbol]
+
         # Simulate different prices for different symbols
-        base_price = hash(symbol) % 500 + 50
-        return StockData(
+        base_price = _PRICES.get(symbol, 100.0)
+        historical_prices = template_df.copy(deep=False)
+        historical_prices['Close'] = [base_price - 5, base_price - 2, base_price]
+        _cache[symbol] = StockData(
             symbol=symbol,
             current_price=float(base_price),
             price_change_percent=2.3,
             volume=52000000,
-            historical_prices=pd.DataFrame({
-                'Close': [base_price - 5, base_price - 2, base_price],
-                'Volume': [48000000, 50000000, 52000000],
-            }),
+            historical_prices=historical_prices,
             fundamentals={'market_cap': 2800000000000, 'pe_ratio': 28.5},
             metadata={'source': 'yfinance'}
         )
+        return _cache[symbol]
 
     fetcher.fetch_stock_data = mock_fetch
     return fetcher
 
 
+@pytest.fixture(scope="session")
+def today():
+    """Today's date, computed once per test run."""
+    return date.today()
+
+
+@pytest.fixture
+def analyzer(test_storage, mock_llm_client, mock_fetcher):
+    """Analyzer wired to the test database and mocked LLM client and fetcher."""
+    return Analyzer(llm_client=mock_llm_client, fetcher=mock_fetcher, storage=test_storage)
+
+
+@pytest.fixture
+def minimal_analyzer(test_storage, minimal_llm_client, mock_fetcher):
+    """Analyzer whose LLM client returns the shared trivial response."""
+    return Analyzer(llm_client=minimal_llm_client, fetcher=mock_fetcher, storage=test_storage)
+
+
 class TestEndToEndWorkflow:
     """Test complete end-to-end workflow."""
 
     @pytest.mark.asyncio
     async def test_complete_analysis_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer, today
     ):
         """Test complete workflow: fetch → analyze → store."""
-        # Create analyzer
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # Execute analysis
         insight = await analyzer.analyze_stock("AAPL")
 
@@ -111,7 +182,7 @@ class TestEndToEndWorkflow:
         assert len(insight.opportunities) > 0
 
         # Verify data was stored
-        analysis = test_storage.get_analysis("AAPL", date.today())
+        analysis = test_storage.get_analysis("AAPL", today)
         assert analysis is not None
         assert analysis.analysis_status == "success"
 
@@ -121,7 +192,7 @@ class TestEndToEndWorkflow:
 
     @pytest.mark.asyncio
     async def test_subscribe_analyze_deliver_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, minimal_analyzer
     ):
         """Test full user workflow: subscribe → analyze → deliver."""
         # Step 1: User subscribes
@@ -136,12 +207,7 @@ class TestEndToEndWorkflow:
         test_storage.add_subscription(subscription)
 
         # Step 2: Run analysis
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-        insight = await analyzer.analyze_stock("AAPL")
+        insight = await minimal_analyzer.analyze_stock("AAPL")
 
         # Step 3: Prepare for delivery
         assert insight.id is not None  # Should have been saved with ID
@@ -153,7 +219,7 @@ class TestEndToEndWorkflow:
 
     @pytest.mark.asyncio
     async def test_daily_job_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer
     ):
         """Test daily job workflow: get subscriptions → batch analyze → track job."""
         # Setup: Create multiple users with subscriptions
@@ -169,21 +235,16 @@ class TestEndToEndWorkflow:
                 sub = Subscription(user_id=user_id, stock_symbol=symbol)
                 test_storage.add_subscription(sub)
 
-        # Get unique stocks to analyze
+        # Active subscriptions cover exactly the symbols added above
         all_subs = test_storage.get_subscriptions(active_only=True)
-        unique_symbols = list(set(sub.stock_symbol for sub in all_subs))
+        assert {sub.stock_symbol for sub in all_subs} == set(symbols)
+        unique_symbols = symbols
 
         # Create job
         job = test_storage.create_job(stocks_scheduled=len(unique_symbols))
         assert job.job_status == "running"
 
         # Analyze stocks
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         result = await analyzer.analyze_batch(
             unique_symbols,
             parallel=1,
@@ -204,7 +265,7 @@ class TestEndToEndWorkflow:
 
     @pytest.mark.asyncio
     async def test_multiple_users_same_stock(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, minimal_analyzer
     ):
         """Test that same stock is analyzed once for multiple users."""
         # Create multiple users subscribing to same stock
@@ -217,12 +278,7 @@ class TestEndToEndWorkflow:
             test_storage.add_subscription(sub)
 
         # Analyze AAPL once
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-        insight = await analyzer.analyze_stock("AAPL")
+        insight = await minimal_analyzer.analyze_stock("AAPL")
 
         # Verify only one analysis was created
         analyses = test_storage.get_insights("AAPL", limit=10)
@@ -235,34 +291,29 @@ class TestEndToEndWorkflow:
 
     @pytest.mark.asyncio
     async def test_error_handling_in_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, analyzer, mock_fetcher
     ):
         """Test error handling throughout the workflow."""
-        # Mock fetcher to fail
-        from stock_analyzer.exceptions import DataFetchError
+        # Mock fetcher to fail for INVALID, otherwise return a shared template
+        errors = {"INVALID": DataFetchError("INVALID", "Not found", "test")}
+        ok_data = StockData(
+            symbol="",
+            current_price=185.75,
+            price_change_percent=2.3,
+            volume=52000000,
+            historical_prices=pd.DataFrame({'Close': [185.75]}),
+            fundamentals={},
+            metadata={}
+        )
 
         async def mock_fetch_error(symbol, start_date=None, end_date=None):
-            if symbol == "INVALID":
-                raise DataFetchError(symbol, "Not found", "test")
-            # Normal response for valid symbols
-            return StockData(
-                symbol=symbol,
-                current_price=185.75,
-                price_change_percent=2.3,
-                volume=52000000,
-                historical_prices=pd.DataFrame({'Close': [185.75]}),
-                fundamentals={},
-                metadata={}
-            )
+            error = errors.get(symbol)
+            if error is not None:
+                raise error
+            return replace(ok_data, symbol=symbol)
 
         mock_fetcher.fetch_stock_data = mock_fetch_error
 
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # Batch analysis with one invalid symbol
         result = await analyzer.analyze_batch(
             ["AAPL", "INVALID", "TSLA"],
@@ -277,15 +328,9 @@ class TestEndToEndWorkflow:
 
     @pytest.mark.asyncio
     async def test_reanalysis_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, analyzer
     ):
         """Test re-analysis of existing stock."""
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # First analysis
         insight1 = await analyzer.analyze_stock("AAPL")
         assert insight1 is not None
@@ -299,7 +344,7 @@ class TestEndToEndWorkflow:
         assert insight3 is not None
 
     @pytest.mark.asyncio
-    async def test_subscription_limits_workflow(self, test_storage, mock_llm_client, mock_fetcher):
+    async def test_subscription_limits_workflow(self, test_storage, analyzer):
         """Test subscription limit enforcement in workflow."""
         # Create user
         user = User(user_id="test_user")
@@ -318,12 +363,6 @@ class TestEndToEndWorkflow:
             test_storage.add_subscription(sub)
 
         # Verify we can still analyze existing subscriptions
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         subs = test_storage.get_subscriptions(user_id="test_user")
         symbols = [s.stock_symbol for s in subs[:3]]  # Just test first 3
 
@@ -336,15 +375,9 @@ class TestWorkflowPerformance:
 
     @pytest.mark.asyncio
     async def test_batch_analysis_faster_than_sequential(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, analyzer
     ):
         """Test that batch analysis with parallel=2 is implemented."""
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         symbols = ["AAPL", "TSLA", "MSFT", "GOOGL"]
 
         # This should use parallel execution
@@ -359,19 +392,13 @@ class TestWorkflowDataIntegrity:
 
     @pytest.mark.asyncio
     async def test_analysis_creates_complete_records(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer, today
     ):
         """Test that analysis creates complete, linked records."""
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         insight = await analyzer.analyze_stock("AAPL")
 
         # Verify StockAnalysis record
-        analysis = test_storage.get_analysis("AAPL", date.today())
+        analysis = test_storage.get_analysis("AAPL", today)
         assert analysis is not None
         assert analysis.stock_symbol == "AAPL"
         assert analysis.analysis_status == "success"
@@ -385,7 +412,7 @@ class TestWorkflowDataIntegrity:
 
     @pytest.mark.asyncio
     async def test_foreign_key_relationships(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, minimal_analyzer
     ):
         """Test that foreign key relationships are maintained."""
         # Create user and subscription
@@ -397,12 +424,7 @@ class TestWorkflowDataIntegrity:
         test_storage.add_subscription(sub)
 
         # Create analysis
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-        insight = await analyzer.analyze_stock("AAPL")
+        insight = await minimal_analyzer.analyze_stock("AAPL")
 
         # Verify relationships
         user_subs = test_storage.get_subscriptions(user_id="test_user")
@@ -419,7 +441,7 @@ class TestPersonalUseWorkflow:
 
     @pytest.mark.asyncio
     async def test_daily_job_reads_stock_list_from_env(
-        self, test_storage, mock_llm_client, mock_fetcher, monkeypatch
+        self, test_storage, analyzer, today, monkeypatch
     ):
         """Test daily job workflow using stock list from environment variables."""
         # Set up environment with stock list
@@ -429,7 +451,6 @@ class TestPersonalUseWorkflow:
         monkeypatch.setenv("STOCK_ANALYZER_TELEGRAM_TOKEN", "test-token")
 
         # Load config from env
-        from stock_analyzer.config import Config
         with patch("stock_analyzer.config.load_dotenv"):
             config = Config.from_env()
 
@@ -444,12 +465,6 @@ class TestPersonalUseWorkflow:
         assert job.stocks_scheduled == 3
 
         # Analyze all stocks from config
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         result = await analyzer.analyze_batch(
             symbols,
             parallel=1,
@@ -478,13 +493,13 @@ class TestPersonalUseWorkflow:
 
         # Verify analyses were stored
         for symbol in symbols:
-            analysis = test_storage.get_analysis(symbol, date.today())
+            analysis = test_storage.get_analysis(symbol, today)
             assert analysis is not None
             assert analysis.analysis_status == "success"
 
     @pytest.mark.asyncio
     async def test_daily_job_handles_invalid_symbols(
-        self, test_storage, mock_llm_client, mock_fetcher, monkeypatch
+        self, test_storage, analyzer, mock_fetcher, today, monkeypatch
     ):
         """Test daily job workflow handles invalid stock symbols gracefully."""
         # Set up environment with mixed valid/invalid symbols
@@ -494,8 +509,6 @@ class TestPersonalUseWorkflow:
         monkeypatch.setenv("STOCK_ANALYZER_TELEGRAM_TOKEN", "test-token")
 
         # Mock fetcher to fail for invalid symbols
-        from stock_analyzer.exceptions import DataFetchError
-
         original_fetch = mock_fetcher.fetch_stock_data
 
         async def mock_fetch_with_errors(symbol, start_date=None, end_date=None):
@@ -506,7 +519,6 @@ class TestPersonalUseWorkflow:
         mock_fetcher.fetch_stock_data = mock_fetch_with_errors
 
         # Load config
-        from stock_analyzer.config import Config
         with patch("stock_analyzer.config.load_dotenv"):
             config = Config.from_env()
 
@@ -517,12 +529,6 @@ class TestPersonalUseWorkflow:
         job = test_storage.create_job(stocks_scheduled=len(symbols))
 
         # Analyze with continue_on_error=True
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         result = await analyzer.analyze_batch(
             symbols,
             parallel=1,
@@ -551,7 +557,7 @@ class TestPersonalUseWorkflow:
         assert len(msft_insights) == 1
 
         # Verify failed analyses recorded errors
-        invalid_analysis = test_storage.get_analysis("INVALID", date.today())
+        invalid_analysis = test_storage.get_analysis("INVALID", today)
         if invalid_analysis:  # May be None if fetch failed before storage
             assert invalid_analysis.analysis_status == "failed"
             assert invalid_analysis.error_message is not None
@@ -562,19 +568,11 @@ class TestHistoricalQueryWorkflow:
 
     @pytest.mark.asyncio
     async def test_complete_historical_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer, today
     ):
         """Test complete workflow: analyze multiple days → query history."""
-        from datetime import timedelta
-
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # Simulate 5 days of analysis for AAPL
-        base_date = date.today() - timedelta(days=4)
+        base_date = today - timedelta(days=4)
         for i in range(5):
             analysis_date = base_date + timedelta(days=i)
 
@@ -594,17 +592,9 @@ class TestHistoricalQueryWorkflow:
 
     @pytest.mark.asyncio
     async def test_historical_query_with_date_range(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer
     ):
         """Test querying historical data with date range filter."""
-        from datetime import timedelta
-
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # Analyze 10 days of data
         base_date = date(2026, 1, 10)
         for i in range(10):
@@ -631,19 +621,11 @@ class TestHistoricalQueryWorkflow:
 
     @pytest.mark.asyncio
     async def test_historical_pagination_workflow(
-        self, test_storage, mock_llm_client, mock_fetcher
+        self, test_storage, analyzer, today
     ):
         """Test pagination of historical insights."""
-        from datetime import timedelta
-
-        analyzer = Analyzer(
-            llm_client=mock_llm_client,
-            fetcher=mock_fetcher,
-            storage=test_storage
-        )
-
         # Analyze 20 days of data
-        base_date = date.today() - timedelta(days=19)
+        base_date = today - timedelta(days=19)
         for i in range(20):
             analysis_date = base_date + timedelta(days=i)
             await analyzer.analyze_stock("GOOGL", date=analysis_date, force=True)
@@ -5,7 +5,11 @@ Tests integration with LLM APIs using mocked responses.
 Verifies that clients correctly handle real-world API response formats.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from dataclasses import replace
+from operator import attrgetter
+from types import SimpleNamespace as NS
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 import pytest
@@ -19,9 +23,50 @@ from stock_analyzer.llm_client import (
 from stock_analyzer.models import AnalysisResponse, StockData
 
 
-@pytest.fixture
-def sample_stock_data():
-    """Create sample stock data for testing."""
+def _claude_resp(text, in_t=100, out_t=50, cache_r=0):
+    """Build a stub Anthropic messages response."""
+    return NS(
+        content=[NS(text=text)],
+        usage=NS(input_tokens=in_t, output_tokens=out_t, cache_read_input_tokens=cache_r),
+    )
+
+
+def _openai_resp(text, total=150, finish='stop', prompt=100, completion=50):
+    """Build a stub OpenAI chat completion response."""
+    return NS(
+        choices=[NS(message=NS(content=text), finish_reason=finish)],
+        usage=NS(total_tokens=total, prompt_tokens=prompt, completion_tokens=completion),
+    )
+
+
+def _gemini_resp(text, total=100, prompt=80, candidates=20):
+    """Build a stub Gemini generate_content response."""
+    return NS(
+        text=text,
+        usage_metadata=NS(
+            total_token_count=total,
+            prompt_token_count=prompt,
+            candidates_token_count=candidates,
+        ),
+    )
+
+
+def _async_return(value):
+    """Build a plain coroutine function returning value, for patches never inspected."""
+    async def _return(*args, **kwargs):
+        return value
+    return _return
+
+
+# Shared responses for tests that only inspect the outgoing request
+_MINIMAL_CLAUDE_RESP = _claude_resp("", in_t=0, out_t=0)
+_MINIMAL_OPENAI_RESP = _openai_resp("", total=0, prompt=0, completion=0)
+_MINIMAL_GEMINI_RESP = _gemini_resp("", total=0, prompt=0, candidates=0)
+
+
+@functools.lru_cache(maxsize=1)
+def _base_stock_data():
+    """Build the sample stock data once per process."""
     return StockData(
         symbol="AAPL",
         current_price=185.75,
@@ -41,22 +86,55 @@ def sample_stock_data():
     )
 
 
+@pytest.fixture
+def sample_stock_data():
+    """Sample stock data with its own dicts, so mutations cannot leak between tests."""
+    base = _base_stock_data()
+    return replace(base, fundamentals=dict(base.fundamentals), metadata=dict(base.metadata))
+
+
+# Clients are shared per test class; SDK calls are patched per test, so no state leaks
+@pytest.fixture(scope="class")
+def claude_client():
+    """Claude client shared by a test class."""
+    return ClaudeLLMClient(
+        api_key="test-key",
+        model="claude-sonnet-4-5",
+        enable_caching=True
+    )
+
+
+@pytest.fixture(scope="class")
+def openai_client():
+    """OpenAI client shared by a test class."""
+    return OpenAILLMClient(
+        api_key="test-key",
+        model="gpt-4o",
+        temperature=0.7
+    )
+
+
+@pytest.fixture(scope="class")
+def gemini_client():
+    """Gemini client shared by a test class."""
+    return GeminiLLMClient(
+        api_key="test-key",
+        model="gemini-2.5-pro",
+        temperature=0.7
+    )
+
+
 class TestClaudeIntegration:
     """Test Anthropic Claude API integration."""
 
     @pytest.mark.asyncio
-    async def test_claude_successful_analysis(self, sample_stock_data):
+    async def test_claude_successful_analysis(self, claude_client, sample_stock_data):
         """Test successful analysis with Claude."""
-        client = ClaudeLLMClient(
-            api_key="test-key",
-            model="claude-sonnet-4-5",
-            enable_caching=True
-        )
+        client = claude_client
 
         # Mock realistic Claude response
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(
-            text="""Apple Inc. (AAPL) shows strong bullish momentum with a 2.3% gain.
+        mock_response = _claude_resp(
+            """Apple Inc. (AAPL) shows strong bullish momentum with a 2.3% gain.
 
 **Trend Analysis:**
 The stock has demonstrated consistent upward movement over the past three trading days,
@@ -71,16 +149,13 @@ continued positive sentiment.
 **Opportunities:**
 - Strong product pipeline for Q2 launch
 - Expanding services segment showing 15% YoY growth
-- Strategic positioning in AI and wearables market"""
-        )]
-        mock_response.usage = MagicMock(
-            input_tokens=1200,
-            output_tokens=350,
-            cache_read_input_tokens=800,  # Cached tokens
+- Strategic positioning in AI and wearables market""",
+            in_t=1200,
+            out_t=350,
+            cache_r=800,  # Cached tokens
         )
 
-        with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = mock_response
+        with patch.object(client.client.messages, 'create', _async_return(mock_response)):
 
             response = await client.analyze(
                 prompt="Provide a detailed analysis of AAPL stock based on the provided data.",
@@ -103,23 +178,12 @@ continued positive sentiment.
             ])
 
     @pytest.mark.asyncio
-    async def test_claude_with_prompt_caching(self, sample_stock_data):
+    async def test_claude_with_prompt_caching(self, claude_client, sample_stock_data):
         """Test that prompt caching is properly configured."""
-        client = ClaudeLLMClient(
-            api_key="test-key",
-            enable_caching=True
-        )
-
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="Analysis text")]
-        mock_response.usage = MagicMock(
-            input_tokens=100,
-            output_tokens=50,
-            cache_read_input_tokens=80
-        )
+        client = claude_client
 
         with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = mock_response
+            mock_create.return_value = _MINIMAL_CLAUDE_RESP
 
             await client.analyze(
                 prompt="Analyze",
@@ -139,9 +203,9 @@ continued positive sentiment.
                 assert has_cache_control
 
     @pytest.mark.asyncio
-    async def test_claude_handles_api_errors(self, sample_stock_data):
+    async def test_claude_handles_api_errors(self, claude_client, sample_stock_data):
         """Test Claude error handling."""
-        client = ClaudeLLMClient(api_key="test-key")
+        client = claude_client
 
         with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.side_effect = Exception("API Error: Rate limit exceeded")
@@ -157,19 +221,13 @@ class TestOpenAIIntegration:
     """Test OpenAI API integration."""
 
     @pytest.mark.asyncio
-    async def test_openai_successful_analysis(self, sample_stock_data):
+    async def test_openai_successful_analysis(self, openai_client, sample_stock_data):
         """Test successful analysis with OpenAI."""
-        client = OpenAILLMClient(
-            api_key="test-key",
-            model="gpt-4o",
-            temperature=0.7
-        )
+        client = openai_client
 
         # Mock realistic OpenAI response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(
-            message=MagicMock(
-                content="""AAPL Analysis Summary:
+        mock_response = _openai_resp(
+            """AAPL Analysis Summary:
 
 Apple stock demonstrates positive momentum with 2.3% daily gain and strong volume.
 
@@ -186,18 +244,13 @@ Risk Assessment:
 Investment Outlook:
 - Services revenue growth remains strong catalyst
 - Product innovation pipeline supports valuation
-- Consider entry points on minor pullbacks"""
-            ),
-            finish_reason='stop'
-        )]
-        mock_response.usage = MagicMock(
-            prompt_tokens=1100,
-            completion_tokens=200,
-            total_tokens=1300
+- Consider entry points on minor pullbacks""",
+            total=1300,
+            prompt=1100,
+            completion=200,
         )
 
-        with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = mock_response
+        with patch.object(client.client.chat.completions, 'create', _async_return(mock_response)):
 
             response = await client.analyze(
                 prompt="Analyze AAPL stock",
@@ -220,19 +273,8 @@ Investment Outlook:
             temperature=0.3
         )
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(
-            message=MagicMock(content="Analysis"),
-            finish_reason='stop'
-        )]
-        mock_response.usage = MagicMock(
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150
-        )
-
         with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = mock_response
+            mock_create.return_value = _MINIMAL_OPENAI_RESP
 
             await client.analyze("Test", sample_stock_data)
 
@@ -241,19 +283,13 @@ Investment Outlook:
             assert call_kwargs.get('temperature') == 0.3
 
     @pytest.mark.asyncio
-    async def test_openai_handles_content_filter(self, sample_stock_data):
+    async def test_openai_handles_content_filter(self, openai_client, sample_stock_data):
         """Test handling of content filter responses."""
-        client = OpenAILLMClient(api_key="test-key")
+        client = openai_client
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(
-            message=MagicMock(content=None),
-            finish_reason='content_filter'
-        )]
-        mock_response.usage = MagicMock(total_tokens=50)
+        mock_response = _openai_resp(None, total=50, finish='content_filter')
 
-        with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
-            mock_create.return_value = mock_response
+        with patch.object(client.client.chat.completions, 'create', _async_return(mock_response)):
 
             # Should handle gracefully (though content might be None)
             response = await client.analyze("Test", sample_stock_data)
@@ -264,17 +300,13 @@ class TestGeminiIntegration:
     """Test Google Gemini API integration."""
 
     @pytest.mark.asyncio
-    async def test_gemini_successful_analysis(self, sample_stock_data):
+    async def test_gemini_successful_analysis(self, gemini_client, sample_stock_data):
         """Test successful analysis with Gemini."""
-        client = GeminiLLMClient(
-            api_key="test-key",
-            model="gemini-2.5-pro",
-            temperature=0.7
-        )
+        client = gemini_client
 
         # Mock realistic Gemini response
-        mock_response = MagicMock()
-        mock_response.text = """## AAPL Stock Analysis
+        mock_response = _gemini_resp(
+            """## AAPL Stock Analysis
 
 **Current Status:** Apple stock shows bullish momentum with +2.3% gain
 
@@ -292,16 +324,13 @@ demonstrating consistent buyer support. Volume expansion (48M to 52M) confirms g
 2. Services segment high-margin growth
 3. Emerging market expansion potential
 
-**Recommendation:** Maintain position with profit-taking levels at $190"""
-
-        mock_response.usage_metadata = MagicMock(
-            prompt_token_count=900,
-            candidates_token_count=180,
-            total_token_count=1080
+**Recommendation:** Maintain position with profit-taking levels at $190""",
+            total=1080,
+            prompt=900,
+            candidates=180,
         )
 
-        with patch.object(client.model, 'generate_content_async', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = mock_response
+        with patch.object(client.model, 'generate_content_async', _async_return(mock_response)):
 
             response = await client.analyze(
                 prompt="Analyze AAPL",
@@ -316,16 +345,12 @@ demonstrating consistent buyer support. Volume expansion (48M to 52M) confirms g
             assert 'prompt_tokens' in response.metadata
 
     @pytest.mark.asyncio
-    async def test_gemini_combines_prompts(self, sample_stock_data):
+    async def test_gemini_combines_prompts(self, gemini_client, sample_stock_data):
         """Test that Gemini combines system and user prompts."""
-        client = GeminiLLMClient(api_key="test-key")
-
-        mock_response = MagicMock()
-        mock_response.text = "Analysis"
-        mock_response.usage_metadata = MagicMock(total_token_count=100)
+        client = gemini_client
 
         with patch.object(client.model, 'generate_content_async', new_callable=AsyncMock) as mock_generate:
-            mock_generate.return_value = mock_response
+            mock_generate.return_value = _MINIMAL_GEMINI_RESP
 
             await client.analyze(
                 prompt="User instruction",
@@ -340,74 +365,52 @@ demonstrating consistent buyer support. Volume expansion (48M to 52M) confirms g
             assert "User instruction" in combined_prompt
 
 
+# (client class, object owning the SDK call, SDK method name, response builder)
+_PROVIDERS = [
+    pytest.param(ClaudeLLMClient, "client.messages", "create", _claude_resp, id="claude"),
+    pytest.param(
+        OpenAILLMClient, "client.chat.completions", "create", _openai_resp, id="openai"
+    ),
+    pytest.param(
+        GeminiLLMClient, "model", "generate_content_async", _gemini_resp, id="gemini"
+    ),
+]
+
+
 class TestCrossProviderConsistency:
     """Test consistency across different LLM providers."""
 
     @pytest.mark.asyncio
-    async def test_all_providers_return_valid_response(self, sample_stock_data):
-        """Test that all providers return valid AnalysisResponse."""
-        # Claude
-        claude_client = ClaudeLLMClient(api_key="test-key")
-        claude_mock = MagicMock()
-        claude_mock.content = [MagicMock(text="Claude analysis")]
-        claude_mock.usage = MagicMock(input_tokens=100, output_tokens=50)
-
-        with patch.object(claude_client.client.messages, 'create', new_callable=AsyncMock, return_value=claude_mock):
-            claude_response = await claude_client.analyze("Test", sample_stock_data)
-            assert isinstance(claude_response, AnalysisResponse)
-            assert claude_response.text
-            assert claude_response.tokens_used > 0
-
-        # OpenAI
-        openai_client = OpenAILLMClient(api_key="test-key")
-        openai_mock = MagicMock()
-        openai_mock.choices = [MagicMock(message=MagicMock(content="OpenAI analysis"), finish_reason='stop')]
-        openai_mock.usage = MagicMock(total_tokens=150)
-
-        with patch.object(openai_client.client.chat.completions, 'create', new_callable=AsyncMock, return_value=openai_mock):
-            openai_response = await openai_client.analyze("Test", sample_stock_data)
-            assert isinstance(openai_response, AnalysisResponse)
-            assert openai_response.text
-            assert openai_response.tokens_used > 0
-
-        # Gemini
-        gemini_client = GeminiLLMClient(api_key="test-key")
-        gemini_mock = MagicMock()
-        gemini_mock.text = "Gemini analysis"
-        gemini_mock.usage_metadata = MagicMock(total_token_count=120)
-
-        with patch.object(gemini_client.model, 'generate_content_async', new_callable=AsyncMock, return_value=gemini_mock):
-            gemini_response = await gemini_client.analyze("Test", sample_stock_data)
-            assert isinstance(gemini_response, AnalysisResponse)
-            assert gemini_response.text
-            assert gemini_response.tokens_used > 0
+    @pytest.mark.parametrize("client_cls, owner_path, method, build_resp", _PROVIDERS)
+    async def test_provider_returns_valid_response(
+        self, client_cls, owner_path, method, build_resp, sample_stock_data
+    ):
+        """Test that every provider returns a valid AnalysisResponse."""
+        client = client_cls(api_key="test-key")
+        owner = attrgetter(owner_path)(client)
+
+        with patch.object(owner, method, _async_return(build_resp("Provider analysis"))):
+            response = await client.analyze("Test", sample_stock_data)
+
+        assert isinstance(response, AnalysisResponse)
+        assert response.text
+        assert response.tokens_used > 0
 
 
 class TestErrorRecovery:
     """Test error handling and recovery across providers."""
 
     @pytest.mark.asyncio
-    async def test_all_providers_raise_analysis_error(self, sample_stock_data):
-        """Test that all providers properly raise AnalysisError on failure."""
-        providers = [
-            ClaudeLLMClient(api_key="test-key"),
-            OpenAILLMClient(api_key="test-key"),
-            GeminiLLMClient(api_key="test-key"),
-        ]
-
-        for client in providers:
-            # Mock to raise exception
-            if isinstance(client, ClaudeLLMClient):
-                with patch.object(client.client.messages, 'create', new_callable=AsyncMock, side_effect=Exception("API Error")):
-                    with pytest.raises(AnalysisError):
-                        await client.analyze("Test", sample_stock_data)
-
-            elif isinstance(client, OpenAILLMClient):
-                with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock, side_effect=Exception("API Error")):
-                    with pytest.raises(AnalysisError):
-                        await client.analyze("Test", sample_stock_data)
-
-            elif isinstance(client, GeminiLLMClient):
-                with patch.object(client.model, 'generate_content_async', new_callable=AsyncMock, side_effect=Exception("API Error")):
-                    with pytest.raises(AnalysisError):
-                        await client.analyze("Test", sample_stock_data)
+    @pytest.mark.parametrize("client_cls, owner_path, method, build_resp", _PROVIDERS)
+    async def test_provider_raises_analysis_error(
+        self, client_cls, owner_path, method, build_resp, sample_stock_data
+    ):
+        """Test that every provider raises AnalysisError on failure."""
+        client = client_cls(api_key="test-key")
+        owner = attrgetter(owner_path)(client)
+
+        with patch.object(
+            owner, method, new_callable=AsyncMock, side_effect=Exception("API Error")
+        ):
+            with pytest.raises(AnalysisError):
+                await client.analyze("Test", sample_stock_data)
@@ -5,89 +5,153 @@ Tests integration with external stock data APIs using mocked responses.
 These tests verify that the fetcher correctly handles real-world API response formats.
 """
 
+from dataclasses import dataclass
 from datetime import date, timedelta
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Any, Mapping
+from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from stock_analyzer.exceptions import DataFetchError, InvalidSymbolError
 from stock_analyzer.fetcher import StockFetcher
 from stock_analyzer.models import StockData
 
-
-@pytest.fixture
-def realistic_yfinance_response():
+# Trading calendar shared by the fixtures: 30 days ending today, oldest first
+_DATES = pd.date_range(end=pd.Timestamp(date.today()), periods=30, freq='D')
+_ISO = _DATES.strftime('%Y-%m-%d').tolist()
+
+# Realistic info dict structure from yfinance; read-only, copy before mutating
+_INFO_TEMPLATE = MappingProxyType({
+    'symbol': 'AAPL',
+    'shortName': 'Apple Inc.',
+    'longName': 'Apple Inc.',
+    'currency': 'USD',
+    'exchange': 'NASDAQ',
+    'quoteType': 'EQUITY',
+    'regularMarketPrice': 185.75,
+    'regularMarketDayHigh': 187.50,
+    'regularMarketDayLow': 184.00,
+    'regularMarketVolume': 52000000,
+    'regularMarketPreviousClose': 181.60,
+    'regularMarketChangePercent': 2.28,
+    'marketCap': 2850000000000,
+    'trailingPE': 28.45,
+    'forwardPE': 25.18,
+    'dividendYield': 0.0045,
+    'beta': 1.25,
+    'fiftyTwoWeekHigh': 198.23,
+    'fiftyTwoWeekLow': 164.08,
+    'fiftyDayAverage': 182.34,
+    'twoHundredDayAverage': 175.89,
+    'sector': 'Technology',
+    'industry': 'Consumer Electronics',
+    'fullTimeEmployees': 164000,
+    'website': 'https://www.apple.com',
+})
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response returning a fixed JSON payload."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self, **_):
+        return self._payload
+
+    def raise_for_status(self):
+        return None
+
+
+class _FakeSession:
+    """Minimal stand-in for aiohttp.ClientSession serving one payload."""
+
+    closed = False
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def get(self, url, **kwargs):
+        return _FakeResponse(self._payload)
+
+
+@pytest.fixture(scope="session")
+def yfinance_history():
     """
-    Create a realistic yfinance response based on actual API structure.
+    Build the realistic yfinance price history once per session (read-only).
     """
-    mock_ticker = MagicMock()
-
-    # Realistic info dict structure from yfinance
-    mock_ticker.info = {
-        'symbol': 'AAPL',
-        'shortName': 'Apple Inc.',
-        'longName': 'Apple Inc.',
-        'currency': 'USD',
-        'exchange': 'NASDAQ',
-        'quoteType': 'EQUITY',
-        'regularMarketPrice': 185.75,
-        'regularMarketDayHigh': 187.50,
-        'regularMarketDayLow': 184.00,
-        'regularMarketVolume': 52000000,
-        'regularMarketPreviousClose': 181.60,
-        'regularMarketChangePercent': 2.28,
-        'marketCap': 2850000000000,
-        'trailingPE': 28.45,
-        'forwardPE': 25.18,
-        'dividendYield': 0.0045,
-        'beta': 1.25,
-        'fiftyTwoWeekHigh': 198.23,
-        'fiftyTwoWeekLow': 164.08,
-        'fiftyDayAverage': 182.34,
-        'twoHundredDayAverage': 175.89,
-        'sector': 'Technology',
-        'industry': 'Consumer Electronics',
-        'fullTimeEmployees': 164000,
-        'website': 'https://www.apple.com',
-    }
+    # OHLC as one contiguous float64 block (rows: days, cols: O/H/L/C), wrapped
+    # without copying; Volume stays int64 in its own block
+    half = np.arange(30, dtype=np.float64) * 0.5
+    ohlc = np.ascontiguousarray(np.add.outer(half, [180.0, 182.0, 179.0, 181.0]))
+    mock_history = pd.DataFrame(
+        ohlc, index=_DATES, columns=['Open', 'High', 'Low', 'Close'], copy=False
+    )
+    mock_history['Volume'] = 48_000_000 + np.arange(30, dtype=np.int64) * 100_000
+
+    return mock_history
 
-    # Realistic historical data
-    dates = pd.date_range(end=date.today(), periods=30, freq='D')
-    mock_history = pd.DataFrame({
-        'Open': [180 + i * 0.5 for i in range(30)],
-        'High': [182 + i * 0.5 for i in range(30)],
-        'Low': [179 + i * 0.5 for i in range(30)],
-        'Close': [181 + i * 0.5 for i in range(30)],
-        'Volume': [48000000 + i * 100000 for i in range(30)],
-    }, index=dates)
 
-    mock_ticker.history.return_value = mock_history
+@dataclass(slots=True)
+class RealisticTicker:
+    """Stand-in for yfinance.Ticker with canned info and history."""
 
-    return mock_ticker
+    info: Mapping[str, Any]
+    history_df: pd.DataFrame
+
+    def history(self, **_):
+        return self.history_df
 
 
 @pytest.fixture
-def realistic_alpha_vantage_response():
+def realistic_yfinance_response(yfinance_history):
     """
-    Create a realistic Alpha Vantage API response.
+    Create a realistic yfinance response based on actual API structure.
+
+    Each test gets its own ticker stub. ``info`` is the shared read-only
+    template; tests that need different info assign a modified copy.
     """
-    dates = [date.today() - timedelta(days=i) for i in range(30)]
-
-    time_series = {}
-    for i, d in enumerate(dates):
-        time_series[d.isoformat()] = {
-            '1. open': str(180.0 + i * 0.5),
-            '2. high': str(182.0 + i * 0.5),
-            '3. low': str(179.0 + i * 0.5),
-            '4. close': str(181.0 + i * 0.5),
-            '5. volume': str(48000000 + i * 100000),
+    return RealisticTicker(info=_INFO_TEMPLATE, history_df=yfinance_history)
+
+
+def _build_av_payload():
+    """Create a realistic Alpha Vantage daily time series payload."""
+    # Alpha Vantage lists the most recent day first and sends values as strings
+    i = np.arange(30)
+    half = i * 0.5
+    opens = (180.0 + half).astype(str)
+    highs = (182.0 + half).astype(str)
+    lows = (179.0 + half).astype(str)
+    closes = (181.0 + half).astype(str)
+    volumes = (48_000_000 + i * 100_000).astype(str)
+
+    time_series = {
+        iso: {
+            '1. open': open_,
+            '2. high': high,
+            '3. low': low,
+            '4. close': close,
+            '5. volume': volume,
         }
+        for iso, open_, high, low, close, volume in zip(
+            reversed(_ISO), opens, highs, lows, closes, volumes
+        )
+    }
 
     return {
         'Meta Data': {
             '1. Information': 'Daily Prices (open, high, low, close) and Volumes',
             '2. Symbol': 'AAPL',
-            '3. Last Refreshed': date.today().isoformat(),
+            '3. Last Refreshed': _ISO[-1],
             '4. Output Size': 'Full size',
             '5. Time Zone': 'US/Eastern',
         },
@@ -95,6 +159,20 @@ def realistic_alpha_vantage_response():
     }
 
 
+# Built once at import; tests needing a variant copy it, e.g. {**_AV_PAYLOAD, ...}
+_AV_PAYLOAD = _build_av_payload()
+
+
+@pytest.fixture
+def realistic_alpha_vantage_response():
+    """
+    Realistic Alpha Vantage API response.
+
+    Shared across tests; do not mutate it.
+    """
+    return _AV_PAYLOAD
+
+
 class TestYFinanceIntegration:
     """Test integration with yfinance API."""
 
@@ -146,20 +224,6 @@ class TestYFinanceIntegration:
             assert isinstance(stock_data, StockData)
             assert stock_data.symbol == "AAPL"
 
-    @pytest.mark.asyncio
-    async def test_handles_market_closed(self, realistic_yfinance_response):
-        """Test handling when market is closed (uses last close price)."""
-        # Remove regularMarketPrice to simulate market closed
-        realistic_yfinance_response.info.pop('regularMarketPrice', None)
-
-        fetcher = StockFetcher()
-
-        with patch('yfinance.Ticker', return_value=realistic_yfinance_response):
-            stock_data = await fetcher.fetch_stock_data("AAPL")
-
-            # Should use last close price from history
-            assert stock_data.current_price > 0
-
 
 class TestAlphaVantageIntegration:
     """Test integration with Alpha Vantage API."""
@@ -169,49 +233,39 @@ class TestAlphaVantageIntegration:
         """Test fetching data from Alpha Vantage."""
         fetcher = StockFetcher(
             primary_provider="alpha_vantage",
-            api_key="test_key"
+            api_key="test_key",
+            session=_FakeSession(realistic_alpha_vantage_response),
         )
 
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = realistic_alpha_vantage_response
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        stock_data = await fetcher.fetch_stock_data("AAPL")
 
-            stock_data = await fetcher.fetch_stock_data("AAPL")
+        # Verify data structure
+        assert stock_data.symbol == "AAPL"
+        assert stock_data.current_price > 0
+        assert stock_data.volume > 0
 
-            # Verify data structure
-            assert stock_data.symbol == "AAPL"
-            assert stock_data.current_price > 0
-            assert stock_data.volume > 0
+        # Verify historical data
+        assert not stock_data.historical_prices.empty
+        assert 'Open' in stock_data.historical_prices.columns
 
-            # Verify historical data
-            assert not stock_data.historical_prices.empty
-            assert 'Open' in stock_data.historical_prices.columns
-
-            # Verify metadata
-            assert stock_data.metadata['source'] == 'alpha_vantage'
+        # Verify metadata
+        assert stock_data.metadata['source'] == 'alpha_vantage'
 
     @pytest.mark.asyncio
     async def test_alpha_vantage_error_messages(self):
         """Test handling various Alpha Vantage error responses."""
-        fetcher = StockFetcher(
-            primary_provider="alpha_vantage",
-            api_key="test_key"
-        )
-
         # Test error message response
         error_response = {
             'Error Message': 'Invalid API call. Please retry or visit the documentation.'
         }
+        fetcher = StockFetcher(
+            primary_provider="alpha_vantage",
+            api_key="test_key",
+            session=_FakeSession(error_response),
+        )
 
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = error_response
-            mock_get.return_value = mock_response
-
-            with pytest.raises(Exception):  # Should raise InvalidSymbolError
-                await fetcher.fetch_stock_data("INVALID")
+        with pytest.raises(InvalidSymbolError):
+            await fetcher.fetch_stock_data("INVALID")
 
 
 class TestFallbackBehavior:
@@ -225,22 +279,17 @@ class TestFallbackBehavior:
         fetcher = StockFetcher(
             primary_provider="yfinance",
             backup_provider="alpha_vantage",
-            api_key="test_key"
+            api_key="test_key",
+            session=_FakeSession(realistic_alpha_vantage_response),
         )
 
         # Make yfinance fail
         with patch('yfinance.Ticker', side_effect=Exception("yfinance down")):
-            with patch('requests.get') as mock_get:
-                mock_response = MagicMock()
-                mock_response.json.return_value = realistic_alpha_vantage_response
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                stock_data = await fetcher.fetch_stock_data("AAPL")
+            stock_data = await fetcher.fetch_stock_data("AAPL")
 
-                # Should successfully get data from Alpha Vantage
-                assert stock_data.symbol == "AAPL"
-                assert stock_data.metadata['source'] == 'alpha_vantage'
+            # Should successfully get data from Alpha Vantage
+            assert stock_data.symbol == "AAPL"
+            assert stock_data.metadata['source'] == 'alpha_vantage'
 
     @pytest.mark.asyncio
     async def test_no_fallback_when_disabled(self):
@@ -251,7 +300,7 @@ class TestFallbackBehavior:
         )
 
         with patch('yfinance.Ticker', side_effect=Exception("yfinance down")):
-            with pytest.raises(Exception):  # Should raise DataFetchError
+            with pytest.raises(DataFetchError):
                 await fetcher.fetch_stock_data("AAPL")
 
 
@@ -259,48 +308,47 @@ class TestRealWorldScenarios:
     """Test real-world edge cases and scenarios."""
 
     @pytest.mark.asyncio
-    async def test_penny_stock_with_low_volume(self, realistic_yfinance_response):
-        """Test fetching data for penny stock with low trading volume."""
-        # Modify to simulate penny stock
-        realistic_yfinance_response.info['regularMarketPrice'] = 0.25
-        realistic_yfinance_response.info['regularMarketVolume'] = 5000
-
-        fetcher = StockFetcher()
-
-        with patch('yfinance.Ticker', return_value=realistic_yfinance_response):
-            stock_data = await fetcher.fetch_stock_data("PENNY")
-
-            assert stock_data.current_price == 0.25
-            assert stock_data.volume == 5000
-
-    @pytest.mark.asyncio
-    async def test_international_stock(self, realistic_yfinance_response):
-        """Test fetching data for international stock."""
-        # Modify for international stock
-        realistic_yfinance_response.info['symbol'] = 'TSM'
-        realistic_yfinance_response.info['currency'] = 'TWD'
-        realistic_yfinance_response.info['exchange'] = 'Taiwan Stock Exchange'
-
-        fetcher = StockFetcher()
-
-        with patch('yfinance.Ticker', return_value=realistic_yfinance_response):
-            stock_data = await fetcher.fetch_stock_data("TSM")
-
-            assert stock_data.symbol == "TSM"
-
-    @pytest.mark.asyncio
-    async def test_etf_data(self, realistic_yfinance_response):
-        """Test fetching data for ETF."""
-        # Modify for ETF
-        realistic_yfinance_response.info['quoteType'] = 'ETF'
-        realistic_yfinance_response.info['shortName'] = 'SPDR S&P 500 ETF Trust'
+    @pytest.mark.parametrize(
+        "symbol, info_updates, info_removed, expected",
+        [
+            # Market closed: no live price, falls back to last close from history
+            ("AAPL", {}, ("regularMarketPrice",), {}),
+            # Penny stock with low trading volume
+            (
+                "PENNY",
+                {'regularMarketPrice': 0.25, 'regularMarketVolume': 5000},
+                (),
+                {'current_price': 0.25, 'volume': 5000},
+            ),
+            # International listing
+            (
+                "TSM",
+                {'symbol': 'TSM', 'currency': 'TWD', 'exchange': 'Taiwan Stock Exchange'},
+                (),
+                {'symbol': 'TSM'},
+            ),
+            # ETF rather than a single equity
+            ("SPY", {'quoteType': 'ETF', 'shortName': 'SPDR S&P 500 ETF Trust'}, (), {}),
+        ],
+        ids=["market_closed", "penny_stock", "international", "etf"],
+    )
+    async def test_info_variants(
+        self, realistic_yfinance_response, symbol, info_updates, info_removed, expected
+    ):
+        """Test fetching data when the ticker info differs from a regular US equity."""
+        info = {**_INFO_TEMPLATE, **info_updates}
+        for key in info_removed:
+            info.pop(key, None)
+        realistic_yfinance_response.info = info
 
         fetcher = StockFetcher()
 
         with patch('yfinance.Ticker', return_value=realistic_yfinance_response):
-            stock_data = await fetcher.fetch_stock_data("SPY")
+            stock_data = await fetcher.fetch_stock_data(symbol)
 
             assert stock_data.current_price > 0
+            for field, value in expected.items():
+                assert getattr(stock_data, field) == value
 
 
 class TestDataQuality:
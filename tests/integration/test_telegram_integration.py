@@ -5,31 +5,84 @@ These tests verify end-to-end bot command processing with database.
 Tests are marked with [US2] for pytest filtering.
 """
 
+import asyncio
 import pytest
-import tempfile
-from datetime import datetime
-from pathlib import Path
+import sqlite3
+from datetime import date, datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from stock_analyzer.models import User, Subscription
+from telegram.error import TelegramError
+
+from stock_analyzer.deliverer import InsightDeliverer, TelegramChannel
+from stock_analyzer.models import Insight, User, Subscription
 from stock_analyzer.storage import Storage
 
 # Mark all tests in this module with US2 and asyncio
 pytestmark = [pytest.mark.US2, pytest.mark.asyncio]
 
+# Shared reply_text mock, reset before every test instead of rebuilt
+_NOOP_REPLY = AsyncMock()
 
-@pytest.fixture
-def storage():
-    """Create a temporary database for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-        db_path = tmp.name
 
-    storage = Storage(db_path)
-    storage.init_database()
-    yield storage
+async def _symbol_valid(symbol):
+    """validate_symbol stand-in: every symbol is valid."""
+    return True
+
+
+async def _symbol_invalid(symbol):
+    """validate_symbol stand-in: every symbol is invalid."""
+    return False
+
+
+def _make_update(user_id, username):
+    """Lightweight stand-in for a Telegram Update from the given user."""
+    return SimpleNamespace(
+        effective_user=SimpleNamespace(id=user_id, username=username),
+        effective_chat=SimpleNamespace(id=user_id),
+        message=SimpleNamespace(text="", reply_text=_NOOP_REPLY),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_noop_reply():
+    """Clear call history on the shared reply_text mock."""
+    _NOOP_REPLY.reset_mock()
+
+
+@pytest.fixture(scope="session")
+def _db_keeper():
+    """
+    Connection that keeps the shared in-memory test database alive.
+
+    Shared-cache in-memory databases are private to a process, so each
+    pytest-xdist worker gets its own copy without per-worker file paths.
+    """
+    db_uri = "file:test_telegram_integration?mode=memory&cache=shared"
+    keeper = sqlite3.connect(db_uri, uri=True)
+    Storage(db_uri).init_database()
+    yield keeper
+    keeper.close()
 
-    # Cleanup
-    Path(db_path).unlink(missing_ok=True)
+
+@pytest.fixture(scope="session")
+def storage(_db_keeper):
+    """In-memory test database, initialised once per session."""
+    return Storage("file:test_telegram_integration?mode=memory&cache=shared")
+
+
+@pytest.fixture(autouse=True)
+def _clear_tables(_db_keeper):
+    """Empty every table after each test (cheaper than recreating the schema)."""
+    yield
+    tables = [
+        row[0] for row in _db_keeper.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+    ]
+    for table in tables:
+        _db_keeper.execute(f"DELETE FROM {table}")
+    _db_keeper.commit()
 
 
 @pytest.fixture
@@ -40,7 +93,7 @@ def mock_update():
     update.effective_user.username = "testuser"
     update.effective_chat.id = 12345
     update.message.text = ""
-    update.message.reply_text = AsyncMock()
+    update.message.reply_text = _NOOP_REPLY
     return update
 
 
@@ -52,266 +105,237 @@ def mock_context():
     return context
 
 
+@pytest.fixture
+def patched_fetcher():
+    """Patch the bot's StockFetcher; symbols validate successfully by default."""
+    with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
+        mock_fetcher = MockFetcher.return_value
+        mock_fetcher.validate_symbol = _symbol_valid
+        yield mock_fetcher
+
+
+@pytest.mark.usefixtures("patched_fetcher")
 class TestEndToEndSubscriptionWorkflow:
     """Integration tests for complete subscription workflows."""
 
-    async def test_new_user_subscription_flow(self, storage, mock_update, mock_context):
+    async def test_new_user_subscription_flow(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN a brand new user
         WHEN they interact with the bot
         THEN complete workflow should work: start → subscribe → list → unsubscribe
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
-            bot = TelegramBot(storage=storage, token="test-token")
-
-            # Step 1: New user sends /start
-            await bot.start_command(mock_update, mock_context)
+        # Step 1: New user sends /start
+        await bot.start_command(mock_update, mock_context)
 
-            # Verify user was created
-            user = storage.get_user("12345")
-            assert user is not None
-            assert user.telegram_username == "@testuser"
+        # Verify user was created
+        user = storage.get_user("12345")
+        assert user is not None
+        assert user.telegram_username == "@testuser"
 
-            # Step 2: User subscribes to AAPL
-            mock_context.args = ["AAPL"]
-            await bot.subscribe_command(mock_update, mock_context)
+        # Step 2: User subscribes to AAPL
+        mock_context.args = ["AAPL"]
+        await bot.subscribe_command(mock_update, mock_context)
 
-            # Verify subscription added
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 1
-            assert subs[0].stock_symbol == "AAPL"
+        # Verify subscription added
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 1
+        assert subs[0].stock_symbol == "AAPL"
 
-            # Step 3: User lists subscriptions
-            mock_context.args = []
-            await bot.list_command(mock_update, mock_context)
+        # Step 3: User lists subscriptions
+        mock_context.args = []
+        await bot.list_command(mock_update, mock_context)
 
-            # Verify list was called successfully
-            assert mock_update.message.reply_text.called
+        # Verify list was called successfully
+        assert mock_update.message.reply_text.called
 
-            # Step 4: User unsubscribes from AAPL
-            mock_context.args = ["AAPL"]
-            await bot.unsubscribe_command(mock_update, mock_context)
+        # Step 4: User unsubscribes from AAPL
+        mock_context.args = ["AAPL"]
+        await bot.unsubscribe_command(mock_update, mock_context)
 
-            # Verify subscription removed
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 0
+        # Verify subscription removed
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 0
 
-    async def test_multi_stock_subscription_workflow(self, storage, mock_update, mock_context):
+    async def test_multi_stock_subscription_workflow(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN a user wants to track multiple stocks
         WHEN they subscribe to multiple symbols
         THEN all subscriptions should be managed correctly
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
-            bot = TelegramBot(storage=storage, token="test-token")
+        # Create user
+        await bot.start_command(mock_update, mock_context)
 
-            # Create user
-            await bot.start_command(mock_update, mock_context)
+        # Subscribe to multiple stocks concurrently, one context per command
+        symbols = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN"]
+        await asyncio.gather(*(
+            bot.subscribe_command(mock_update, SimpleNamespace(args=[symbol]))
+            for symbol in symbols
+        ))
 
-            # Subscribe to multiple stocks
-            symbols = ["AAPL", "MSFT", "GOOGL", "TSLA", "AMZN"]
-            for symbol in symbols:
-                mock_context.args = [symbol]
-                await bot.subscribe_command(mock_update, mock_context)
+        # Verify all subscriptions added
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 5
 
-            # Verify all subscriptions added
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 5
-
-            # Unsubscribe from 2 stocks
-            for symbol in ["MSFT", "TSLA"]:
-                mock_context.args = [symbol]
-                await bot.unsubscribe_command(mock_update, mock_context)
+        # Unsubscribe from 2 stocks
+        for symbol in ["MSFT", "TSLA"]:
+            mock_context.args = [symbol]
+            await bot.unsubscribe_command(mock_update, mock_context)
 
-            # Verify correct subscriptions remain
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 3
-            sub_symbols = {s.stock_symbol for s in subs}
-            assert sub_symbols == {"AAPL", "GOOGL", "AMZN"}
+        # Verify correct subscriptions remain
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 3
+        sub_symbols = {s.stock_symbol for s in subs}
+        assert sub_symbols == {"AAPL", "GOOGL", "AMZN"}
 
-    async def test_subscription_limit_enforcement(self, storage, mock_update, mock_context):
+    async def test_subscription_limit_enforcement(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN a user approaching subscription limit
         WHEN they try to exceed 10 subscriptions
         THEN limit should be enforced
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
-            bot = TelegramBot(storage=storage, token="test-token")
-
-            # Create user
-            await bot.start_command(mock_update, mock_context)
+        # Create user
+        await bot.start_command(mock_update, mock_context)
 
-            # Subscribe to 10 stocks (at limit)
-            for i in range(10):
-                mock_context.args = [f"STOCK{i}"]
-                await bot.subscribe_command(mock_update, mock_context)
+        # Subscribe to 10 stocks (at limit)
+        for i in range(10):
+            mock_context.args = [f"STOCK{i}"]
+            await bot.subscribe_command(mock_update, mock_context)
 
-            # Verify 10 subscriptions
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 10
+        # Verify 10 subscriptions
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 10
 
-            # Try to subscribe to 11th stock
-            mock_update.message.reply_text.reset_mock()
-            mock_context.args = ["STOCK11"]
-            await bot.subscribe_command(mock_update, mock_context)
+        # Try to subscribe to 11th stock
+        mock_update.message.reply_text.reset_mock()
+        mock_context.args = ["STOCK11"]
+        await bot.subscribe_command(mock_update, mock_context)
 
-            # Verify limit error was sent
-            assert mock_update.message.reply_text.called
-            message = mock_update.message.reply_text.call_args[0][0]
-            assert "limit" in message.lower() or "maximum" in message.lower()
+        # Verify limit error was sent
+        assert mock_update.message.reply_text.called
+        message = mock_update.message.reply_text.call_args[0][0]
+        assert "limit" in message.lower() or "maximum" in message.lower()
 
-            # Verify still only 10 subscriptions
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 10
+        # Verify still only 10 subscriptions
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 10
 
 
+@pytest.mark.usefixtures("patched_fetcher")
 class TestMultiUserScenarios:
     """Integration tests for multiple users interacting with bot."""
 
-    async def test_two_users_independent_subscriptions(self, storage, mock_context):
+    async def test_two_users_independent_subscriptions(self, TelegramBotCls, storage, mock_context):
         """
         GIVEN two different users
         WHEN they each manage their subscriptions
         THEN subscriptions should be isolated per user
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
-
-            bot = TelegramBot(storage=storage, token="test-token")
-
-            # User 1
-            update1 = MagicMock()
-            update1.effective_user.id = 11111
-            update1.effective_user.username = "user1"
-            update1.effective_chat.id = 11111
-            update1.message.reply_text = AsyncMock()
-
-            # User 2
-            update2 = MagicMock()
-            update2.effective_user.id = 22222
-            update2.effective_user.username = "user2"
-            update2.effective_chat.id = 22222
-            update2.message.reply_text = AsyncMock()
-
-            # Both users start
-            await bot.start_command(update1, mock_context)
-            await bot.start_command(update2, mock_context)
-
-            # User 1 subscribes to AAPL, MSFT
-            for symbol in ["AAPL", "MSFT"]:
-                mock_context.args = [symbol]
-                await bot.subscribe_command(update1, mock_context)
-
-            # User 2 subscribes to GOOGL, AMZN
-            for symbol in ["GOOGL", "AMZN"]:
-                mock_context.args = [symbol]
-                await bot.subscribe_command(update2, mock_context)
-
-            # Verify user 1's subscriptions
-            user1_subs = storage.get_subscriptions(user_id="11111", active_only=True)
-            assert len(user1_subs) == 2
-            user1_symbols = {s.stock_symbol for s in user1_subs}
-            assert user1_symbols == {"AAPL", "MSFT"}
-
-            # Verify user 2's subscriptions
-            user2_subs = storage.get_subscriptions(user_id="22222", active_only=True)
-            assert len(user2_subs) == 2
-            user2_symbols = {s.stock_symbol for s in user2_subs}
-            assert user2_symbols == {"GOOGL", "AMZN"}
-
-    async def test_multiple_users_same_stock(self, storage, mock_context):
+        bot = TelegramBotCls(storage=storage, token="test-token")
+
+        update1 = _make_update(11111, "user1")
+        update2 = _make_update(22222, "user2")
+
+        # Both users start
+        await bot.start_command(update1, mock_context)
+        await bot.start_command(update2, mock_context)
+
+        # User 1 subscribes to AAPL, MSFT
+        for symbol in ["AAPL", "MSFT"]:
+            mock_context.args = [symbol]
+            await bot.subscribe_command(update1, mock_context)
+
+        # User 2 subscribes to GOOGL, AMZN
+        for symbol in ["GOOGL", "AMZN"]:
+            mock_context.args = [symbol]
+            await bot.subscribe_command(update2, mock_context)
+
+        # Verify user 1's subscriptions
+        user1_subs = storage.get_subscriptions(user_id="11111", active_only=True)
+        assert len(user1_subs) == 2
+        user1_symbols = {s.stock_symbol for s in user1_subs}
+        assert user1_symbols == {"AAPL", "MSFT"}
+
+        # Verify user 2's subscriptions
+        user2_subs = storage.get_subscriptions(user_id="22222", active_only=True)
+        assert len(user2_subs) == 2
+        user2_symbols = {s.stock_symbol for s in user2_subs}
+        assert user2_symbols == {"GOOGL", "AMZN"}
+
+    async def test_multiple_users_same_stock(self, TelegramBotCls, storage, mock_context):
         """
         GIVEN multiple users subscribe to the same stock
         WHEN daily analysis runs
         THEN each user should receive their own delivery
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
-
-            bot = TelegramBot(storage=storage, token="test-token")
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
-            # Create 3 users, all subscribe to AAPL
-            for user_id in [11111, 22222, 33333]:
-                update = MagicMock()
-                update.effective_user.id = user_id
-                update.effective_user.username = f"user{user_id}"
-                update.effective_chat.id = user_id
-                update.message.reply_text = AsyncMock()
+        # Create 3 users, all subscribe to AAPL (users are independent, so run concurrently)
+        updates = [_make_update(user_id, f"user{user_id}") for user_id in [11111, 22222, 33333]]
+        await asyncio.gather(*(bot.start_command(update, mock_context) for update in updates))
+        await asyncio.gather(*(
+            bot.subscribe_command(update, SimpleNamespace(args=["AAPL"]))
+            for update in updates
+        ))
 
-                await bot.start_command(update, mock_context)
-
-                mock_context.args = ["AAPL"]
-                await bot.subscribe_command(update, mock_context)
-
-            # Verify all 3 users subscribed to AAPL
-            aapl_subs = storage.get_subscriptions(stock_symbol="AAPL", active_only=True)
-            assert len(aapl_subs) == 3
+        # Verify all 3 users subscribed to AAPL
+        aapl_subs = storage.get_subscriptions(stock_symbol="AAPL", active_only=True)
+        assert len(aapl_subs) == 3
 
 
+@pytest.mark.usefixtures("patched_fetcher")
 class TestErrorScenarios:
     """Integration tests for error handling."""
 
-    async def test_invalid_symbol_subscription(self, storage, mock_update, mock_context):
+    async def test_invalid_symbol_subscription(
+        self, TelegramBotCls, patched_fetcher, storage, mock_update, mock_context
+    ):
         """
         GIVEN user tries to subscribe to invalid symbol
         WHEN validation fails
         THEN subscription should not be added
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            # Invalid symbol
-            mock_fetcher.validate_symbol = AsyncMock(return_value=False)
+        # Invalid symbol
+        patched_fetcher.validate_symbol = _symbol_invalid
 
-            bot = TelegramBot(storage=storage, token="test-token")
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
-            # Create user
-            await bot.start_command(mock_update, mock_context)
+        # Create user
+        await bot.start_command(mock_update, mock_context)
 
-            # Try to subscribe to invalid symbol
-            mock_context.args = ["INVALID123"]
-            await bot.subscribe_command(mock_update, mock_context)
+        # Try to subscribe to invalid symbol
+        mock_context.args = ["INVALID123"]
+        await bot.subscribe_command(mock_update, mock_context)
 
-            # Verify no subscription added
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 0
+        # Verify no subscription added
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 0
 
-            # Verify error message sent
-            assert mock_update.message.reply_text.called
-            message = mock_update.message.reply_text.call_args[0][0]
-            assert "invalid" in message.lower() or "not found" in message.lower()
+        # Verify error message sent
+        assert mock_update.message.reply_text.called
+        message = mock_update.message.reply_text.call_args[0][0]
+        assert "invalid" in message.lower() or "not found" in message.lower()
 
-    async def test_unsubscribe_without_subscription(self, storage, mock_update, mock_context):
+    async def test_unsubscribe_without_subscription(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN user has no subscriptions
         WHEN they try to unsubscribe
         THEN appropriate error message should be sent
         """
-        from stock_analyzer.bot import TelegramBot
-
-        bot = TelegramBot(storage=storage, token="test-token")
+        bot = TelegramBotCls(storage=storage, token="test-token")
 
         # Create user
         await bot.start_command(mock_update, mock_context)
@@ -325,50 +349,47 @@ class TestErrorScenarios:
         message = mock_update.message.reply_text.call_args[0][0]
         assert "not subscribed" in message.lower() or "no subscription" in message.lower()
 
-    async def test_database_persistence_across_bot_instances(self, storage, mock_update, mock_context):
+    async def test_database_persistence_across_bot_instances(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN user subscribes via one bot instance
         WHEN new bot instance is created
         THEN subscriptions should persist
         """
-        from stock_analyzer.bot import TelegramBot
-
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
+        # First bot instance
+        bot1 = TelegramBotCls(storage=storage, token="test-token")
+        await bot1.start_command(mock_update, mock_context)
 
-            # First bot instance
-            bot1 = TelegramBot(storage=storage, token="test-token")
-            await bot1.start_command(mock_update, mock_context)
-
-            mock_context.args = ["AAPL"]
-            await bot1.subscribe_command(mock_update, mock_context)
+        mock_context.args = ["AAPL"]
+        await bot1.subscribe_command(mock_update, mock_context)
 
-            # Create second bot instance with same storage
-            bot2 = TelegramBot(storage=storage, token="test-token")
+        # Create second bot instance with same storage
+        bot2 = TelegramBotCls(storage=storage, token="test-token")
 
-            # List subscriptions via second bot
-            mock_context.args = []
-            await bot2.list_command(mock_update, mock_context)
+        # List subscriptions via second bot
+        mock_context.args = []
+        await bot2.list_command(mock_update, mock_context)
 
-            # Verify subscriptions persisted
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 1
-            assert subs[0].stock_symbol == "AAPL"
+        # Verify subscriptions persisted
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 1
+        assert subs[0].stock_symbol == "AAPL"
 
 
+@pytest.mark.usefixtures("patched_fetcher")
 class TestCommandValidation:
     """Integration tests for command input validation."""
 
-    async def test_subscribe_without_arguments(self, storage, mock_update, mock_context):
+    async def test_subscribe_without_arguments(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN user sends /subscribe without symbol
         WHEN command is processed
         THEN usage error should be sent
         """
-        from stock_analyzer.bot import TelegramBot
-
-        bot = TelegramBot(storage=storage, token="test-token")
+        bot = TelegramBotCls(storage=storage, token="test-token")
         await bot.start_command(mock_update, mock_context)
 
         mock_context.args = []  # No arguments
@@ -379,15 +400,15 @@ class TestCommandValidation:
         message = mock_update.message.reply_text.call_args[0][0]
         assert "usage" in message.lower() or "symbol" in message.lower()
 
-    async def test_unsubscribe_without_arguments(self, storage, mock_update, mock_context):
+    async def test_unsubscribe_without_arguments(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN user sends /unsubscribe without symbol
         WHEN command is processed
         THEN usage error should be sent
         """
-        from stock_analyzer.bot import TelegramBot
-
-        bot = TelegramBot(storage=storage, token="test-token")
+        bot = TelegramBotCls(storage=storage, token="test-token")
         await bot.start_command(mock_update, mock_context)
 
         mock_context.args = []  # No arguments
@@ -398,32 +419,44 @@ class TestCommandValidation:
         message = mock_update.message.reply_text.call_args[0][0]
         assert "usage" in message.lower() or "symbol" in message.lower()
 
-    async def test_subscribe_case_insensitive(self, storage, mock_update, mock_context):
+    async def test_subscribe_case_insensitive(
+        self, TelegramBotCls, storage, mock_update, mock_context
+    ):
         """
         GIVEN user sends /subscribe aapl (lowercase)
         WHEN command is processed
         THEN it should be converted to uppercase and work
         """
-        from stock_analyzer.bot import TelegramBot
+        bot = TelegramBotCls(storage=storage, token="test-token")
+        await bot.start_command(mock_update, mock_context)
 
-        with patch('stock_analyzer.bot.StockFetcher') as MockFetcher:
-            mock_fetcher = MockFetcher.return_value
-            mock_fetcher.validate_symbol = AsyncMock(return_value=True)
+        # Subscribe with lowercase
+        mock_context.args = ["aapl"]
+        await bot.subscribe_command(mock_update, mock_context)
 
-            bot = TelegramBot(storage=storage, token="test-token")
-            await bot.start_command(mock_update, mock_context)
+        # Verify subscription stored as uppercase
+        subs = storage.get_subscriptions(user_id="12345", active_only=True)
+        assert len(subs) == 1
+        assert subs[0].stock_symbol == "AAPL"
 
-            # Subscribe with lowercase
-            mock_context.args = ["aapl"]
-            await bot.subscribe_command(mock_update, mock_context)
 
-            # Verify subscription stored as uppercase
-            subs = storage.get_subscriptions(user_id="12345", active_only=True)
-            assert len(subs) == 1
-            assert subs[0].stock_symbol == "AAPL"
+# ==================== Personal Use Channel Delivery Tests ====================
 
 
-# ==================== Personal Use Channel Delivery Tests ====================
+@pytest.fixture
+def saved_insight(storage):
+    """Minimal AAPL insight already saved to storage (id assigned)."""
+    insight = Insight(
+        stock_symbol="AAPL",
+        analysis_date=date.today(),
+        summary="Test summary",
+        trend_analysis="Test trend",
+        risk_factors=[],
+        opportunities=[],
+        confidence_level="medium"
+    )
+    insight.id = storage.save_insight(insight)
+    return insight
 
 
 class TestChannelDeliveryIntegration:
@@ -436,9 +469,6 @@ class TestChannelDeliveryIntegration:
         WHEN delivered to personal channel
         THEN message is sent and delivery logged
         """
-        from datetime import date
-        from stock_analyzer.deliverer import InsightDeliverer
-        from stock_analyzer.models import Insight
 
         # Create insight
         insight = Insight(
@@ -461,7 +491,6 @@ class TestChannelDeliveryIntegration:
             mock_bot = MockBot.return_value
             mock_bot.send_message = AsyncMock()
 
-            from stock_analyzer.deliverer import TelegramChannel
             channel = TelegramChannel(token="test-token")
             deliverer.add_channel("telegram", channel)
 
@@ -482,29 +511,13 @@ class TestChannelDeliveryIntegration:
             assert "AAPL" in call_args.kwargs['text']
 
     @pytest.mark.asyncio
-    async def test_channel_delivery_error_handling(self, storage):
+    async def test_channel_delivery_error_handling(self, storage, saved_insight):
         """
         GIVEN an invalid channel ID
         WHEN attempting delivery
         THEN error is handled gracefully and logged
         """
-        from datetime import date
-        from stock_analyzer.deliverer import InsightDeliverer
-        from stock_analyzer.models import Insight
-        from telegram.error import TelegramError
-
-        insight = Insight(
-            stock_symbol="AAPL",
-            analysis_date=date.today(),
-            summary="Test summary",
-            trend_analysis="Test trend",
-            risk_factors=[],
-            opportunities=[],
-            confidence_level="medium"
-        )
-        insight_id = storage.save_insight(insight)
-        insight.id = insight_id
-
+        insight = saved_insight
         deliverer = InsightDeliverer(storage=storage)
 
         # Mock Telegram channel that fails
@@ -514,7 +527,6 @@ class TestChannelDeliveryIntegration:
                 side_effect=TelegramError("Chat not found")
             )
 
-            from stock_analyzer.deliverer import TelegramChannel
             channel = TelegramChannel(token="test-token")
             deliverer.add_channel("telegram", channel)
 
@@ -530,29 +542,13 @@ class TestChannelDeliveryIntegration:
             assert "chat not found" in result.error_message.lower()
 
     @pytest.mark.asyncio
-    async def test_channel_permission_error_handling(self, storage):
+    async def test_channel_permission_error_handling(self, storage, saved_insight):
         """
         GIVEN bot lacks permissions in channel
         WHEN attempting delivery
         THEN permission error is caught and logged
         """
-        from datetime import date
-        from stock_analyzer.deliverer import InsightDeliverer
-        from stock_analyzer.models import Insight
-        from telegram.error import TelegramError
-
-        insight = Insight(
-            stock_symbol="AAPL",
-            analysis_date=date.today(),
-            summary="Test",
-            trend_analysis="Test",
-            risk_factors=[],
-            opportunities=[],
-            confidence_level="high"
-        )
-        insight_id = storage.save_insight(insight)
-        insight.id = insight_id
-
+        insight = saved_insight
         deliverer = InsightDeliverer(storage=storage)
 
         with patch('stock_analyzer.deliverer.Bot') as MockBot:
@@ -561,7 +557,6 @@ class TestChannelDeliveryIntegration:
                 side_effect=TelegramError("Need administrator rights")
             )
 
-            from stock_analyzer.deliverer import TelegramChannel
             channel = TelegramChannel(token="test-token")
             deliverer.add_channel("telegram", channel)
 
@@ -580,15 +575,10 @@ class TestChannelDeliveryIntegration:
         WHEN delivered to same channel
         THEN all messages posted successfully
         """
-        from datetime import date
-        from stock_analyzer.deliverer import InsightDeliverer
-        from stock_analyzer.models import Insight
 
         symbols = ["AAPL", "MSFT", "GOOGL"]
-        insights = []
-
-        for symbol in symbols:
-            insight = Insight(
+        insights = [
+            Insight(
                 stock_symbol=symbol,
                 analysis_date=date.today(),
                 summary=f"{symbol} analysis",
@@ -597,9 +587,10 @@ class TestChannelDeliveryIntegration:
                 opportunities=[],
                 confidence_level="high"
             )
-            insight_id = storage.save_insight(insight)
-            insight.id = insight_id
-            insights.append(insight)
+            for symbol in symbols
+        ]
+        # Seed in one transaction; save_insights assigns each insight's id
+        storage.save_insights(insights)
 
         deliverer = InsightDeliverer(storage=storage)
 
@@ -607,18 +598,14 @@ class TestChannelDeliveryIntegration:
             mock_bot = MockBot.return_value
             mock_bot.send_message = AsyncMock()
 
-            from stock_analyzer.deliverer import TelegramChannel
             channel = TelegramChannel(token="test-token")
             deliverer.add_channel("telegram", channel)
 
-            # Deliver all insights
-            results = []
-            for insight in insights:
-                result = await deliverer.deliver_to_channel(
-                    insight=insight,
-                    channel_id="@mystocks"
-                )
-                results.append(result)
+            # Deliver all insights concurrently
+            results = await asyncio.gather(*(
+                deliverer.deliver_to_channel(insight=insight, channel_id="@mystocks")
+                for insight in insights
+            ))
 
             # Verify all succeeded
             assert all(r.status == "success" for r in results)
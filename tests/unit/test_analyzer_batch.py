@@ -0,0 +1,60 @@
+"""Unit tests for Analyzer.analyze_batch scheduling."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from stock_analyzer.analyzer import Analyzer
+from stock_analyzer.exceptions import AnalysisError
+
+
+class RecordingAnalyzer(Analyzer):
+    """Analyzer whose analyze_stock records attempts and fails for chosen symbols."""
+
+    def __init__(self, failing=(), delays=None):
+        super().__init__(llm_client=MagicMock(), fetcher=MagicMock(), storage=MagicMock())
+        self.failing = set(failing)
+        self.delays = delays or {}
+        self.attempted = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def analyze_stock(self, symbol, date=None, force=False):
+        self.attempted.append(symbol)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(symbol, 0.01))
+            if symbol in self.failing:
+                raise AnalysisError(symbol, "boom")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_stop_on_error_starts_no_symbols_after_failure():
+    """Only symbols picked up before the failure was seen are attempted."""
+    analyzer = RecordingAnalyzer(failing={"B"}, delays={"A": 0.05, "B": 0.01})
+
+    result = await analyzer.analyze_batch(["A", "B", "C", "D", "E"], parallel=2)
+
+    # A and B start together; B fails while A is still running, so nothing else starts
+    assert analyzer.attempted == ["A", "B"]
+    assert [r.stock_symbol for r in result.results] == ["A", "B"]
+    assert [r.status for r in result.results] == ["success", "error"]
+    assert result.failure_count == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_on_error_bounds_in_flight_analyses():
+    """No more than `parallel` analyses run at once and results keep input order."""
+    symbols = [f"SYM{i}" for i in range(8)]
+    analyzer = RecordingAnalyzer(delays={"SYM0": 0.05})
+
+    result = await analyzer.analyze_batch(symbols, parallel=3)
+
+    assert analyzer.peak == 3
+    assert sorted(analyzer.attempted) == symbols
+    assert [r.stock_symbol for r in result.results] == symbols
+    assert result.success_count == len(symbols)
@@ -3,8 +3,12 @@
 from datetime import date
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
+
+from stock_analyzer import analyzer as analyzer_module
 from stock_analyzer.analyzer import Analyzer
-from stock_analyzer.models import Insight
+from stock_analyzer.models import Insight, StockData
 
 
 def make_analyzer() -> Analyzer:
@@ -84,6 +88,15 @@ def test_stale_cache_detection_for_legacy_summary_formats():
         opportunities=[],
         confidence_level="medium",
     )
+    header_colon_inside = Insight(
+        stock_symbol="COST",
+        analysis_date=date(2026, 2, 28),
+        summary="**Summary:**\nSome text",
+        trend_analysis="",
+        risk_factors=[],
+        opportunities=[],
+        confidence_level="medium",
+    )
     healthy = Insight(
         stock_symbol="COST",
         analysis_date=date(2026, 2, 28),
@@ -95,5 +108,102 @@ def test_stale_cache_detection_for_legacy_summary_formats():
     )
 
     assert analyzer._is_stale_cached_insight(header_style) is True
+    assert analyzer._is_stale_cached_insight(header_colon_inside) is True
     assert analyzer._is_stale_cached_insight(truncated_style) is True
     assert analyzer._is_stale_cached_insight(healthy) is False
+
+
+def test_sections_parsed_once_per_response():
+    analyzer = make_analyzer()
+    text = """**Summary:**
+Short summary.
+
+**Trend Analysis**:
+Neutral trend.
+
+**Risk Factors:**
+- Risk one.
+
+**Opportunities**:
+1. Opportunity one.
+
+**Outlook:**
+Custom section.
+"""
+    misses_before = analyzer_module._parse_markdown_sections.cache_info().misses
+
+    summary, trend = analyzer._extract_summary_and_trend(text)
+    risks = analyzer._extract_bullet_section(text, "Risk Factors")
+    opportunities = analyzer._extract_bullet_section(text, "Opportunities")
+    outlook = analyzer._extract_section_text(text, "Outlook")
+
+    assert (summary, trend, outlook) == ("Short summary.", "Neutral trend.", "Custom section.")
+    assert risks == ["Risk one."]
+    assert opportunities == ["Opportunity one."]
+    assert analyzer_module._parse_markdown_sections.cache_info().misses == misses_before + 1
+
+
+def test_fallback_summary_strips_leading_header():
+    analyzer = make_analyzer()
+
+    summary, trend = analyzer._extract_summary_and_trend("**Overview:** Free-form answer.\nMore.")
+
+    assert summary == "Free-form answer.\nMore."
+    assert trend == ""
+
+
+def test_bullet_section_accepts_all_bullet_styles():
+    analyzer = make_analyzer()
+    text = """**Risk Factors:**
+- Dash risk
+* Star risk
+•Dot risk
+12. Numbered risk
+Not a bullet
+-
+3.
+"""
+
+    risks = analyzer._extract_bullet_section(text, "Risk Factors")
+
+    assert risks == ["Dash risk", "Star risk", "Dot risk", "Numbered risk"]
+
+
+def test_build_prompt_formats_recent_history():
+    analyzer = make_analyzer()
+    history = pd.DataFrame({
+        'Date': ['2026-01-28', '2026-01-29', '2026-01-30'],
+        'Close': np.array([180.0, 181.6, 185.75], dtype="float32"),
+        'Volume': [np.nan, 48000000, 52000000],
+    })
+    stock_data = StockData(
+        symbol="AAPL",
+        current_price=185.75,
+        price_change_percent=2.3,
+        volume=52000000,
+        historical_prices=history,
+    )
+
+    prompt = analyzer._build_prompt(stock_data)
+
+    assert "  2026-01-28: $180.00\n" in prompt
+    assert "  2026-01-30: $185.75 (Volume: 52,000,000)" in prompt
+
+
+def test_build_prompt_uses_index_dates_and_numpy_volumes():
+    analyzer = make_analyzer()
+    history = pd.DataFrame(
+        {'Close': [181.6, 185.75], 'Volume': np.array([48000000, 52000000], dtype="int64")},
+        index=pd.Index([date(2026, 1, 29), date(2026, 1, 30)], name="Date"),
+    )
+    stock_data = StockData(
+        symbol="AAPL",
+        current_price=185.75,
+        price_change_percent=2.3,
+        volume=52000000,
+        historical_prices=history,
+    )
+
+    prompt = analyzer._build_prompt(stock_data)
+
+    assert "  2026-01-29: $181.60 (Volume: 48,000,000)" in prompt
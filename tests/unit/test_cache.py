@@ -0,0 +1,69 @@
+"""
+Unit tests for cache module.
+
+Tests TTL expiry, LRU eviction and hit/miss counters.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from stock_analyzer.cache import StockCache
+from stock_analyzer.models import StockData
+
+
+@pytest.fixture
+def stock_data():
+    """Create minimal stock data."""
+    return StockData(
+        symbol="AAPL",
+        current_price=185.75,
+        price_change_percent=2.3,
+        volume=52000000,
+        historical_prices=pd.DataFrame({'Close': [185.75]}),
+    )
+
+
+class TestStockCache:
+    """Test StockCache behaviour."""
+
+    def test_make_key_normalizes_symbol(self):
+        """Test keys are case-insensitive on the symbol."""
+        start, end = date(2024, 1, 1), date(2024, 1, 31)
+
+        assert StockCache.make_key("aapl", start, end) == "AAPL:2024-01-01:2024-01-31"
+
+    def test_get_and_counters(self, stock_data):
+        """Test hits and misses are counted."""
+        cache = StockCache()
+
+        assert cache.get("AAPL:x") is None
+        cache.set("AAPL:x", stock_data)
+        assert cache.get("AAPL:x") is stock_data
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entries_expire_after_ttl(self, stock_data):
+        """Test an entry is dropped once its TTL has passed."""
+        now = [0.0]
+        cache = StockCache(ttl=60, clock=lambda: now[0])
+        cache.set("AAPL:x", stock_data)
+
+        now[0] = 59
+        assert cache.get("AAPL:x") is stock_data
+
+        now[0] = 60
+        assert cache.get("AAPL:x") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, stock_data):
+        """Test the least recently used entry is evicted when full."""
+        cache = StockCache(maxsize=2)
+        cache.set("a", stock_data)
+        cache.set("b", stock_data)
+        cache.get("a")
+        cache.set("c", stock_data)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is stock_data
+        assert cache.get("c") is stock_data
@@ -110,6 +110,26 @@ class TestConfigFromEnv:
         assert config.retry_max == 5
         assert config.debug is True
 
+    def test_from_env_reparses_only_when_env_changes(self, monkeypatch):
+        """Test repeated loads reuse the parsed env but return fresh instances."""
+        from stock_analyzer.config import _parse_env
+
+        monkeypatch.setenv("STOCK_ANALYZER_STOCK_LIST", "AAPL")
+
+        first = Config.from_env()
+        misses = _parse_env.cache_info().misses
+        second = Config.from_env()
+
+        assert _parse_env.cache_info().misses == misses
+        assert second == first
+        assert second is not first
+
+        monkeypatch.setenv("STOCK_ANALYZER_STOCK_LIST", "MSFT")
+        third = Config.from_env()
+
+        assert _parse_env.cache_info().misses == misses + 1
+        assert third.stock_list == "MSFT"
+
 
 class TestConfigValidation:
     """Test Config.validate() method."""
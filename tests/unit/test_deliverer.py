@@ -2,6 +2,7 @@
 Unit tests for deliverer module.
 """
 
+import asyncio
 from datetime import date, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -11,9 +12,10 @@ from stock_analyzer.deliverer import (
     DeliveryChannel,
     InsightDeliverer,
     TelegramChannel,
+    _resolve_chat_id,
 )
 from stock_analyzer.exceptions import DeliveryError
-from stock_analyzer.models import Insight, Subscription, User
+from stock_analyzer.models import Insight
 from stock_analyzer.storage import Storage
 
 
@@ -31,7 +33,6 @@ def sample_insight():
     """Create sample insight."""
     return Insight(
         id=1,
-        analysis_id=1,
         stock_symbol="AAPL",
         analysis_date=date(2026, 1, 30),
         summary="Apple stock shows strong momentum with positive indicators.",
@@ -44,6 +45,23 @@ def sample_insight():
     )
 
 
+class _StubChannel(DeliveryChannel):
+    """Plain delivery channel double that records calls and always succeeds."""
+
+    def __init__(self, message: str = "Message"):
+        self.message = message
+        self.formatted = []
+        self.sent = []
+
+    def format_insight(self, insight):
+        self.formatted.append(insight)
+        return self.message
+
+    async def send(self, user_id, message):
+        self.sent.append((user_id, message))
+        return True
+
+
 class TestTelegramChannel:
     """Test Telegram delivery channel."""
 
@@ -70,7 +88,6 @@ class TestTelegramChannel:
         # Create insight with very long summary
         long_insight = Insight(
             id=1,
-            analysis_id=1,
             stock_symbol="AAPL",
             analysis_date=date(2026, 1, 30),
             summary="A" * 5000,  # Very long
@@ -125,18 +142,14 @@ class TestTelegramChannel:
 
     def test_chat_id_conversion(self):
         """Test chat ID conversion logic."""
-        channel = TelegramChannel(token="test-token")
-
         # Test numeric string
-        assert "123456".isdigit()
+        assert _resolve_chat_id("123456") == 123456
 
         # Test negative numeric (group chat)
-        user_id = "-100123456"
-        assert user_id.startswith('-') and user_id[1:].isdigit()
+        assert _resolve_chat_id("-100123456") == -100123456
 
         # Test username
-        user_id = "@username"
-        assert not user_id.isdigit()
+        assert _resolve_chat_id("@username") == "@username"
 
 
 class TestInsightDeliverer:
@@ -162,24 +175,22 @@ class TestInsightDeliverer:
         """Test adding custom channel."""
         deliverer = InsightDeliverer(storage=test_storage)
 
-        # Create mock channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        deliverer.add_channel("custom", mock_channel)
+        # Create stub channel
+        stub_channel = _StubChannel()
+        deliverer.add_channel("custom", stub_channel)
 
         assert "custom" in deliverer.channels
-        assert deliverer.channels["custom"] == mock_channel
+        assert deliverer.channels["custom"] == stub_channel
 
     @pytest.mark.asyncio
     async def test_deliver_insight_success(self, test_storage, sample_insight):
         """Test successful insight delivery."""
         deliverer = InsightDeliverer(storage=test_storage)
 
-        # Add mock channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Formatted message"
-        mock_channel.send = AsyncMock(return_value=True)
+        # Add stub channel
+        stub_channel = _StubChannel("Formatted message")
 
-        deliverer.add_channel("test", mock_channel)
+        deliverer.add_channel("test", stub_channel)
 
         # Mock _log_delivery to avoid foreign key issues
         with patch.object(deliverer, '_log_delivery'):
@@ -191,10 +202,10 @@ class TestInsightDeliverer:
             )
 
             assert result.status == "success"
-            assert result.user_id == "user123"
+            assert result.channel_id == "user123"
             assert result.insight_id == sample_insight.id
-            mock_channel.format_insight.assert_called_once_with(sample_insight)
-            mock_channel.send.assert_called_once_with("user123", "Formatted message")
+            assert stub_channel.formatted == [sample_insight]
+            assert stub_channel.sent == [("user123", "Formatted message")]
 
     @pytest.mark.asyncio
     async def test_deliver_insight_failure(self, test_storage, sample_insight):
@@ -251,7 +262,6 @@ class TestInsightDeliverer:
         insights = [
             Insight(
                 id=i,
-                analysis_id=i,
                 stock_symbol=f"SYM{i}",
                 analysis_date=date(2026, 1, 30),
                 summary=f"Summary {i}",
@@ -265,12 +275,8 @@ class TestInsightDeliverer:
             for i in range(1, 4)
         ]
 
-        # Add mock channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Message"
-        mock_channel.send = AsyncMock(return_value=True)
-
-        deliverer.add_channel("test", mock_channel)
+        # Add stub channel
+        deliverer.add_channel("test", _StubChannel())
 
         # Mock _log_delivery to avoid foreign key issues
         with patch.object(deliverer, '_log_delivery'):
@@ -288,64 +294,53 @@ class TestInsightDeliverer:
             assert result.failure_count == 0
 
     @pytest.mark.asyncio
-    async def test_deliver_to_subscribers(self, test_storage, sample_insight):
-        """Test delivering to stock subscribers."""
-        # Create users and subscriptions
-        for i in range(3):
-            user = User(user_id=f"user_{i}", telegram_username=f"@user{i}")
-            test_storage.add_user(user)
-
-            sub = Subscription(user_id=f"user_{i}", stock_symbol="AAPL")
-            test_storage.add_subscription(sub)
-
-        deliverer = InsightDeliverer(storage=test_storage)
-
-        # Add mock channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Message"
-        mock_channel.send = AsyncMock(return_value=True)
+    async def test_concurrent_batches_save_their_own_logs(self, sample_insight):
+        """Test overlapping batches on one deliverer each save only their own logs."""
+        storage = MagicMock(spec=Storage)
+        deliverer = InsightDeliverer(storage=storage)
+        deliverer.add_channel("test", _StubChannel())
+
+        await asyncio.gather(
+            deliverer.deliver_batch([sample_insight], ["a1", "a2"], channel="test", parallel=2),
+            deliverer.deliver_batch([sample_insight], ["b1"], channel="test"),
+        )
 
-        deliverer.add_channel("test", mock_channel)
+        saved = [
+            sorted(log.channel_id for log in call.args[0])
+            for call in storage.save_delivery_logs.call_args_list
+        ]
+        assert sorted(saved) == [["a1", "a2"], ["b1"]]
+        storage.save_delivery_log.assert_not_called()
 
-        # Mock _log_delivery to avoid foreign key issues
-        with patch.object(deliverer, '_log_delivery'):
-            # Deliver to subscribers
-            result = await deliverer.deliver_to_subscribers(
-                insight=sample_insight,
-                channel="test"
-            )
+    @pytest.mark.asyncio
+    async def test_batch_logs_are_stamped_when_sent(self, sample_insight):
+        """Test each batch delivery log carries the time its own send finished."""
+        storage = MagicMock(spec=Storage)
+        deliverer = InsightDeliverer(storage=storage)
+        sent_at = {}
 
-            # Should deliver to 3 subscribers
-            assert result.total == 3
-            assert result.success_count == 3
-            assert result.failure_count == 0
+        class SlowChannel(_StubChannel):
+            async def send(self, user_id, message):
+                await asyncio.sleep(0.01)
+                sent_at[user_id] = datetime.utcnow()
+                return True
 
-    @pytest.mark.asyncio
-    async def test_deliver_to_subscribers_no_subscribers(self, test_storage, sample_insight):
-        """Test delivering when no subscribers exist."""
-        deliverer = InsightDeliverer(storage=test_storage)
+        deliverer.add_channel("test", SlowChannel())
 
-        result = await deliverer.deliver_to_subscribers(
-            insight=sample_insight,
-            channel="test"
-        )
+        await deliverer.deliver_batch([sample_insight], ["u1", "u2", "u3"], channel="test")
 
-        # No subscribers
-        assert result.total == 0
-        assert result.success_count == 0
-        assert result.failure_count == 0
+        (logs,) = storage.save_delivery_logs.call_args.args
+        assert {log.channel_id for log in logs} == set(sent_at)
+        for log in logs:
+            assert log.delivered_at >= sent_at[log.channel_id]
 
     @pytest.mark.asyncio
     async def test_delivery_logging(self, test_storage, sample_insight):
         """Test that deliveries are logged to storage."""
         deliverer = InsightDeliverer(storage=test_storage)
 
-        # Add mock channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Message"
-        mock_channel.send = AsyncMock(return_value=True)
-
-        deliverer.add_channel("test", mock_channel)
+        # Add stub channel
+        deliverer.add_channel("test", _StubChannel())
 
         # Mock _log_delivery and verify it was called
         with patch.object(deliverer, '_log_delivery') as mock_log:
@@ -440,12 +435,10 @@ class TestChannelDelivery:
         """Test new deliver_to_channel() method for personal use."""
         deliverer = InsightDeliverer(storage=test_storage)
 
-        # Add mock telegram channel
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Formatted message"
-        mock_channel.send = AsyncMock(return_value=True)
+        # Add stub telegram channel
+        stub_channel = _StubChannel("Formatted message")
 
-        deliverer.add_channel("telegram", mock_channel)
+        deliverer.add_channel("telegram", stub_channel)
 
         # Mock _log_delivery
         with patch.object(deliverer, '_log_delivery'):
@@ -460,18 +453,16 @@ class TestChannelDelivery:
             assert result.insight_id == sample_insight.id
 
             # Verify channel.send was called with channel ID
-            mock_channel.send.assert_called_once_with("@mystocks", "Formatted message")
+            assert stub_channel.sent == [("@mystocks", "Formatted message")]
 
     @pytest.mark.asyncio
     async def test_deliver_to_channel_with_numeric_id(self, test_storage, sample_insight):
         """Test deliver_to_channel() with numeric channel ID."""
         deliverer = InsightDeliverer(storage=test_storage)
 
-        mock_channel = MagicMock(spec=DeliveryChannel)
-        mock_channel.format_insight.return_value = "Message"
-        mock_channel.send = AsyncMock(return_value=True)
+        stub_channel = _StubChannel()
 
-        deliverer.add_channel("telegram", mock_channel)
+        deliverer.add_channel("telegram", stub_channel)
 
         with patch.object(deliverer, '_log_delivery'):
             result = await deliverer.deliver_to_channel(
@@ -481,7 +472,7 @@ class TestChannelDelivery:
 
             assert result.status == "success"
             assert result.channel_id == "-1001234567890"
-            mock_channel.send.assert_called_once_with("-1001234567890", "Message")
+            assert stub_channel.sent == [("-1001234567890", "Message")]
 
     @pytest.mark.asyncio
     async def test_deliver_to_channel_handles_errors(self, test_storage, sample_insight):
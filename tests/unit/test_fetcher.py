@@ -6,24 +6,92 @@ Tests stock data fetching from:
 - Alpha Vantage (backup)
 """
 
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, replace
 from datetime import date, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import aiohttp
 import pandas as pd
 import pytest
 
+from stock_analyzer.cache import StockCache
 from stock_analyzer.exceptions import DataFetchError, InvalidSymbolError, RateLimitError
-from stock_analyzer.fetcher import StockFetcher
+from stock_analyzer.fetcher import RateLimiter, StockFetcher
 from stock_analyzer.models import StockData
 
 
-@pytest.fixture
-def mock_yfinance_data():
-    """Create mock yfinance ticker data."""
-    mock_ticker = MagicMock()
+@dataclass(frozen=True, slots=True)
+class FakeTicker:
+    """Stand-in for yfinance.Ticker with canned info and history."""
+
+    info: dict
+    history_df: pd.DataFrame
+
+    def history(self, **_):
+        return self.history_df
+
+
+class SlowInfoTicker:
+    """Ticker whose info lookup blocks briefly and records peak concurrency."""
+
+    def __init__(self, info):
+        self._info = info
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    @property
+    def info(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self._lock:
+            self.in_flight -= 1
+        return self._info
+
+
+class FakeResponse:
+    """Stand-in for an aiohttp response returning a fixed JSON payload."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+    async def json(self, **_):
+        return self._payload
+
+
+class FakeSession:
+    """Stand-in for aiohttp.ClientSession that records GET requests."""
+
+    closed = False
+
+    def __init__(self, payload):
+        self.payload = payload
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.payload)
 
-    # Mock info dict
-    mock_ticker.info = {
+
+@pytest.fixture(scope="module")
+def mock_yfinance_data():
+    """Create stub yfinance ticker data."""
+    # Info dict
+    info = {
         'regularMarketPrice': 185.75,
         'regularMarketChangePercent': 2.3,
         'regularMarketVolume': 52000000,
@@ -35,8 +103,8 @@ def mock_yfinance_data():
         'sector': 'Technology',
     }
 
-    # Mock history DataFrame
-    mock_history = pd.DataFrame({
+    # History DataFrame
+    history = pd.DataFrame({
         'Open': [180.0, 183.0, 185.0],
         'High': [182.0, 185.0, 187.0],
         'Low': [179.0, 182.0, 184.0],
@@ -47,12 +115,11 @@ def mock_yfinance_data():
         date.today() - timedelta(days=1),
         date.today(),
     ]))
-    mock_ticker.history.return_value = mock_history
 
-    return mock_ticker
+    return FakeTicker(info=info, history_df=history)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_alpha_vantage_data():
     """Create mock Alpha Vantage API response."""
     return {
@@ -117,41 +184,41 @@ class TestFetchStockData:
     """Test fetching stock data."""
 
     @pytest.mark.asyncio
-    async def test_fetch_from_yfinance_success(self, mock_yfinance_data):
+    async def test_fetch_from_yfinance_success(self, mock_yfinance_data, yf_ticker):
         """Test successful fetch from yfinance."""
         fetcher = StockFetcher(primary_provider="yfinance")
 
-        with patch('yfinance.Ticker', return_value=mock_yfinance_data):
-            stock_data = await fetcher.fetch_stock_data("AAPL")
+        yf_ticker.ticker = mock_yfinance_data
+        stock_data = await fetcher.fetch_stock_data("AAPL")
 
-            assert isinstance(stock_data, StockData)
-            assert stock_data.symbol == "AAPL"
-            assert stock_data.current_price == 185.75
-            assert stock_data.price_change_percent == 2.3
-            assert stock_data.volume == 52000000
-            assert not stock_data.historical_prices.empty
-            assert stock_data.fundamentals['market_cap'] == 2800000000000
+        assert isinstance(stock_data, StockData)
+        assert stock_data.symbol == "AAPL"
+        assert stock_data.current_price == 185.75
+        assert stock_data.price_change_percent == 2.3
+        assert stock_data.volume == 52000000
+        assert not stock_data.historical_prices.empty
+        assert stock_data.fundamentals['market_cap'] == 2800000000000
 
     @pytest.mark.asyncio
-    async def test_fetch_with_date_range(self, mock_yfinance_data):
+    async def test_fetch_with_date_range(self, mock_yfinance_data, yf_ticker):
         """Test fetching historical data with date range."""
         fetcher = StockFetcher()
 
         start_date = date.today() - timedelta(days=30)
         end_date = date.today()
 
-        with patch('yfinance.Ticker', return_value=mock_yfinance_data):
-            stock_data = await fetcher.fetch_stock_data(
-                "AAPL",
-                start_date=start_date,
-                end_date=end_date
-            )
+        yf_ticker.ticker = mock_yfinance_data
+        stock_data = await fetcher.fetch_stock_data(
+            "AAPL",
+            start_date=start_date,
+            end_date=end_date
+        )
 
-            assert isinstance(stock_data, StockData)
-            assert stock_data.symbol == "AAPL"
+        assert isinstance(stock_data, StockData)
+        assert stock_data.symbol == "AAPL"
 
     @pytest.mark.asyncio
-    async def test_fetch_fallback_to_backup(self, mock_alpha_vantage_data):
+    async def test_fetch_fallback_to_backup(self, mock_alpha_vantage_data, yf_ticker):
         """Test fallback to Alpha Vantage when yfinance fails."""
         fetcher = StockFetcher(
             primary_provider="yfinance",
@@ -160,26 +227,26 @@ class TestFetchStockData:
         )
 
         # Mock yfinance to fail
-        with patch('yfinance.Ticker', side_effect=Exception("yfinance error")):
-            with patch('stock_analyzer.fetcher.StockFetcher._fetch_from_alpha_vantage') as mock_av:
-                mock_av.return_value = StockData(
-                    symbol="AAPL",
-                    current_price=185.75,
-                    price_change_percent=2.3,
-                    volume=52000000,
-                    historical_prices=pd.DataFrame(),
-                    fundamentals={},
-                    metadata={"source": "alpha_vantage"}
-                )
-
-                stock_data = await fetcher.fetch_stock_data("AAPL")
-
-                assert stock_data.symbol == "AAPL"
-                assert stock_data.metadata.get("source") == "alpha_vantage"
-                mock_av.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_fetch_both_providers_fail(self):
+        yf_ticker.error = Exception("yfinance error")
+        with patch('stock_analyzer.fetcher.StockFetcher._fetch_from_alpha_vantage') as mock_av:
+            mock_av.return_value = StockData(
+                symbol="AAPL",
+                current_price=185.75,
+                price_change_percent=2.3,
+                volume=52000000,
+                historical_prices=pd.DataFrame(),
+                fundamentals={},
+                metadata={"source": "alpha_vantage"}
+            )
+
+            stock_data = await fetcher.fetch_stock_data("AAPL")
+
+            assert stock_data.symbol == "AAPL"
+            assert stock_data.metadata.get("source") == "alpha_vantage"
+            mock_av.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_both_providers_fail(self, yf_ticker):
         """Test when both primary and backup providers fail."""
         fetcher = StockFetcher(
             primary_provider="yfinance",
@@ -187,30 +254,30 @@ class TestFetchStockData:
             api_key="test_key"
         )
 
-        with patch('yfinance.Ticker', side_effect=Exception("yfinance error")):
-            with patch('stock_analyzer.fetcher.StockFetcher._fetch_from_alpha_vantage',
-                      side_effect=Exception("alpha vantage error")):
+        yf_ticker.error = Exception("yfinance error")
+        with patch('stock_analyzer.fetcher.StockFetcher._fetch_from_alpha_vantage',
+                  side_effect=Exception("alpha vantage error")):
 
-                with pytest.raises(DataFetchError):
-                    await fetcher.fetch_stock_data("AAPL")
+            with pytest.raises(DataFetchError):
+                await fetcher.fetch_stock_data("AAPL")
 
     @pytest.mark.asyncio
-    async def test_fetch_invalid_symbol(self):
+    async def test_fetch_invalid_symbol(self, yf_ticker):
         """Test fetching data for invalid symbol."""
         fetcher = StockFetcher()
 
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}  # Empty info indicates invalid symbol
+        # Empty info indicates invalid symbol
+        mock_ticker = FakeTicker(info={}, history_df=pd.DataFrame())
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            with pytest.raises(InvalidSymbolError):
-                await fetcher.fetch_stock_data("INVALID123")
+        yf_ticker.ticker = mock_ticker
+        with pytest.raises(InvalidSymbolError):
+            await fetcher.fetch_stock_data("INVALID123")
 
     @pytest.mark.asyncio
-    async def test_fetch_handles_missing_fields(self, mock_yfinance_data):
+    async def test_fetch_handles_missing_fields(self, mock_yfinance_data, yf_ticker):
         """Test that fetch handles missing optional fields gracefully."""
         # Keep minimal required fields, remove optional ones
-        mock_yfinance_data.info = {
+        mock_ticker = replace(mock_yfinance_data, info={
             'regularMarketPrice': 185.75,
             'symbol': 'AAPL',
             'shortName': 'Apple Inc.',
@@ -218,58 +285,220 @@ class TestFetchStockData:
             'marketCap': 2800000000000,
             'volume': 52000000,
             # Missing regularMarketChangePercent, PE ratio, etc.
+        })
+
+        fetcher = StockFetcher()
+
+        yf_ticker.ticker = mock_ticker
+        stock_data = await fetcher.fetch_stock_data("AAPL")
+
+        assert stock_data.current_price == 185.75
+        # Should handle missing optional fields with defaults
+        assert stock_data.price_change_percent == 0.0  # Default when missing
+        # Missing fundamentals are omitted rather than stored as None
+        assert stock_data.fundamentals == {
+            'market_cap': 2800000000000,
+            'sector': 'Technology',
         }
 
+
+class TestFetchCaching:
+    """Test serving repeat fetches from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_hits_cache(self, mock_yfinance_data, yf_ticker):
+        """Test identical fetches call yfinance only once."""
+        cache = StockCache()
+        fetcher = StockFetcher(primary_provider="yfinance", cache=cache)
+
+        yf_ticker.ticker = mock_yfinance_data
+        first = await fetcher.fetch_stock_data("AAPL")
+        second = await fetcher.fetch_stock_data("AAPL")
+
+        assert yf_ticker.calls == ["AAPL"]
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_different_range_misses_cache(self, mock_yfinance_data, yf_ticker):
+        """Test a different date range is fetched separately."""
+        cache = StockCache()
+        fetcher = StockFetcher(primary_provider="yfinance", cache=cache)
+        end = date.today()
+
+        yf_ticker.ticker = mock_yfinance_data
+        await fetcher.fetch_stock_data("AAPL", end - timedelta(days=30), end)
+        await fetcher.fetch_stock_data("AAPL", end - timedelta(days=7), end)
+
+        assert len(yf_ticker.calls) == 2
+        assert (cache.hits, cache.misses) == (0, 2)
+
+
+class TestFetchMany:
+    """Test batched fetching of several symbols."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_downloads_history_once(self, mock_yfinance_data, yf_ticker):
+        """Test history for several symbols comes from a single download call."""
+        fetcher = StockFetcher(primary_provider="yfinance")
+        history = mock_yfinance_data.history_df
+        batched = pd.concat({"AAPL": history, "MSFT": history}, axis=1)
+
+        yf_ticker.ticker = mock_yfinance_data
+        with patch('yfinance.download', return_value=batched) as mock_download, \
+                patch.object(FakeTicker, 'history', autospec=True) as mock_history:
+            results = await fetcher.fetch_many(["AAPL", "MSFT"])
+
+        mock_download.assert_called_once()
+        mock_history.assert_not_called()
+        assert set(results) == {"AAPL", "MSFT"}
+        assert results["MSFT"].current_price == 185.75
+        assert list(results["AAPL"].historical_prices["Close"]) == [181.0, 184.5, 185.75]
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_retries_missing_symbol_individually(
+        self, mock_yfinance_data, yf_ticker
+    ):
+        """Test a symbol missing from the batch falls back to fetch_stock_data."""
+        fetcher = StockFetcher(primary_provider="yfinance")
+        history = mock_yfinance_data.history_df
+        batched = pd.concat({"AAPL": history}, axis=1)
+
+        yf_ticker.ticker = mock_yfinance_data
+        with patch('yfinance.download', return_value=batched), \
+                patch.object(
+                    FakeTicker, 'history', autospec=True, return_value=history
+                ) as mock_history:
+            results = await fetcher.fetch_many(["AAPL", "MSFT"])
+
+        assert set(results) == {"AAPL", "MSFT"}
+        mock_history.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_many_looks_up_info_concurrently(self, mock_yfinance_data, yf_ticker):
+        """Test ticker info lookups overlap, bounded by max_concurrency."""
+        fetcher = StockFetcher(primary_provider="yfinance")
+        symbols = ["AAPL", "MSFT", "GOOGL", "AMZN"]
+        history = mock_yfinance_data.history_df
+        batched = pd.concat({symbol: history for symbol in symbols}, axis=1)
+        ticker = SlowInfoTicker(mock_yfinance_data.info)
+
+        yf_ticker.ticker = ticker
+        with patch('yfinance.download', return_value=batched):
+            results = await fetcher.fetch_many(symbols, max_concurrency=2)
+
+        assert set(results) == set(symbols)
+        assert ticker.peak == 2
+
+
+class TestFetchStockDataMany:
+    """Test concurrent fetching of several symbols."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_semaphore(self):
+        """Test no more than max_concurrency fetches run at once."""
         fetcher = StockFetcher()
+        in_flight = 0
+        peak = 0
 
-        with patch('yfinance.Ticker', return_value=mock_yfinance_data):
-            stock_data = await fetcher.fetch_stock_data("AAPL")
+        async def fake_fetch(symbol, start_date=None, end_date=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return symbol
+
+        symbols = [f"SYM{i}" for i in range(20)]
+        with patch.object(fetcher, 'fetch_stock_data', AsyncMock(side_effect=fake_fetch)):
+            results = await fetcher.fetch_stock_data_many(symbols, max_concurrency=4)
+
+        assert results == symbols
+        assert peak == 4
 
-            assert stock_data.current_price == 185.75
-            # Should handle missing optional fields with defaults
-            assert stock_data.price_change_percent == 0.0  # Default when missing
+    @pytest.mark.asyncio
+    async def test_failures_returned_in_place(self):
+        """Test a failing symbol yields its exception without aborting the rest."""
+        fetcher = StockFetcher()
+        error = InvalidSymbolError("BAD", "Symbol not found")
+
+        async def fake_fetch(symbol, start_date=None, end_date=None):
+            if symbol == "BAD":
+                raise error
+            return symbol
+
+        with patch.object(fetcher, 'fetch_stock_data', AsyncMock(side_effect=fake_fetch)):
+            results = await fetcher.fetch_stock_data_many(["AAPL", "BAD", "MSFT"])
+
+        assert results == ["AAPL", error, "MSFT"]
 
 
 class TestValidateSymbol:
     """Test stock symbol validation."""
 
     @pytest.mark.asyncio
-    async def test_validate_valid_symbol(self, mock_yfinance_data):
+    async def test_validate_valid_symbol(self, mock_yfinance_data, yf_ticker):
         """Test validating a valid stock symbol."""
         fetcher = StockFetcher()
 
-        with patch('yfinance.Ticker', return_value=mock_yfinance_data):
-            result = await fetcher.validate_symbol("AAPL")
+        yf_ticker.ticker = mock_yfinance_data
+        result = await fetcher.validate_symbol("AAPL")
 
-            assert result is True
+        assert result is True
 
     @pytest.mark.asyncio
-    async def test_validate_invalid_symbol(self):
+    async def test_validate_invalid_symbol(self, yf_ticker):
         """Test validating an invalid stock symbol."""
         fetcher = StockFetcher()
 
-        mock_ticker = MagicMock()
-        mock_ticker.info = {}  # Empty info = invalid
+        # Empty info = invalid
+        mock_ticker = FakeTicker(info={}, history_df=pd.DataFrame())
+
+        yf_ticker.ticker = mock_ticker
+        result = await fetcher.validate_symbol("INVALID")
+
+        assert result is False
+
+    @pytest.mark.parametrize("symbol", ["", "AAPL MSFT", "AAPL;", "$AAPL", "X" * 16, None])
+    @pytest.mark.asyncio
+    async def test_validate_malformed_symbol_skips_lookup(self, symbol, yf_ticker):
+        """Test malformed symbols are rejected without calling yfinance."""
+        fetcher = StockFetcher()
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            result = await fetcher.validate_symbol("INVALID")
+        result = await fetcher.validate_symbol(symbol)
 
-            assert result is False
+        assert result is False
+        assert yf_ticker.calls == []
 
+    @pytest.mark.parametrize("symbol", ["BRK-B", "BRK.B", "7203.T", "EURUSD=X", "^GSPC", "aapl"])
     @pytest.mark.asyncio
-    async def test_validate_delisted_symbol(self):
+    async def test_validate_accepts_yahoo_symbol_shapes(
+        self, symbol, mock_yfinance_data, yf_ticker
+    ):
+        """Test symbols in any Yahoo format still reach yfinance."""
+        fetcher = StockFetcher()
+
+        yf_ticker.ticker = mock_yfinance_data
+        result = await fetcher.validate_symbol(symbol)
+
+        assert result is True
+        assert yf_ticker.calls == [symbol]
+
+    @pytest.mark.asyncio
+    async def test_validate_delisted_symbol(self, yf_ticker):
         """Test validating a delisted symbol."""
         fetcher = StockFetcher()
 
-        mock_ticker = MagicMock()
-        mock_ticker.info = {'symbol': 'XYZ'}  # Has some data but might be delisted
-        mock_ticker.history.return_value = pd.DataFrame()  # No recent history
+        mock_ticker = FakeTicker(
+            info={'symbol': 'XYZ'},  # Has some data but might be delisted
+            history_df=pd.DataFrame(),  # No recent history
+        )
 
-        with patch('yfinance.Ticker', return_value=mock_ticker):
-            result = await fetcher.validate_symbol("XYZ")
+        yf_ticker.ticker = mock_ticker
+        result = await fetcher.validate_symbol("XYZ")
 
-            # Should return False if no recent trading data
-            assert isinstance(result, bool)
+        # Should return False if no recent trading data
+        assert isinstance(result, bool)
 
 
 class TestAlphaVantageIntegration:
@@ -278,40 +507,147 @@ class TestAlphaVantageIntegration:
     @pytest.mark.asyncio
     async def test_fetch_from_alpha_vantage(self, mock_alpha_vantage_data):
         """Test fetching from Alpha Vantage directly."""
+        session = FakeSession(mock_alpha_vantage_data)
         fetcher = StockFetcher(
             primary_provider="alpha_vantage",
-            api_key="test_key"
+            api_key="test_key",
+            session=session,
         )
 
-        with patch('stock_analyzer.fetcher.requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = mock_alpha_vantage_data
-            mock_response.raise_for_status.return_value = None
-            mock_get.return_value = mock_response
+        stock_data = await fetcher.fetch_stock_data("AAPL")
 
-            stock_data = await fetcher.fetch_stock_data("AAPL")
+        assert stock_data.symbol == "AAPL"
+        assert stock_data.metadata.get("source") == "alpha_vantage"
+        # Latest trading day drives the price even though the API lists it first
+        assert stock_data.current_price == 185.75
+        assert stock_data.volume == 52000000
+        assert stock_data.historical_prices.index.is_monotonic_increasing
+        assert session.calls[0][1]["params"]["symbol"] == "AAPL"
 
-            assert stock_data.symbol == "AAPL"
-            assert stock_data.metadata.get("source") == "alpha_vantage"
+    @pytest.mark.asyncio
+    async def test_alpha_vantage_history_keeps_full_precision(self, mock_alpha_vantage_data):
+        """Test price columns stay float64 unless compaction is requested."""
+        fetcher = StockFetcher(
+            primary_provider="alpha_vantage",
+            api_key="test_key",
+            session=FakeSession(mock_alpha_vantage_data),
+        )
+
+        stock_data = await fetcher.fetch_stock_data("AAPL")
+
+        prices = stock_data.historical_prices[["Open", "High", "Low", "Close"]]
+        assert (prices.dtypes == "float64").all()
 
     @pytest.mark.asyncio
-    async def test_alpha_vantage_rate_limit(self):
-        """Test handling Alpha Vantage rate limit."""
+    async def test_alpha_vantage_history_is_compact(self, mock_alpha_vantage_data):
+        """Test compact_prices stores price columns at half the width of float64."""
         fetcher = StockFetcher(
             primary_provider="alpha_vantage",
-            api_key="test_key"
+            api_key="test_key",
+            session=FakeSession(mock_alpha_vantage_data),
+            compact_prices=True,
         )
 
-        with patch('stock_analyzer.fetcher.requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.json.return_value = {
-                'Note': 'Thank you for using Alpha Vantage! Our standard API call frequency is 25 calls per day.'
+        stock_data = await fetcher.fetch_stock_data("AAPL")
+
+        prices = stock_data.historical_prices[["Open", "High", "Low", "Close"]]
+        assert (prices.dtypes == "float32").all()
+        assert prices.memory_usage(index=False).sum() * 2 <= (
+            prices.astype("float64").memory_usage(index=False).sum()
+        )
+        assert list(stock_data.historical_prices["Close"]) == [184.5, 185.75]
+
+    @pytest.mark.asyncio
+    async def test_alpha_vantage_long_history(self):
+        """Test a long newest-first series is parsed into an ascending frame."""
+        end = date(2024, 12, 31)
+        time_series = {
+            (end - timedelta(days=i)).isoformat(): {
+                '1. open': f'{100 + i:.2f}',
+                '2. high': f'{101 + i:.2f}',
+                '3. low': f'{99 + i:.2f}',
+                '4. close': f'{100.5 + i:.2f}',
+                '5. volume': str(1000000 + i),
             }
-            mock_get.return_value = mock_response
+            for i in range(500)
+        }
+
+        fetcher = StockFetcher(
+            primary_provider="alpha_vantage",
+            api_key="test_key",
+            session=FakeSession({'Time Series (Daily)': time_series}),
+        )
 
+        stock_data = await fetcher.fetch_stock_data("AAPL", end - timedelta(days=99), end)
+
+        history = stock_data.historical_prices
+        assert len(history) == 100
+        assert history.index[0] == end - timedelta(days=99)
+        assert history.index[-1] == end
+        assert history["Close"].iloc[-1] == 100.5
+        assert history["Volume"].iloc[0] == 1000099
+        assert stock_data.current_price == 100.5
+        assert stock_data.price_change_percent == pytest.approx((100.5 - 101.5) / 101.5 * 100)
+
+    @pytest.mark.asyncio
+    async def test_alpha_vantage_rate_limit(self):
+        """Test handling Alpha Vantage rate limit."""
+        session = FakeSession({
+            'Note': (
+                'Thank you for using Alpha Vantage! '
+                'Our standard API call frequency is 25 calls per day.'
+            )
+        })
+        fetcher = StockFetcher(
+            primary_provider="alpha_vantage",
+            api_key="test_key",
+            session=session,
+        )
+
+        with patch('stock_analyzer.fetcher.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
             with pytest.raises(RateLimitError):
                 await fetcher.fetch_stock_data("AAPL")
 
+        # An exhausted daily quota is not retried: that would spend more of it
+        assert len(session.calls) == 1
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_short_throttling_backs_off_and_retries(self):
+        """Test HTTP 429 responses are retried with exponential backoff."""
+        fetcher = StockFetcher()
+        too_many = aiohttp.ClientResponseError(None, (), status=429)
+        request = AsyncMock(side_effect=[too_many, too_many, {"ok": True}])
+
+        with patch('stock_analyzer.fetcher.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            result = await fetcher._call_provider("alpha_vantage", request)
+
+        assert result == {"ok": True}
+        assert request.await_count == 3
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert all(0.75 * 2 ** i <= d <= 1.25 * 2 ** i for i, d in enumerate(delays))
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_owned_session(self):
+        """Test the fetcher reuses one session and closes it on exit."""
+        async with StockFetcher(api_key="test_key") as fetcher:
+            session = fetcher._get_session()
+            assert fetcher._get_session() is session
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_injected_session_left_open(self, mock_alpha_vantage_data):
+        """Test a caller-provided session is not closed by the fetcher."""
+        session = FakeSession(mock_alpha_vantage_data)
+        session.close = AsyncMock()
+
+        async with StockFetcher(api_key="test_key", session=session):
+            pass
+
+        session.close.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_alpha_vantage_requires_api_key(self):
         """Test that Alpha Vantage requires API key."""
@@ -324,6 +660,40 @@ class TestAlphaVantageIntegration:
             await fetcher.fetch_stock_data("AAPL")
 
 
+class TestRateLimiter:
+    """Test the per-provider sliding-window rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_slots_regenerate_after_period(self):
+        """Test a full window frees up once its oldest call ages out."""
+        now = [1000.0]
+        limiter = RateLimiter("test", max_calls=2, period=60, max_wait=0, clock=lambda: now[0])
+
+        await limiter.acquire()
+        await limiter.acquire()
+        with pytest.raises(RateLimitError) as exc_info:
+            await limiter.acquire()
+        assert exc_info.value.retry_after == 61
+
+        now[0] += 60
+        await limiter.acquire()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_slot_within_max_wait(self):
+        """Test acquire sleeps until a slot frees instead of raising."""
+        now = [0.0]
+        limiter = RateLimiter("test", max_calls=1, period=5, max_wait=10, clock=lambda: now[0])
+
+        async def advance(seconds):
+            now[0] += seconds
+
+        await limiter.acquire()
+        with patch('stock_analyzer.fetcher.asyncio.sleep', side_effect=advance) as mock_sleep:
+            await limiter.acquire()
+
+        mock_sleep.assert_called_once_with(5)
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
@@ -344,13 +714,13 @@ class TestErrorHandling:
             await fetcher.fetch_stock_data(None)
 
     @pytest.mark.asyncio
-    async def test_network_timeout(self):
+    async def test_network_timeout(self, yf_ticker):
         """Test handling of network timeout."""
         fetcher = StockFetcher()
 
-        with patch('yfinance.Ticker', side_effect=TimeoutError("Network timeout")):
-            with pytest.raises(DataFetchError):
-                await fetcher.fetch_stock_data("AAPL")
+        yf_ticker.error = TimeoutError("Network timeout")
+        with pytest.raises(DataFetchError):
+            await fetcher.fetch_stock_data("AAPL")
 
     @pytest.mark.asyncio
     async def test_invalid_date_range(self):
@@ -8,8 +8,13 @@ Tests the abstract base class and concrete implementations for:
 - LLMClientFactory
 """
 
+import json
+import sys
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import replace
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 from stock_analyzer.exceptions import AnalysisError
 from stock_analyzer.llm_client import (
@@ -23,7 +28,60 @@ from stock_analyzer.models import AnalysisResponse, StockData
 import pandas as pd
 
 
-@pytest.fixture
+def claude_response(text, input_tokens, output_tokens, **cache_usage):
+    """Build a stub Anthropic messages response."""
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(
+            input_tokens=input_tokens, output_tokens=output_tokens, **cache_usage
+        ),
+    )
+
+
+def openai_response(text, prompt_tokens, completion_tokens):
+    """Build a stub OpenAI chat completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text), finish_reason="stop")],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        ),
+    )
+
+
+def gemini_response(text, prompt_tokens, candidates_tokens):
+    """Build a stub Gemini generate_content response."""
+    return SimpleNamespace(
+        text=text,
+        usage_metadata=SimpleNamespace(
+            prompt_token_count=prompt_tokens,
+            candidates_token_count=candidates_tokens,
+            total_token_count=prompt_tokens + candidates_tokens,
+        ),
+    )
+
+
+async def aiter_chunks(chunks):
+    """Yield chunks as an async iterator, like an SDK response stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+class ClaudeStream:
+    """Stub for the async context manager returned by messages.stream()."""
+
+    def __init__(self, texts):
+        self.text_stream = aiter_chunks(texts)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(scope="module")
 def mock_stock_data():
     """Create mock stock data for testing."""
     return StockData(
@@ -69,9 +127,9 @@ class TestClaudeLLMClient:
         )
 
         # Mock the Anthropic client response
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="Strong upward momentum with positive indicators.")]
-        mock_response.usage = MagicMock(input_tokens=1000, output_tokens=500)
+        mock_response = claude_response(
+            "Strong upward momentum with positive indicators.", 1000, 500
+        )
 
         with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -96,9 +154,7 @@ class TestClaudeLLMClient:
             enable_caching=True
         )
 
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="Analysis text")]
-        mock_response.usage = MagicMock(input_tokens=100, output_tokens=50)
+        mock_response = claude_response("Analysis text", 100, 50)
 
         with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -116,6 +172,34 @@ class TestClaudeLLMClient:
             if system_arg:
                 assert any('cache_control' in msg for msg in system_arg if isinstance(msg, dict))
 
+    @pytest.mark.parametrize(
+        "cache_usage, expected_read, expected_write, expected_cached",
+        [
+            ({}, 0, 0, False),
+            ({"cache_read_input_tokens": 0, "cache_creation_input_tokens": 900}, 0, 900, False),
+            ({"cache_read_input_tokens": 900, "cache_creation_input_tokens": 0}, 900, 0, True),
+            ({"cache_read_input_tokens": None, "cache_creation_input_tokens": None}, 0, 0, False),
+        ],
+        ids=["no_counters", "cache_write", "cache_read", "null_counters"],
+    )
+    @pytest.mark.asyncio
+    async def test_analyze_reports_cache_usage(
+        self, mock_stock_data, cache_usage, expected_read, expected_write, expected_cached
+    ):
+        """Test prompt-cache counters are surfaced and only reads count as cached."""
+        client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-5")
+        mock_response = claude_response("Analysis text", 100, 50, **cache_usage)
+
+        with patch.object(client.client.messages, 'create', new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = mock_response
+
+            response = await client.analyze("Test prompt", mock_stock_data, "System prompt")
+
+        assert response.tokens_used == 150
+        assert response.metadata["cache_read_input_tokens"] == expected_read
+        assert response.metadata["cache_creation_input_tokens"] == expected_write
+        assert response.metadata["cached"] is expected_cached
+
     @pytest.mark.asyncio
     async def test_analyze_api_error(self, mock_stock_data):
         """Test handling of API errors."""
@@ -130,6 +214,78 @@ class TestClaudeLLMClient:
                     stock_data=mock_stock_data
                 )
 
+    @pytest.mark.asyncio
+    async def test_analyze_stream_yields_text_deltas(self, mock_stock_data):
+        """Test that streamed text deltas are yielded in order."""
+        client = ClaudeLLMClient(api_key="test-key", enable_caching=True)
+
+        with patch.object(
+            client.client.messages, 'stream', return_value=ClaudeStream(["Strong ", "momentum"])
+        ) as mock_stream:
+            chunks = [
+                chunk async for chunk in client.analyze_stream(
+                    prompt="Analyze AAPL stock",
+                    stock_data=mock_stock_data,
+                    system_prompt="You are a stock analyst",
+                )
+            ]
+
+        assert chunks == ["Strong ", "momentum"]
+        system = mock_stream.call_args.kwargs['system']
+        assert system[0]['cache_control'] == {"type": "ephemeral"}
+
+    @pytest.mark.asyncio
+    async def test_analyze_stream_api_error(self, mock_stock_data):
+        """Test that streaming errors are raised as AnalysisError."""
+        client = ClaudeLLMClient(api_key="test-key")
+
+        with patch.object(client.client.messages, 'stream', side_effect=Exception("API error")):
+            with pytest.raises(AnalysisError):
+                async for _ in client.analyze_stream("Analyze AAPL", mock_stock_data):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_maps_results_to_jobs(self, mock_stock_data):
+        """Test that batch results are matched to jobs and failures reported per job."""
+        client = ClaudeLLMClient(api_key="test-key", model="claude-sonnet-4-5")
+        msft = replace(mock_stock_data, symbol="MSFT")
+        jobs = [("Analyze AAPL", mock_stock_data, "System"), ("Analyze MSFT", msft, None)]
+        batches = client.client.messages.batches
+        pending = SimpleNamespace(id="b1", processing_status="in_progress")
+        ended = SimpleNamespace(id="b1", processing_status="ended")
+        succeeded = SimpleNamespace(type="succeeded", message=claude_response("Bullish", 100, 50))
+        results = aiter_chunks([
+            SimpleNamespace(custom_id="job-1", result=SimpleNamespace(type="errored")),
+            SimpleNamespace(custom_id="job-0", result=succeeded),
+        ])
+
+        with patch.object(batches, 'create', AsyncMock(return_value=pending)) as mock_create, \
+                patch.object(batches, 'retrieve', AsyncMock(return_value=ended)), \
+                patch.object(batches, 'results', AsyncMock(return_value=results)), \
+                patch('stock_analyzer.llm_client.asyncio.sleep', AsyncMock()) as mock_sleep:
+            responses = await client.analyze_batch(jobs)
+
+        assert responses[0].text == "Bullish"
+        assert responses[0].tokens_used == 150
+        assert isinstance(responses[1], AnalysisError)
+        assert responses[1].symbol == "MSFT"
+        mock_sleep.assert_awaited_once()
+        requests = mock_create.call_args.kwargs['requests']
+        assert [r['custom_id'] for r in requests] == ["job-0", "job-1"]
+        assert "system" not in requests[1]['params']
+
+    @pytest.mark.asyncio
+    async def test_analyze_batch_submission_error(self, mock_stock_data):
+        """Test that a failed submission yields an AnalysisError for every job."""
+        client = ClaudeLLMClient(api_key="test-key")
+        jobs = [("Analyze AAPL", mock_stock_data, None)] * 2
+
+        batches = client.client.messages.batches
+        with patch.object(batches, 'create', side_effect=Exception("API error")):
+            responses = await client.analyze_batch(jobs)
+
+        assert all(isinstance(response, AnalysisError) for response in responses)
+
     @pytest.mark.asyncio
     async def test_count_tokens(self):
         """Test token counting (uses approximation)."""
@@ -156,11 +312,7 @@ class TestOpenAILLMClient:
         )
 
         # Mock OpenAI response
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="Strong bullish trend observed."))
-        ]
-        mock_response.usage = MagicMock(total_tokens=1200)
+        mock_response = openai_response("Strong bullish trend observed.", 800, 400)
 
         with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -184,9 +336,7 @@ class TestOpenAILLMClient:
             temperature=0.5
         )
 
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="Analysis"))]
-        mock_response.usage = MagicMock(total_tokens=100)
+        mock_response = openai_response("Analysis", 60, 40)
 
         with patch.object(client.client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
             mock_create.return_value = mock_response
@@ -197,6 +347,70 @@ class TestOpenAILLMClient:
             call_args = mock_create.call_args
             assert call_args.kwargs.get('temperature') == 0.5
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_reads_output_and_error_files(self, mock_stock_data):
+        """Test that batch output and error files are matched back to jobs."""
+        client = OpenAILLMClient(api_key="test-key", model="gpt-4o")
+        jobs = [("Analyze AAPL", mock_stock_data, "System")] * 2
+        completion = {
+            "id": "c1", "object": "chat.completion", "created": 0, "model": "gpt-4o",
+            "choices": [{
+                "index": 0, "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Bullish"},
+            }],
+            "usage": {"prompt_tokens": 80, "completion_tokens": 40, "total_tokens": 120},
+        }
+        files = {
+            "out": json.dumps({
+                "custom_id": "job-0", "response": {"status_code": 200, "body": completion},
+            }),
+            "err": json.dumps({
+                "custom_id": "job-1", "response": None, "error": {"message": "bad request"},
+            }),
+        }
+        done = SimpleNamespace(
+            id="b1", status="completed", output_file_id="out", error_file_id="err"
+        )
+        uploaded_file = SimpleNamespace(id="f1")
+
+        def file_content(file_id):
+            return SimpleNamespace(text=files[file_id])
+
+        with patch.object(client.client.files, 'create', AsyncMock(return_value=uploaded_file)) \
+                as mock_upload, \
+                patch.object(client.client.batches, 'create', AsyncMock(return_value=done)), \
+                patch.object(client.client.files, 'content', AsyncMock(side_effect=file_content)):
+            responses = await client.analyze_batch(jobs)
+
+        assert responses[0].text == "Bullish"
+        assert responses[0].tokens_used == 120
+        assert isinstance(responses[1], AnalysisError)
+        assert "bad request" in str(responses[1])
+        uploaded = mock_upload.call_args.kwargs['file'][1].decode().splitlines()
+        first_message = json.loads(uploaded[0])['body']['messages'][0]
+        assert first_message == {"role": "system", "content": "System"}
+
+    @pytest.mark.asyncio
+    async def test_analyze_stream_skips_empty_deltas(self, mock_stock_data):
+        """Test that streamed content deltas are yielded and empty ones skipped."""
+        client = OpenAILLMClient(api_key="test-key")
+        stream = aiter_chunks([
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="Bullish "))]),
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=None))]),
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content="trend"))]),
+            SimpleNamespace(choices=[]),
+        ])
+
+        with patch.object(
+            client.client.chat.completions, 'create', new_callable=AsyncMock, return_value=stream
+        ) as mock_create:
+            chunks = [
+                chunk async for chunk in client.analyze_stream("Analyze AAPL", mock_stock_data)
+            ]
+
+        assert chunks == ["Bullish ", "trend"]
+        assert mock_create.call_args.kwargs['stream'] is True
+
     @pytest.mark.asyncio
     async def test_count_tokens_approximation(self):
         """Test token counting (uses approximation for OpenAI)."""
@@ -206,6 +420,68 @@ class TestOpenAILLMClient:
         count = await client.count_tokens("This is a test string with multiple words")
         assert count > 0  # Should return some positive number
 
+    @pytest.mark.asyncio
+    async def test_count_tokens_uses_model_encoding(self):
+        """Test token counting uses the model's tiktoken encoding when available."""
+        client = OpenAILLMClient(api_key="test-key", model="gpt-4o")
+        encoding = SimpleNamespace(encode_ordinary=lambda text: text.split())
+
+        with patch('stock_analyzer.llm_client._openai_encoding', return_value=encoding) as mock_enc:
+            count = await client.count_tokens("hello world")
+
+        assert count == 2
+        mock_enc.assert_called_once_with("gpt-4o")
+
+    @pytest.mark.asyncio
+    async def test_count_tokens_accepts_special_token_text(self):
+        """Test text containing a special-token string is counted, not rejected."""
+        import tiktoken
+
+        # Byte-level encoding built locally, so no BPE download is needed
+        encoding = tiktoken.Encoding(
+            name="bytes",
+            pat_str=r"\S+|\s+",
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={"<|endoftext|>": 256},
+        )
+        client = OpenAILLMClient(api_key="test-key")
+        text = "News: <|endoftext|>"
+
+        with patch('stock_analyzer.llm_client._openai_encoding', return_value=encoding):
+            count = await client.count_tokens(text)
+
+        assert count == len(text.encode())
+
+    def test_encoding_load_failure_is_retried(self):
+        """Test a failed encoding load is not cached but a successful one is."""
+        from stock_analyzer.llm_client import _load_openai_encoding, _openai_encoding
+
+        encoding = object()
+        _load_openai_encoding.cache_clear()
+        try:
+            with patch(
+                'tiktoken.encoding_for_model',
+                side_effect=[ConnectionError("offline"), encoding],
+            ) as mock_load:
+                assert _openai_encoding("gpt-4o") is None
+                assert _openai_encoding("gpt-4o") is encoding
+                assert _openai_encoding("gpt-4o") is encoding
+        finally:
+            _load_openai_encoding.cache_clear()
+
+        assert mock_load.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_count_tokens_falls_back_without_tiktoken(self):
+        """Test token counting falls back to approximation without an encoding."""
+        client = OpenAILLMClient(api_key="test-key")
+        text = "This is a test string"
+
+        with patch('stock_analyzer.llm_client._openai_encoding', return_value=None):
+            count = await client.count_tokens(text)
+
+        assert count == len(text) // 4
+
 
 class TestGeminiLLMClient:
     """Test Google Gemini LLM client."""
@@ -221,9 +497,7 @@ class TestGeminiLLMClient:
         )
 
         # Mock Gemini response
-        mock_response = MagicMock()
-        mock_response.text = "Positive outlook with strong fundamentals."
-        mock_response.usage_metadata = MagicMock(total_token_count=800)
+        mock_response = gemini_response("Positive outlook with strong fundamentals.", 500, 300)
 
         with patch.object(client.model, 'generate_content_async', new_callable=AsyncMock) as mock_generate:
             mock_generate.return_value = mock_response
@@ -243,9 +517,7 @@ class TestGeminiLLMClient:
         """Test that system prompt is prepended to user prompt."""
         client = GeminiLLMClient(api_key="test-key")
 
-        mock_response = MagicMock()
-        mock_response.text = "Analysis"
-        mock_response.usage_metadata = MagicMock(total_token_count=100)
+        mock_response = gemini_response("Analysis", 60, 40)
 
         with patch.object(client.model, 'generate_content_async', new_callable=AsyncMock) as mock_generate:
             mock_generate.return_value = mock_response
@@ -262,6 +534,37 @@ class TestGeminiLLMClient:
             assert "System prompt" in full_prompt
             assert "User prompt" in full_prompt
 
+    @pytest.mark.asyncio
+    async def test_analyze_batch_falls_back_to_analyze(self, mock_stock_data):
+        """Test that Gemini batches run analyze() per job and keep failures per job."""
+        client = GeminiLLMClient(api_key="test-key")
+        ok = AnalysisResponse(text="Positive", tokens_used=10, model="gemini-2.5-pro")
+        error = AnalysisError("MSFT", "Gemini API error")
+
+        with patch.object(client, 'analyze', new_callable=AsyncMock, side_effect=[ok, error]):
+            responses = await client.analyze_batch([
+                ("Analyze AAPL", mock_stock_data, None),
+                ("Analyze MSFT", mock_stock_data, None),
+            ])
+
+        assert responses == [ok, error]
+
+    @pytest.mark.asyncio
+    async def test_analyze_stream_yields_chunks(self, mock_stock_data):
+        """Test that streamed Gemini chunks are yielded in order."""
+        client = GeminiLLMClient(api_key="test-key")
+        stream = aiter_chunks([SimpleNamespace(text="Positive "), SimpleNamespace(text="outlook")])
+
+        with patch.object(
+            client.model, 'generate_content_async', new_callable=AsyncMock, return_value=stream
+        ) as mock_generate:
+            chunks = [
+                chunk async for chunk in client.analyze_stream("Analyze AAPL", mock_stock_data)
+            ]
+
+        assert chunks == ["Positive ", "outlook"]
+        assert mock_generate.call_args.kwargs['stream'] is True
+
     @pytest.mark.asyncio
     async def test_count_tokens_approximation(self):
         """Test token counting for Gemini."""
@@ -361,29 +664,60 @@ class TestLLMClientFactory:
         assert isinstance(client1, ClaudeLLMClient)
         assert isinstance(client2, ClaudeLLMClient)
         assert isinstance(client3, ClaudeLLMClient)
+        assert client1 is client2 is client3
+
+    def test_create_separates_clients_by_key_and_model(self):
+        """Test that cached clients are not shared across keys or models."""
+        client = LLMClientFactory.create(provider="openai", api_key="key-a")
+
+        assert LLMClientFactory.create(provider="openai", api_key="key-b") is not client
+        assert LLMClientFactory.create(
+            provider="openai", api_key="key-a", model="gpt-4o-mini"
+        ) is not client
+
+    @pytest.mark.asyncio
+    async def test_close_all_closes_cached_clients(self):
+        """Test that close_all closes cached clients and empties the cache."""
+        client = LLMClientFactory.create(provider="anthropic", api_key="close-key")
+
+        with patch.object(client, 'aclose', AsyncMock()) as mock_aclose:
+            await LLMClientFactory.close_all()
+
+        mock_aclose.assert_awaited_once()
+        assert LLMClientFactory.create(provider="anthropic", api_key="close-key") is not client
 
 
 class TestProviderIntegration:
     """Test integration between different providers."""
 
-    @pytest.mark.asyncio
-    async def test_all_providers_return_same_interface(self, mock_stock_data):
-        """Test that all providers return AnalysisResponse with same structure."""
-        providers = [
+    @pytest.mark.parametrize(
+        "provider_name, client_class, model",
+        [
             ("anthropic", ClaudeLLMClient, "claude-sonnet-4-5"),
             ("openai", OpenAILLMClient, "gpt-4o"),
             ("gemini", GeminiLLMClient, "gemini-2.5-pro"),
-        ]
+        ],
+    )
+    def test_all_providers_return_same_interface(self, provider_name, client_class, model):
+        """Test that all providers return AnalysisResponse with same structure."""
+        client = LLMClientFactory.create(
+            provider=provider_name,
+            api_key="test-key",
+            model=model
+        )
 
-        for provider_name, client_class, model in providers:
-            client = LLMClientFactory.create(
-                provider=provider_name,
-                api_key="test-key",
-                model=model
-            )
+        assert isinstance(client, client_class)
+        assert isinstance(client, LLMClient)
+
+    def test_create_imports_only_selected_sdk(self):
+        """Test that creating one provider's client does not import the other SDKs."""
+        # A None entry in sys.modules makes any import of that module fail
+        blocked = {"openai": None, "google.generativeai": None}
+        with patch.dict(sys.modules, blocked):
+            # Unique key so the client is built here rather than served from the cache
+            client = LLMClientFactory.create(provider="anthropic", api_key="sdk-guard-key")
 
-            assert isinstance(client, client_class)
-            assert isinstance(client, LLMClient)
+        assert isinstance(client, ClaudeLLMClient)
 
     def test_all_providers_have_required_methods(self):
         """Test that all provider implementations have required methods."""
@@ -9,6 +9,8 @@ import logging
 import pytest
 
 from stock_analyzer.logging import (
+    DEFAULT_DATE_FORMAT,
+    DEFAULT_FORMAT,
     LogContext,
     get_logger,
     log_analysis_complete,
@@ -21,28 +23,54 @@ from stock_analyzer.logging import (
     setup_logging,
 )
 
+SETUP_VARIANTS = [
+    {"level": "INFO"},
+    {"level": "DEBUG"},
+    {"level": "WARNING"},
+    {"format_string": "%(levelname)s - %(message)s"},
+    {"date_format": "%Y-%m-%d"},
+]
+
+
+@pytest.fixture(params=SETUP_VARIANTS, ids=lambda kwargs: "-".join(kwargs.values()))
+def configured_root_logger(request):
+    """
+    Run setup_logging with one variant.
+
+    Yields the root logger, the handler setup_logging installed and the
+    variant's kwargs. setup_logging replaces the root handlers, so the
+    previous handlers and level are restored afterwards to keep the change
+    out of other tests.
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+
+    setup_logging(**request.param)
+    # Taken now: pytest attaches its own capture handler once the test starts
+    (handler,) = root.handlers
+    yield root, handler, request.param
+
+    root.handlers[:] = saved_handlers
+    root.setLevel(saved_level)
+
+
+@pytest.fixture(scope="module")
+def logger():
+    """Logger shared by tests that only need somewhere to log to."""
+    return get_logger(__name__)
+
 
 class TestSetupLogging:
     """Test logging setup and configuration."""
 
-    def test_setup_logging_completes_without_error(self):
-        """Test that setup_logging completes without errors."""
-        # Should not raise any exceptions
-        setup_logging()
-        setup_logging(level="DEBUG")
-        setup_logging(level="WARNING")
-
-    def test_setup_logging_accepts_custom_format(self):
-        """Test setup with custom format string."""
-        custom_format = "%(levelname)s - %(message)s"
-        # Should not raise any exceptions
-        setup_logging(format_string=custom_format)
+    def test_setup_logging_applies_configuration(self, configured_root_logger):
+        """Test that level, format and date format are applied to the root logger."""
+        root, handler, kwargs = configured_root_logger
 
-    def test_setup_logging_accepts_custom_date_format(self):
-        """Test setup with custom date format."""
-        custom_date = "%Y-%m-%d"
-        # Should not raise any exceptions
-        setup_logging(date_format=custom_date)
+        assert root.level == getattr(logging, kwargs.get("level", "INFO"))
+        formatter = handler.formatter
+        assert formatter._fmt == kwargs.get("format_string", DEFAULT_FORMAT)
+        assert formatter.datefmt == kwargs.get("date_format", DEFAULT_DATE_FORMAT)
 
 
 class TestGetLogger:
@@ -69,18 +97,14 @@ class TestGetLogger:
 class TestLogContext:
     """Test LogContext context manager."""
 
-    def test_log_context_completes_without_error(self):
+    def test_log_context_completes_without_error(self, logger):
         """Test that LogContext works without errors."""
-        logger = get_logger(__name__)
-
         # Should not raise any exceptions
         with LogContext(logger, operation="test_op", user_id=123):
             logger.info("Test with context")
 
-    def test_log_context_with_multiple_fields(self):
+    def test_log_context_with_multiple_fields(self, logger):
         """Test LogContext with multiple context fields."""
-        logger = get_logger(__name__)
-
         with LogContext(logger, operation="test", symbol="AAPL", user_id=123):
             logger.info("Test message")
 
@@ -90,44 +114,37 @@ class TestLogContext:
 class TestConvenienceFunctions:
     """Test convenience logging functions."""
 
-    def test_log_api_call(self):
+    def test_log_api_call(self, logger):
         """Test log_api_call function."""
-        logger = get_logger(__name__)
         # Should not raise exceptions
         log_api_call(logger, "test_provider", "test_method", param1="value1")
 
-    def test_log_api_response(self):
+    def test_log_api_response(self, logger):
         """Test log_api_response function."""
-        logger = get_logger(__name__)
         log_api_response(logger, "test_provider", "success", 1.23)
 
-    def test_log_api_error(self):
+    def test_log_api_error(self, logger):
         """Test log_api_error function."""
-        logger = get_logger(__name__)
         error = ValueError("Test error")
         log_api_error(logger, "test_provider", error)
 
-    def test_log_database_operation(self):
+    def test_log_database_operation(self, logger):
         """Test log_database_operation function."""
-        logger = get_logger(__name__)
         log_database_operation(logger, "INSERT", table="users", id=123)
 
-    def test_log_analysis_start(self):
+    def test_log_analysis_start(self, logger):
         """Test log_analysis_start function."""
-        logger = get_logger(__name__)
         log_analysis_start(logger, "AAPL")
         log_analysis_start(logger, "AAPL", user_id=123)
         log_analysis_start(logger, "AAPL", user_id=None)
 
-    def test_log_analysis_complete(self):
+    def test_log_analysis_complete(self, logger):
         """Test log_analysis_complete function."""
-        logger = get_logger(__name__)
         log_analysis_complete(logger, "AAPL", 2.5, success=True)
         log_analysis_complete(logger, "AAPL", 1.0, success=False)
 
-    def test_log_delivery(self):
+    def test_log_delivery(self, logger):
         """Test log_delivery function."""
-        logger = get_logger(__name__)
         log_delivery(logger, 123, "AAPL", "telegram", success=True)
         log_delivery(logger, 123, "AAPL", "telegram", success=False)
 
@@ -135,19 +152,26 @@ class TestConvenienceFunctions:
 class TestLoggingIntegration:
     """Test logging in realistic scenarios."""
 
-    def test_logging_workflow_completes(self):
+    def test_logging_workflow_completes(self, caplog):
         """Test a complete logging workflow."""
-        setup_logging(level="INFO")
         logger = get_logger("test_workflow")
 
-        # Simulate analysis workflow - should complete without errors
-        log_analysis_start(logger, "AAPL", user_id=123)
-        log_api_call(logger, "yfinance", "fetch_data", symbol="AAPL")
-        log_api_response(logger, "yfinance", "success", 0.5)
-        log_api_call(logger, "claude", "analyze", symbol="AAPL")
-        log_api_response(logger, "claude", "success", 2.0)
-        log_analysis_complete(logger, "AAPL", 2.5, success=True)
-        log_delivery(logger, 123, "AAPL", "telegram", success=True)
+        # Simulate analysis workflow at INFO level
+        with caplog.at_level(logging.INFO, logger="test_workflow"):
+            log_analysis_start(logger, "AAPL", user_id=123)
+            log_api_call(logger, "yfinance", "fetch_data", symbol="AAPL")
+            log_api_response(logger, "yfinance", "success", 0.5)
+            log_api_call(logger, "claude", "analyze", symbol="AAPL")
+            log_api_response(logger, "claude", "success", 2.0)
+            log_analysis_complete(logger, "AAPL", 2.5, success=True)
+            log_delivery(logger, 123, "AAPL", "telegram", success=True)
+
+        # API call and response lines are DEBUG and filtered out at INFO
+        assert [record.message.split(":")[0] for record in caplog.records] == [
+            "Starting stock analysis",
+            "Completed stock analysis",
+            "Insight delivery",
+        ]
 
     def test_logging_with_errors(self):
         """Test logging when errors occur."""
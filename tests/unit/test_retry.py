@@ -329,21 +329,21 @@ class TestRetryTiming:
             jitter=False
         )
         async def async_func():
-            call_times.append(time.time())
+            call_times.append(time.monotonic_ns())
             if len(call_times) < 3:
                 raise ValueError("Error")
             return "success"
 
         await async_func()
 
-        # Check that delays are approximately correct
-        # First retry: ~0.1s delay (1.0 * 2^0 = 0.1)
-        # Second retry: ~0.2s delay (1.0 * 2^1 = 0.2)
+        # Check that delays are approximately correct (monotonic nanoseconds)
+        # First retry: ~0.1s delay (0.1 * 2^0 = 0.1)
+        # Second retry: ~0.2s delay (0.1 * 2^1 = 0.2)
         delay1 = call_times[1] - call_times[0]
         delay2 = call_times[2] - call_times[1]
 
-        assert 0.08 <= delay1 <= 0.15  # ~0.1s with some tolerance
-        assert 0.18 <= delay2 <= 0.25  # ~0.2s with some tolerance
+        assert 80_000_000 <= delay1 <= 150_000_000  # ~0.1s with some tolerance
+        assert 180_000_000 <= delay2 <= 250_000_000  # ~0.2s with some tolerance
 
     def test_sync_retry_respects_delays(self):
         """Test that sync retry waits appropriate delays."""
@@ -356,16 +356,16 @@ class TestRetryTiming:
             jitter=False
         )
         def sync_func():
-            call_times.append(time.time())
+            call_times.append(time.monotonic_ns())
             if len(call_times) < 3:
                 raise ValueError("Error")
             return "success"
 
         sync_func()
 
-        # Check that delays are approximately correct
+        # Check that delays are approximately correct (monotonic nanoseconds)
         delay1 = call_times[1] - call_times[0]
         delay2 = call_times[2] - call_times[1]
 
-        assert 0.08 <= delay1 <= 0.15  # ~0.1s with some tolerance
-        assert 0.18 <= delay2 <= 0.25  # ~0.2s with some tolerance
+        assert 80_000_000 <= delay1 <= 150_000_000  # ~0.1s with some tolerance
+        assert 180_000_000 <= delay2 <= 250_000_000  # ~0.2s with some tolerance
@@ -0,0 +1,33 @@
+"""
+Unit tests for runner module.
+
+Tests that run_async runs coroutines with and without uvloop installed.
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+from stock_analyzer.runner import run_async
+
+
+async def _answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+class TestRunAsync:
+    """Test run_async behaviour."""
+
+    def test_returns_coroutine_result(self):
+        """Test the coroutine's return value is passed through."""
+        assert run_async(_answer()) == 42
+
+    def test_falls_back_without_uvloop(self):
+        """Test the default asyncio loop is used when uvloop is not installed."""
+        # A None entry in sys.modules makes `import uvloop` raise ImportError
+        with patch.dict(sys.modules, {"uvloop": None}), \
+                patch("stock_analyzer.runner.asyncio.run", wraps=asyncio.run) as mock_run:
+            assert run_async(_answer()) == 42
+
+        mock_run.assert_called_once()
@@ -90,6 +90,26 @@ class TestStorageInitialization:
 
         conn.close()
 
+    def test_shared_memory_uri(self):
+        """Test that a shared in-memory URI keeps data across connections."""
+        db_uri = "file:test_storage_uri?mode=memory&cache=shared"
+        keeper = sqlite3.connect(db_uri, uri=True)
+        try:
+            storage = Storage(db_uri)
+            storage.init_database()
+
+            storage.save_analysis(StockAnalysis(
+                stock_symbol="AAPL",
+                analysis_date=date(2026, 1, 15),
+                price_snapshot=185.75,
+                analysis_status="success",
+            ))
+
+            assert storage.get_analysis("AAPL", date(2026, 1, 15)) is not None
+            assert not Path(db_uri).exists()
+        finally:
+            keeper.close()
+
 
 
 class TestAnalysisOperations:
@@ -232,8 +252,8 @@ class TestInsightOperations:
     def test_get_insights_pagination(self, storage):
         """Test pagination with limit and offset."""
         # Save 10 insights
-        for i in range(10):
-            insight = Insight(
+        storage.save_insights([
+            Insight(
                 stock_symbol="GOOGL",
                 analysis_date=date(2026, 1, 1 + i),
                 summary=f"Day {i+1}",
@@ -242,7 +262,8 @@ class TestInsightOperations:
                 opportunities=[],
                 confidence_level="medium"
             )
-            storage.save_insight(insight)
+            for i in range(10)
+        ])
 
         # Test limit
         page1 = storage.get_insights("GOOGL", limit=3, offset=0)
@@ -259,6 +280,57 @@ class TestInsightOperations:
         all_insights = storage.get_insights("GOOGL", limit=100)
         assert len(all_insights) == 10
 
+    def test_save_insights_bulk(self, storage):
+        """Test saving several insights in one transaction."""
+        insights = [
+            Insight(
+                stock_symbol="NVDA",
+                analysis_date=date(2026, 1, 10 + i),
+                summary=f"Bulk {i}",
+                trend_analysis="Test",
+                risk_factors=["Risk"],
+                opportunities=[],
+                confidence_level="low",
+                metadata={"index": i},
+            )
+            for i in range(3)
+        ]
+
+        insight_ids = storage.save_insights(insights)
+
+        assert len(insight_ids) == 3
+        assert [i.id for i in insights] == insight_ids
+        saved = storage.get_insights("NVDA", limit=10)
+        assert {i.id for i in saved} == set(insight_ids)
+        assert saved[0].metadata == {"index": 2}
+
+    def test_save_insights_rolls_back_on_error(self, storage):
+        """Test that a failing bulk save leaves no partial rows."""
+        good = Insight(
+            stock_symbol="AMD",
+            analysis_date=date(2026, 1, 10),
+            summary="Good",
+            trend_analysis="Test",
+            risk_factors=[],
+            opportunities=[],
+            confidence_level="medium",
+        )
+        bad = Insight(
+            stock_symbol="AMD",
+            analysis_date=date(2026, 1, 11),
+            summary=None,  # violates NOT NULL
+            trend_analysis="Test",
+            risk_factors=[],
+            opportunities=[],
+            confidence_level="medium",
+        )
+
+        with pytest.raises(StorageError):
+            storage.save_insights([good, bad])
+
+        assert storage.get_insights("AMD", limit=10) == []
+        assert good.id is None
+
     def test_get_insights_ordered_by_date_desc(self, storage):
         """Test insights are returned in descending date order."""
         # Save insights out of order
@@ -283,6 +355,33 @@ class TestInsightOperations:
         assert insights[1].analysis_date == date(2026, 1, 25)
         assert insights[2].analysis_date == date(2026, 1, 20)
 
+    def test_get_latest_insights(self, storage):
+        """Test fetching the newest insight of several stocks at once."""
+        storage.save_insights([
+            Insight(
+                stock_symbol=symbol,
+                analysis_date=d,
+                summary=f"{symbol} {d.isoformat()}",
+                trend_analysis="Test",
+                risk_factors=[],
+                opportunities=[],
+                confidence_level="medium"
+            )
+            for symbol, d in [
+                ("AAPL", date(2026, 1, 20)),
+                ("AAPL", date(2026, 1, 30)),
+                ("MSFT", date(2026, 1, 25)),
+                ("GOOGL", date(2026, 1, 30)),
+            ]
+        ])
+
+        latest = storage.get_latest_insights(["AAPL", "MSFT", "TSLA"])
+
+        assert set(latest) == {"AAPL", "MSFT"}
+        assert latest["AAPL"].analysis_date == date(2026, 1, 30)
+        assert latest["MSFT"].summary == "MSFT 2026-01-25"
+        assert storage.get_latest_insights([]) == {}
+
 
 class TestJobOperations:
     """Test analysis job tracking operations."""
@@ -353,6 +452,35 @@ class TestDeliveryLogging:
         assert log_id is not None
         assert log_id > 0
 
+    def test_save_delivery_logs_bulk(self, storage):
+        """Test saving several delivery logs in one transaction."""
+        insight_id = storage.save_insight(Insight(
+            stock_symbol="AAPL",
+            analysis_date=date.today(),
+            summary="Test",
+            trend_analysis="Test",
+            risk_factors=[],
+            opportunities=[],
+            confidence_level="high",
+        ))
+
+        storage.save_delivery_logs([
+            DeliveryLog(
+                insight_id=insight_id,
+                channel_id=channel_id,
+                delivery_status=status,
+                delivery_method="telegram",
+            )
+            for channel_id, status in [("@mystocks", "success"), ("@other", "failed")]
+        ])
+
+        conn = sqlite3.connect(storage.db_path)
+        rows = conn.execute(
+            "SELECT channel_id, delivery_status FROM delivery_logs ORDER BY id"
+        ).fetchall()
+        conn.close()
+        assert rows == [("@mystocks", "success"), ("@other", "failed")]
+
 
 class TestErrorHandling:
     """Test error handling in storage operations (personal use)."""